@@ -8,9 +8,11 @@ from __future__ import print_function
 
 import argparse
 import os
+import sys
 
 from pxr import Sdf
 
+from moana2usd.converters.base_converter import ConversionError
 from moana2usd.converters.scene_converter import SceneConverter
 
 
@@ -40,9 +42,91 @@ if __name__ == '__main__':
         '--omit-small-instances',
         action='store_false',
         help='Omit instantiation of small (or numerous) instances.')
+    parser.add_argument(
+        '--payloads',
+        action='store_true',
+        help='Wrap the geometry of each asset in a payload.')
+    parser.add_argument(
+        '--element-payloads',
+        action='store_true',
+        help='Bring each Element into the scene as a payload.')
+    parser.add_argument(
+        '--proxy-resolution',
+        type=int,
+        default=0,
+        help='Add decimated proxies of heavy Meshes, clustering their vertices on a grid of the given resolution (0 to disable).')
+    parser.add_argument(
+        '--share-meshes',
+        action='store_true',
+        help='Write Meshes found in several assets once, to a prototype referenced by each of them.')
+    parser.add_argument(
+        '--tile-face-count',
+        type=int,
+        default=0,
+        help='Split Meshes with more faces than the given count into spatial tiles, unless they have Ptex textures (0 to disable).')
+    parser.add_argument(
+        '--cell-instance-count',
+        type=int,
+        default=0,
+        help='Split PointInstancers with more instances than the given count into spatial cells (0 to disable).')
+    parser.add_argument(
+        '--cell-payloads',
+        action='store_true',
+        help='Bring each cell of split PointInstancers in as a payload.')
+    parser.add_argument(
+        '--merge-instancers',
+        action='store_true',
+        help='Create a single PointInstancer for each instance JSON file, with one prototype per archive.')
+    parser.add_argument(
+        '--collapse-copies',
+        action='store_true',
+        help='Gather the instanced copies of each Element sharing the same content into a PointInstancer.')
+    parser.add_argument(
+        '--keep-fraction',
+        action='append',
+        default=[],
+        metavar='NAME=FRACTION',
+        help='Keep the given fraction of the instances of the named archive or sub-instance (or of all instances, for "*"). Can be repeated.')
+    parser.add_argument(
+        '--element-instance-budget',
+        type=int,
+        default=0,
+        help='Thin out the instances of each Element to at most about the given count (0 to disable).')
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Number of processes to use when translating assets and instances.')
+    parser.add_argument(
+        '--parser-jobs',
+        type=int,
+        default=1,
+        help='Number of processes to use when parsing each OBJ file.')
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Check previously converted content against the build manifest, without converting.')
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory where parsed source data is cached between runs.')
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=20 * 1024,
+        help='Maximum size of the cache directory, in megabytes.')
 
     args = parser.parse_args()
 
+    instanceKeepFractions = {}
+    for keepFraction in args.keep_fraction:
+        name, _, fraction = keepFraction.partition('=')
+        try:
+            instanceKeepFractions[name] = float(fraction)
+        except ValueError:
+            parser.error('Invalid keep fraction "{}", expected NAME=FRACTION.'.format(keepFraction))
+        if not 0.0 < instanceKeepFractions[name] <= 1.0:
+            parser.error('Invalid keep fraction "{}", expected a FRACTION in (0, 1].'.format(keepFraction))
+
 
     DESTINATION_DIRECTORY_PATH = os.path.abspath(args.dest_dir)
     SOURCE_DIRECTORY_PATH = os.path.abspath(args.source_dir)
@@ -56,5 +140,25 @@ if __name__ == '__main__':
         sourceDirectoryPath=SOURCE_DIRECTORY_PATH,
         destinationDirectoryPath=DESTINATION_DIRECTORY_PATH,
         loadTextures=args.load_textures,
-        omitSmallInstances=args.omit_small_instances)
-    moanaIslandConverter.convert()
+        omitSmallInstances=args.omit_small_instances,
+        jobs=args.jobs,
+        parserJobs=args.parser_jobs,
+        cacheDirectoryPath=os.path.abspath(args.cache_dir) if args.cache_dir else None,
+        cacheMaxSize=args.cache_size * 1024 * 1024,
+        usePayloads=args.payloads,
+        useElementPayloads=args.element_payloads,
+        proxyResolution=args.proxy_resolution,
+        maxMeshFaceCount=args.tile_face_count,
+        shareMeshes=args.share_meshes,
+        maxCellInstanceCount=args.cell_instance_count,
+        useCellPayloads=args.cell_payloads,
+        mergeInstancers=args.merge_instancers,
+        collapseInstancedCopies=args.collapse_copies,
+        instanceKeepFractions=instanceKeepFractions,
+        maxElementInstanceCount=args.element_instance_budget)
+    if args.verify:
+        sys.exit(1 if moanaIslandConverter.verify() else 0)
+    try:
+        moanaIslandConverter.convert()
+    except ConversionError as error:
+        sys.exit(str(error))
@@ -4,31 +4,68 @@
 Asset conversion from OBJ to USD.
 """
 
-import json
+from __future__ import print_function
+
+import collections
+import hashlib
+import multiprocessing
 import os
+import traceback
+
+import numpy
 
-from moana2usd.converters.base_converter import ContentConverter
-from moana2usd.obj_parser.obj_parser import getOBJStreamForFile, getDisplayColorForMaterial, getDisplayOpacityForMaterial
+from moana2usd.converters.base_converter import ContentConverter, ConversionError
+from moana2usd.converters.build_manifest import BuildManifest
+from moana2usd.dataset.material_database import getElementNameForOBJPath, getSharedMaterialDatabase
+from moana2usd.dataset.texture_index import TextureIndex
+from moana2usd.geometry.decimation import decimateByVertexClustering
+from moana2usd.geometry.tiling import splitIntoTiles
+from moana2usd.obj_parser.obj_parser import OBJGroupData, getCachedOBJStreamForFile, getOBJStreamForFile, iterOBJGroupsForFile
 
-from pxr import Gf, Kind, Sdf, Usd, UsdGeom, UsdHydra, UsdShade
+from pxr import Gf, Kind, Sdf, Tf, UsdGeom, UsdHydra, UsdShade, Vt
 from tqdm import tqdm
 
 
+# Minimum factor by which decimating a Mesh must reduce its number of face
+# vertices for a proxy to be authored:
+PROXY_MIN_REDUCTION = 2
+
+
 class AssetConverter(ContentConverter):
     """
     Converter for OBJ assets into USD assets.
     """
 
-    def __init__(self, fileFormat, sourceDirectoryPath, destinationDirectoryPath, loadTextures=True):
-        # type: (str, str, str, boolean) -> AssetConverter
+    def __init__(self, fileFormat, sourceDirectoryPath, destinationDirectoryPath, loadTextures=True, parserJobs=1, arrayCache=None, materialDatabase=None, jobs=1, buildManifest=None, catalog=None, usePayloads=False, proxyResolution=0, maxMeshFaceCount=0, textureIndex=None, shareMeshes=False):
+        # type: (str, str, str, boolean, int, moana2usd.dataset.array_cache.ArrayCache, moana2usd.dataset.material_database.MaterialDatabase, int, moana2usd.converters.build_manifest.BuildManifest, moana2usd.dataset.catalog.DatasetCatalog, boolean, int, int, moana2usd.dataset.texture_index.TextureIndex, boolean) -> AssetConverter
         """
         Initialize the converter using the provided USD file format, dataset
         source directory path and destination folder path.
+
+        With `shareMeshes`, Meshes found more than once in the dataset are
+        written once to a prototype layer referenced by each of their assets.
         """
-        super(AssetConverter, self).__init__(fileFormat, sourceDirectoryPath, destinationDirectoryPath)
+        super(AssetConverter, self).__init__(fileFormat, sourceDirectoryPath, destinationDirectoryPath, catalog)
 
         self._loadTextures = loadTextures
+        self._parserJobs = parserJobs
+        self._arrayCache = arrayCache
+        self._materialDatabase = materialDatabase or getSharedMaterialDatabase(sourceDirectoryPath)
+        self._jobs = jobs
+        self._usePayloads = usePayloads
+        self._proxyResolution = proxyResolution
+        self._maxMeshFaceCount = maxMeshFaceCount
+        self._shareMeshes = shareMeshes
+        self._textureIndex = textureIndex or TextureIndex(sourceDirectoryPath, catalog=self.Catalog)
+        self._buildManifest = buildManifest or BuildManifest(destinationDirectoryPath, sourceDirectoryPath)
         self._geometryPrimName = 'geometry'
+        self._materialsPrimName = 'materials'
+        self._proxyPrimName = 'proxy'
+        self._prototypesDirectoryName = 'prototypes'
+        # Hashes of the Meshes of each OBJ file, and of the Meshes shared by
+        # several of them:
+        self._assetGroupHashes = {}
+        self._sharedPrototypeHashes = set()
 
     def convert(self):
         # type: () -> None
@@ -45,15 +82,111 @@ class AssetConverter(ContentConverter):
         assetOBJFileName = os.path.basename(assetOBJPath)
         return os.path.splitext(assetOBJFileName)[0]
 
+    def _getAssetDirectoryPath(self, assetOBJPath):
+        # type: (str) -> str
+        """
+        Return the directory of the USD Stages for the given asset's OBJ file
+        path.
+
+        Assets are grouped by Element, as several Elements of the dataset have
+        OBJ files with the same name.
+        """
+        return os.path.join(
+            self.PrimitivesDirectory,
+            getElementNameForOBJPath(assetOBJPath, self.SourceDirectoryPath))
+
     def _getAssetsStagePath(self, assetOBJPath):
         # type: (str) -> str
         """
         Return the USD Stage file path for the given asset's OBJ file path.
         """
         return os.path.join(
-            self.PrimitivesDirectory,
+            self._getAssetDirectoryPath(assetOBJPath),
             self._getAssetElementName(assetOBJPath) + self.USDFileExtension)
 
+    def _getAssetPayloadStagePath(self, assetOBJPath):
+        # type: (str) -> str
+        """
+        Return the USD Stage file path of the geometry payload for the given
+        asset's OBJ file path.
+        """
+        return os.path.join(
+            self._getAssetDirectoryPath(assetOBJPath),
+            '_payload_' + self._getAssetElementName(assetOBJPath) + self.USDFileExtension)
+
+    def _getAssetOutputFilePaths(self, assetOBJPath):
+        # type: (str) -> List[str]
+        """
+        Return the paths of the USD Stages written for the given asset's OBJ
+        file path.
+        """
+        outputFilePaths = [self._getAssetsStagePath(assetOBJPath)]
+        if self._usePayloads:
+            outputFilePaths.append(self._getAssetPayloadStagePath(assetOBJPath))
+        return outputFilePaths
+
+    def _getAssetInputFilePaths(self, assetOBJPath):
+        # type: (str) -> List[str]
+        """
+        Return the paths of the dataset files the USD asset for the given OBJ
+        file is built from.
+        """
+        elementName = getElementNameForOBJPath(assetOBJPath, self.SourceDirectoryPath)
+        return [
+            assetOBJPath,
+            self._materialDatabase.GetMaterialFilePath(elementName)
+        ]
+
+    def _getBuildOptions(self):
+        # type: () -> dict
+        """
+        Return the options affecting the content of the USD assets.
+        """
+        return {
+            'format': self._fileFormat,
+            'loadTextures': self._loadTextures,
+            'payloads': self._usePayloads,
+            'proxyResolution': self._proxyResolution,
+            'maxMeshFaceCount': self._maxMeshFaceCount,
+            'shareMeshes': self._shareMeshes
+        }
+
+    def _getPrototypeBuildOptions(self):
+        # type: () -> dict
+        """
+        Return the options affecting the content of the Mesh prototypes, which
+        are otherwise identified by the hash of their content.
+        """
+        return {
+            'format': self._fileFormat
+        }
+
+    def _recordAsset(self, assetOBJPath):
+        # type: (str) -> None
+        """
+        Record the USD asset built for the given OBJ file in the build
+        manifest.
+        """
+        metadata = None
+        if self._shareMeshes:
+            metadata = {
+                'groupHashes': self._assetGroupHashes.get(assetOBJPath, []),
+                'prototypeHashes': self._getAssetPrototypeHashes(assetOBJPath)
+            }
+        for outputFilePath in self._getAssetOutputFilePaths(assetOBJPath):
+            if os.path.exists(outputFilePath):
+                self._buildManifest.Record(outputFilePath, self._getAssetInputFilePaths(assetOBJPath), self._getBuildOptions(), metadata)
+
+    def _isAssetUpToDate(self, assetOBJPath):
+        # type: (str) -> boolean
+        """
+        Check if the USD asset of the given OBJ file was built from its current
+        content, according to the build manifest.
+        """
+        return all(
+            self._buildManifest.IsUpToDate(outputFilePath, self._getAssetInputFilePaths(assetOBJPath), self._getBuildOptions())
+            for outputFilePath in self._getAssetOutputFilePaths(assetOBJPath))
+
     def _getMeshPath(self, rootPath, groupName):
         # type: (str, str) -> str
         """
@@ -64,13 +197,35 @@ class AssetConverter(ContentConverter):
             geometryPrimName=self._geometryPrimName,
             groupName=groupName)
 
+    def _getProxyPath(self, rootPath, groupName):
+        # type: (str, str) -> str
+        """
+        Return the path of the proxy USD Mesh for the given OBJ group.
+        """
+        return '{rootPath}/{proxyPrimName}/{groupName}'.format(
+            rootPath=rootPath,
+            proxyPrimName=self._proxyPrimName,
+            groupName=groupName)
+
+    def _getTileName(self, tileCoordinates):
+        # type: (Tuple[int, int, int]) -> str
+        """
+        Return the name of the USD Mesh for the tile at the given grid
+        coordinates.
+        """
+        return 'tile_{x}_{y}_{z}'.format(
+            x=tileCoordinates[0],
+            y=tileCoordinates[1],
+            z=tileCoordinates[2])
+
     def _getMaterialPath(self, rootPath, materialName):
         # type: (str, str) -> str
         """
         Return the path of the USD Prim for the given material.
         """
-        return '{rootPath}/materials/{materialName}'.format(
+        return '{rootPath}/{materialsPrimName}/{materialName}'.format(
             rootPath=rootPath,
+            materialsPrimName=self._materialsPrimName,
             materialName=materialName)
 
     def _getShaderPath(self, materialPath):
@@ -81,15 +236,525 @@ class AssetConverter(ContentConverter):
         return '{materialPath}/previewSurfaceShader'.format(
             materialPath=materialPath)
 
-    def _convertOBJToUSD(self, assetOBJPath, objStream):
-        # type: (str, moana2usd.obj_parser.OBJStream) -> None
+    def _getMaterialPrimNames(self, elementName):
+        # type: (str) -> Dict[str, str]
+        """
+        Return the names of the USD Prims of the materials of the given
+        Element, indexed by material name.
+
+        Material names only differing by characters which are not valid in
+        Prim names are told apart by a "_1", "_2", ... suffix.
+        """
+        materialPrimNames = {}
+        usedPrimNames = set()
+        for materialName in sorted(self._materialDatabase.GetMaterials(elementName).keys()):
+            materialPrimName = self._getMaterialPrimName(materialName, usedPrimNames)
+            materialPrimNames[materialName] = materialPrimName
+            usedPrimNames.add(materialPrimName)
+        return materialPrimNames
+
+    def _getMaterialPrimName(self, materialName, usedPrimNames):
+        # type: (str, Set[str]) -> str
+        """
+        Return the name of the USD Prim for the given material name, suffixed
+        so that it differs from the given Prim names.
+        """
+        primName = Tf.MakeValidIdentifier(materialName or 'default')
+        suffix = 0
+        uniquePrimName = primName
+        while uniquePrimName in usedPrimNames:
+            suffix += 1
+            uniquePrimName = '{}_{}'.format(primName, suffix)
+        return uniquePrimName
+
+    def _getMaterialLibraryStagePath(self, elementName):
+        # type: (str) -> str
+        """
+        Return the USD Stage file path of the material library of the given
+        Element, stored along with the USD assets of the Element.
+        """
+        return os.path.join(
+            self.PrimitivesDirectory,
+            elementName,
+            '_materials_' + elementName + self.USDFileExtension)
+
+    def _getMaterialLibraryReference(self, elementName):
+        # type: (str) -> str
+        """
+        Return the asset path of the material library of the given Element,
+        relative to the USD assets of the Element.
+        """
+        return './' + os.path.basename(self._getMaterialLibraryStagePath(elementName))
+
+    def _getColorMapFilePath(self, elementName, groupName, materialRecord):
+        # type: (str, str, moana2usd.dataset.material_database.MaterialRecord) -> str or None
+        """
+        Return the path of the color map of the given OBJ group, if textures
+        are loaded and the group has one.
+        """
+        if not self._loadTextures:
+            return None
+        return self._textureIndex.GetColorMapFilePath(
+            elementName,
+            groupName,
+            materialRecord.colorMap if materialRecord is not None else None)
+
+    def _createShaderInputSpec(self, shaderPrimSpec, inputName, typeName, value=None):
+        # type: (pxr.Sdf.PrimSpec, str, pxr.Sdf.ValueTypeName, object) -> pxr.Sdf.AttributeSpec
+        """
+        Author the given input of a USD Shader, set to the given value (if
+        any).
+        """
+        inputSpec = shaderPrimSpec.attributes.get('inputs:' + inputName)
+        if inputSpec is None:
+            inputSpec = Sdf.AttributeSpec(
+                shaderPrimSpec,
+                'inputs:' + inputName,
+                typeName)
+        if value is not None:
+            inputSpec.default = value
+        return inputSpec
+
+    def _createShaderSpec(self, layer, shaderPath, shaderId):
+        # type: (pxr.Sdf.Layer, str, str) -> pxr.Sdf.PrimSpec
+        """
+        Author a USD Shader with the given identifier.
+        """
+        shaderPrimSpec = Sdf.CreatePrimInLayer(layer, shaderPath)
+        shaderPrimSpec.specifier = Sdf.SpecifierDef
+        shaderPrimSpec.typeName = 'Shader'
+
+        idAttribute = Sdf.AttributeSpec(
+            shaderPrimSpec,
+            UsdShade.Tokens.infoId,
+            Sdf.ValueTypeNames.Token,
+            variability=Sdf.VariabilityUniform)
+        idAttribute.default = shaderId
+        return shaderPrimSpec
+
+    def _authorMaterial(self, layer, materialPath, elementName, materialRecord, colorMapFilePath=None):
+        # type: (pxr.Sdf.Layer, str, str, moana2usd.dataset.material_database.MaterialRecord, str) -> None
+        """
+        Author a USD Material with a PreviewSurface Shader for the given
+        material record, textured using the given color map (if any).
+
+        Materials are authored as Sdf specs, so that they can be batched in
+        the same change block as the rest of the layer.
+        """
+        materialPrimSpec = Sdf.CreatePrimInLayer(layer, materialPath)
+        materialPrimSpec.specifier = Sdf.SpecifierDef
+        materialPrimSpec.typeName = 'Material'
+
+        previewSurfaceShaderPath = self._getShaderPath(materialPath)
+        previewSurfaceShaderSpec = self._createShaderSpec(layer, previewSurfaceShaderPath, 'UsdPreviewSurface')
+
+        if materialRecord is not None:
+            if materialRecord.displayColor is not None:
+                self._createShaderInputSpec(previewSurfaceShaderSpec, 'diffuseColor', Sdf.ValueTypeNames.Color3f, Gf.Vec3f(*materialRecord.displayColor))
+
+                if elementName == 'osOcean':
+                    self._createShaderInputSpec(previewSurfaceShaderSpec, 'opacity', Sdf.ValueTypeNames.Float, 0.2)
+                elif materialRecord.opacity is not None:
+                    self._createShaderInputSpec(previewSurfaceShaderSpec, 'opacity', Sdf.ValueTypeNames.Float, materialRecord.opacity)
+            else:
+                baseColor = [1.0, 1.0, 1.0]
+                self._createShaderInputSpec(previewSurfaceShaderSpec, 'diffuseColor', Sdf.ValueTypeNames.Color3f, Gf.Vec3f(*baseColor[:3]))
+
+            if materialRecord.roughness is not None:
+                self._createShaderInputSpec(previewSurfaceShaderSpec, 'roughness', Sdf.ValueTypeNames.Float, materialRecord.roughness)
+
+            if materialRecord.metallic is not None:
+                self._createShaderInputSpec(previewSurfaceShaderSpec, 'metallic', Sdf.ValueTypeNames.Float, materialRecord.metallic)
+
+            if materialRecord.clearcoat is not None:
+                self._createShaderInputSpec(previewSurfaceShaderSpec, 'clearcoat', Sdf.ValueTypeNames.Float, materialRecord.clearcoat)
+
+            if materialRecord.ior is not None:
+                self._createShaderInputSpec(previewSurfaceShaderSpec, 'ior', Sdf.ValueTypeNames.Float, materialRecord.ior)
+
+            if materialRecord.clearcoatRoughness is not None:
+                self._createShaderInputSpec(previewSurfaceShaderSpec, 'clearcoatRoughness', Sdf.ValueTypeNames.Float, materialRecord.clearcoatRoughness)
+
+            if colorMapFilePath is not None:
+                colorMapShaderPath = materialPath + '/colorMap'
+                colorMapShaderSpec = self._createShaderSpec(layer, colorMapShaderPath, UsdHydra.Tokens.HwPtexTexture_1)
+                self._createShaderInputSpec(colorMapShaderSpec, 'file', Sdf.ValueTypeNames.Asset, Sdf.AssetPath(colorMapFilePath.replace('\\', '/')))
+                Sdf.AttributeSpec(
+                    colorMapShaderSpec,
+                    'outputs:rgb',
+                    Sdf.ValueTypeNames.Color3f)
+
+                diffuseColorInputSpec = self._createShaderInputSpec(previewSurfaceShaderSpec, 'diffuseColor', Sdf.ValueTypeNames.Color3f)
+                diffuseColorInputSpec.connectionPathList.explicitItems.append(colorMapShaderPath + '.outputs:rgb')
+
+            # TODO: This needs to be changed: Need to map a single-channel
+            # "displacement" to a 3-channel "rgb" output?
+
+        # Connect the output of the PreviewSurface Shader to the material:
+        Sdf.AttributeSpec(
+            previewSurfaceShaderSpec,
+            'outputs:surface',
+            Sdf.ValueTypeNames.Token)
+        surfaceOutputSpec = Sdf.AttributeSpec(
+            materialPrimSpec,
+            'outputs:surface',
+            Sdf.ValueTypeNames.Token)
+        surfaceOutputSpec.connectionPathList.explicitItems.append(previewSurfaceShaderPath + '.outputs:surface')
+
+    def _createMaterialLibrary(self, elementName):
+        # type: (str) -> None
+        """
+        Author the material library of the given Element, defining each of
+        the materials of its "materials.json" file once so that the USD assets
+        of the Element can share them.
+        """
+        layer = Sdf.Layer.CreateAnonymous(self.USDFileExtension)
+        materialsPrimSpec = Sdf.CreatePrimInLayer(layer, '/' + self._materialsPrimName)
+        materialsPrimSpec.specifier = Sdf.SpecifierDef
+        layer.defaultPrim = self._materialsPrimName
+
+        materials = self._materialDatabase.GetMaterials(elementName)
+        materialPrimNames = self._getMaterialPrimNames(elementName)
+        with Sdf.ChangeBlock():
+            for materialName in sorted(materials.keys()):
+                materialPath = self._getMaterialPath('', materialPrimNames[materialName])
+                self._authorMaterial(layer, materialPath, elementName, materials[materialName])
+
+        layer.Export(self._getMaterialLibraryStagePath(elementName), comment='')
+
+    def _createMaterialLibraries(self, assetOBJPaths):
+        # type: (List[str]) -> None
+        """
+        Author the material libraries of the Elements of the given OBJ files,
+        unless they are up-to-date.
+        """
+        elementNames = set(
+            getElementNameForOBJPath(assetOBJPath, self.SourceDirectoryPath)
+            for assetOBJPath in assetOBJPaths)
+        for elementName in sorted(elementNames):
+            materialLibraryStagePath = self._getMaterialLibraryStagePath(elementName)
+            inputFilePaths = [self._materialDatabase.GetMaterialFilePath(elementName)]
+            if not self._buildManifest.IsUpToDate(materialLibraryStagePath, inputFilePaths, self._getBuildOptions()):
+                self._createMaterialLibrary(elementName)
+                self._buildManifest.Record(materialLibraryStagePath, inputFilePaths, self._getBuildOptions())
+
+    def _createDisplayPrimvarSpecs(self, meshPrimSpec, materialRecord):
+        # type: (pxr.Sdf.PrimSpec, moana2usd.dataset.material_database.MaterialRecord) -> None
+        """
+        Author the display color and opacity of the given Mesh from the given
+        material record.
+        """
+        # Add display color:
+        if materialRecord is not None and materialRecord.displayColor:
+            displayColorAttribute = Sdf.AttributeSpec(
+                meshPrimSpec,
+                UsdGeom.Tokens.primvarsDisplayColor,
+                Sdf.ValueTypeNames.Color3fArray)
+            displayColorAttribute.default = [Gf.Vec3f(*materialRecord.displayColor)]
+
+        # Add display opacity:
+        if materialRecord is not None and materialRecord.opacity:
+            displayOpacityAttribute = Sdf.AttributeSpec(
+                meshPrimSpec,
+                UsdGeom.Tokens.primvarsDisplayOpacity,
+                Sdf.ValueTypeNames.FloatArray)
+            displayOpacityAttribute.default = [materialRecord.opacity]
+
+    def _createSubdivisionSchemeSpec(self, meshPrimSpec, subdivisionScheme):
+        # type: (pxr.Sdf.PrimSpec, str) -> None
+        """
+        Author the subdivision scheme of the given Mesh.
+        """
+        subdivisionSchemeAttribute = Sdf.AttributeSpec(
+            meshPrimSpec,
+            UsdGeom.Tokens.subdivisionScheme,
+            Sdf.ValueTypeNames.Token,
+            variability=Sdf.VariabilityUniform)
+        subdivisionSchemeAttribute.default = subdivisionScheme
+
+    def _createMeshGeometrySpecs(self, meshPrimSpec, group, extent, subdivisionScheme=UsdGeom.Tokens.catmullClark):
+        # type: (pxr.Sdf.PrimSpec, moana2usd.obj_parser.OBJGroupData, numpy.ndarray, str) -> None
+        """
+        Author the topology, points and extent of the given OBJ group on the
+        given Mesh.
+        """
+        self._createSubdivisionSchemeSpec(meshPrimSpec, subdivisionScheme)
+
+        faceVertexCountsAttribute = Sdf.AttributeSpec(
+            meshPrimSpec,
+            UsdGeom.Tokens.faceVertexCounts,
+            Sdf.ValueTypeNames.IntArray)
+        faceVertexCountsAttribute.default = Vt.IntArray.FromNumpy(group.faceVertexCounts)
+
+        faceVertexIndicesAttribute = Sdf.AttributeSpec(
+            meshPrimSpec,
+            UsdGeom.Tokens.faceVertexIndices,
+            Sdf.ValueTypeNames.IntArray)
+        faceVertexIndicesAttribute.default = Vt.IntArray.FromNumpy(group.faceVertexIndices)
+
+        pointsAttribute = Sdf.AttributeSpec(
+            meshPrimSpec,
+            UsdGeom.Tokens.points,
+            Sdf.ValueTypeNames.Point3fArray)
+        pointsAttribute.default = Vt.Vec3fArray.FromNumpy(group.points)
+
+        extentAttribute = Sdf.AttributeSpec(
+            meshPrimSpec,
+            UsdGeom.Tokens.extent,
+            Sdf.ValueTypeNames.Float3Array)
+        extentAttribute.default = Vt.Vec3fArray.FromNumpy(extent)
+
+    def _createMeshSpec(self, meshPrimSpec, group, materialRecord, extent=None, subdivisionScheme=UsdGeom.Tokens.catmullClark):
+        # type: (pxr.Sdf.PrimSpec, moana2usd.obj_parser.OBJGroupData, moana2usd.dataset.material_database.MaterialRecord, numpy.ndarray, str) -> None
+        """
+        Define the given Prim as a Mesh with the topology and points of the
+        given OBJ group, and the display color and opacity of the given
+        material record.
+
+        Meshes found more than once in the dataset reference the prototype
+        they share instead of holding their own copy of the geometry.
+        """
+        if extent is None:
+            extent = numpy.array([group.points.min(axis=0), group.points.max(axis=0)])
+
+        meshPrimSpec.specifier = Sdf.SpecifierDef
+        meshPrimSpec.typeName = 'Mesh'
+
+        prototypeHash = self._getPrototypeHash(group) if self._sharedPrototypeHashes else None
+        if prototypeHash in self._sharedPrototypeHashes:
+            self._createPrototype(prototypeHash, group, extent)
+            meshPrimSpec.referenceList.Prepend( Sdf.Reference(self._getPrototypeReference(prototypeHash)) )
+            if subdivisionScheme != UsdGeom.Tokens.catmullClark:
+                self._createSubdivisionSchemeSpec(meshPrimSpec, subdivisionScheme)
+        else:
+            self._createMeshGeometrySpecs(meshPrimSpec, group, extent, subdivisionScheme)
+        self._createDisplayPrimvarSpecs(meshPrimSpec, materialRecord)
+
+    def _createPurposeSpec(self, primSpec, purpose):
+        # type: (pxr.Sdf.PrimSpec, str) -> None
+        """
+        Author the purpose of the given Prim.
+        """
+        purposeAttribute = Sdf.AttributeSpec(
+            primSpec,
+            UsdGeom.Tokens.purpose,
+            Sdf.ValueTypeNames.Token,
+            variability=Sdf.VariabilityUniform)
+        purposeAttribute.default = purpose
+
+    def _getProxyGroup(self, group):
+        # type: (moana2usd.obj_parser.OBJGroupData) -> moana2usd.obj_parser.OBJGroupData or None
+        """
+        Return a decimated version of the given OBJ group to use as its proxy,
+        if proxies are enabled and decimating the group is worth it.
+        """
+        if self._proxyResolution <= 0:
+            return None
+        faceVertexCounts, faceVertexIndices, points = decimateByVertexClustering(
+            group.faceVertexCounts,
+            group.faceVertexIndices,
+            group.points,
+            self._proxyResolution)
+        if len(faceVertexCounts) == 0 or len(faceVertexIndices) * PROXY_MIN_REDUCTION > len(group.faceVertexIndices):
+            return None
+        return OBJGroupData(group.name, group.materialName, faceVertexCounts, faceVertexIndices, points)
+
+    def _getPrototypeHash(self, group):
+        # type: (moana2usd.obj_parser.OBJGroupData) -> str
+        """
+        Return the hash of the topology and points of the given OBJ group.
+        """
+        prototypeHash = hashlib.sha1()
+        prototypeHash.update(numpy.ascontiguousarray(group.faceVertexCounts, dtype=numpy.int32).tobytes())
+        prototypeHash.update(b'/')
+        prototypeHash.update(numpy.ascontiguousarray(group.faceVertexIndices, dtype=numpy.int32).tobytes())
+        prototypeHash.update(b'/')
+        prototypeHash.update(numpy.ascontiguousarray(group.points, dtype=numpy.float32).tobytes())
+        return prototypeHash.hexdigest()
+
+    def _getPrototypeStagePath(self, prototypeHash):
+        # type: (str) -> str
+        """
+        Return the USD Stage file path of the Mesh prototype with the given
+        hash.
+        """
+        return os.path.join(
+            self.PrimitivesDirectory,
+            self._prototypesDirectoryName,
+            prototypeHash + self.USDFileExtension)
+
+    def _getPrototypeReference(self, prototypeHash):
+        # type: (str) -> str
+        """
+        Return the asset path of the Mesh prototype with the given hash,
+        relative to the USD assets.
         """
-        Convert the given OBJ stream into a USD asset.
+        return '../{prototypesDirectoryName}/{prototypeHash}{extension}'.format(
+            prototypesDirectoryName=self._prototypesDirectoryName,
+            prototypeHash=prototypeHash,
+            extension=self.USDFileExtension)
+
+    def _createPrototype(self, prototypeHash, group, extent):
+        # type: (str, moana2usd.obj_parser.OBJGroupData, numpy.ndarray) -> None
+        """
+        Author the Mesh prototype with the given hash from the topology and
+        points of the given OBJ group and their extent, unless it was already
+        written (outdated prototypes being removed before assets are
+        translated).
+
+        Prototypes are content-addressed, so that identical Meshes of any
+        asset share a single layer. Each prototype is written to a temporary
+        file then renamed, so that worker processes translating assets in
+        parallel never read a partially-written prototype.
+        """
+        prototypeStagePath = self._getPrototypeStagePath(prototypeHash)
+        if os.path.exists(prototypeStagePath):
+            return
+
+        layer = Sdf.Layer.CreateAnonymous(self.USDFileExtension)
+        with Sdf.ChangeBlock():
+            meshPrimSpec = Sdf.CreatePrimInLayer(layer, '/mesh')
+            meshPrimSpec.specifier = Sdf.SpecifierDef
+            meshPrimSpec.typeName = 'Mesh'
+            layer.defaultPrim = 'mesh'
+            self._createMeshGeometrySpecs(meshPrimSpec, group, extent)
+
+        prototypesDirectoryPath = os.path.dirname(prototypeStagePath)
+        if not os.path.isdir(prototypesDirectoryPath):
+            try:
+                os.makedirs(prototypesDirectoryPath)
+            except OSError:
+                # The directory may have been created by another process:
+                if not os.path.isdir(prototypesDirectoryPath):
+                    raise
+
+        temporaryStagePath = os.path.join(
+            prototypesDirectoryPath,
+            '{prototypeHash}.{pid}{extension}'.format(
+                prototypeHash=prototypeHash,
+                pid=os.getpid(),
+                extension=self.USDFileExtension))
+        layer.Export(temporaryStagePath, comment='')
+        if os.path.exists(prototypeStagePath):
+            os.remove(temporaryStagePath)
+        else:
+            os.rename(temporaryStagePath, prototypeStagePath)
+
+    def _getAssetPrototypeHashes(self, assetOBJPath):
+        # type: (str) -> List[str]
+        """
+        Return the sorted hashes of the Mesh prototypes referenced by the USD
+        asset of the given OBJ file.
+        """
+        return sorted(set(self._assetGroupHashes.get(assetOBJPath, [])) & self._sharedPrototypeHashes)
+
+    def _getGroupHashes(self, assetOBJPath):
+        # type: (str) -> List[str]
+        """
+        Return the hashes of the Meshes of the given OBJ file which may be
+        shared with other assets.
+        """
+        elementName = getElementNameForOBJPath(assetOBJPath, self.SourceDirectoryPath)
+        return [
+            self._getPrototypeHash(group)
+            for group in self._iterOBJGroups(assetOBJPath)
+            if len(group.faceVertexCounts) > 0 and not self._isTiled(elementName, group)
+        ]
+
+    def _findSharedPrototypes(self, assetOBJPaths, upToDateAssetOBJPaths):
+        # type: (List[str], Set[str]) -> Set[str]
+        """
+        Return the hashes of the Meshes found more than once among the given
+        OBJ files.
+
+        The hashes of the Meshes of up-to-date assets are read from the build
+        manifest, so that only the OBJ files to translate again are hashed.
+        """
+        assetOBJPathsToHash = []
+        for assetOBJPath in assetOBJPaths:
+            metadata = self._buildManifest.GetMetadata(self._getAssetsStagePath(assetOBJPath)) or {}
+            if assetOBJPath in upToDateAssetOBJPaths and 'groupHashes' in metadata:
+                self._assetGroupHashes[assetOBJPath] = metadata.get('groupHashes')
+            else:
+                assetOBJPathsToHash.append(assetOBJPath)
+
+        with tqdm(total=len(assetOBJPathsToHash), desc='Hashing meshes', ncols=self.ProgressBarWidth) as progressBar:
+            if self._jobs > 1 and len(assetOBJPathsToHash) > 1:
+                pool = multiprocessing.Pool(
+                    processes=min(self._jobs, len(assetOBJPathsToHash)),
+                    initializer=_initializeAssetTranslationWorker,
+                    initargs=(self,))
+                try:
+                    for assetOBJPath, groupHashes in pool.imap_unordered(_hashAssetInWorker, assetOBJPathsToHash, chunksize=1):
+                        self._assetGroupHashes[assetOBJPath] = groupHashes
+                        progressBar.update()
+                finally:
+                    pool.close()
+                    pool.join()
+            else:
+                for assetOBJPath in assetOBJPathsToHash:
+                    self._assetGroupHashes[assetOBJPath] = self._getGroupHashes(assetOBJPath)
+                    progressBar.update()
+
+        hashCounts = collections.Counter(
+            groupHash
+            for assetOBJPath in assetOBJPaths
+            for groupHash in self._assetGroupHashes.get(assetOBJPath, []))
+        return set(groupHash for groupHash, count in hashCounts.items() if count > 1)
+
+    def _removeOutdatedPrototypes(self):
+        # type: () -> Set[str]
+        """
+        Remove the shared Mesh prototypes which were not built by the current
+        converter, with the current options, and return their hashes.
+        """
+        outdatedPrototypeHashes = set()
+        for prototypeHash in sorted(self._sharedPrototypeHashes):
+            prototypeStagePath = self._getPrototypeStagePath(prototypeHash)
+            if not self._buildManifest.IsUpToDate(prototypeStagePath, [], self._getPrototypeBuildOptions()):
+                if os.path.exists(prototypeStagePath):
+                    os.remove(prototypeStagePath)
+                outdatedPrototypeHashes.add(prototypeHash)
+        return outdatedPrototypeHashes
+
+    def _recordPrototypes(self, prototypeHashes):
+        # type: (Iterable[str]) -> None
+        """
+        Record the given Mesh prototypes in the build manifest.
+        """
+        for prototypeHash in prototypeHashes:
+            prototypeStagePath = self._getPrototypeStagePath(prototypeHash)
+            if os.path.exists(prototypeStagePath):
+                self._buildManifest.Record(prototypeStagePath, [], self._getPrototypeBuildOptions())
+
+    def _isTiled(self, elementName, group):
+        # type: (str, moana2usd.obj_parser.OBJGroupData) -> boolean
+        """
+        Check if the given OBJ group of the given Element has too many faces to
+        be authored as a single Mesh.
+
+        Groups with a Ptex color map are never split, as Ptex textures are
+        looked up by face index, which tiles do not preserve.
+        """
+        if self._maxMeshFaceCount <= 0 or len(group.faceVertexCounts) <= self._maxMeshFaceCount:
+            return False
+        materialRecord = self._materialDatabase.GetMaterial(elementName, group.materialName)
+        return self._getColorMapFilePath(elementName, group.name, materialRecord) is None
+
+    def _convertOBJToUSD(self, assetOBJPath, objGroups):
+        # type: (str, Iterable[moana2usd.obj_parser.OBJGroupData]) -> None
+        """
+        Convert the given OBJ Groups into a USD asset.
+
+        When payloads are used, the Meshes are authored in a separate layer
+        brought in as a payload of the model root, so that the asset can be
+        composed without loading its geometry. In all cases, the model root
+        carries an `extentsHint` covering all of its Meshes.
         """
         layer = Sdf.Layer.CreateAnonymous(self.USDFileExtension)
 
         ## ##
-        elementName = os.path.relpath(assetOBJPath, self.SourceDirectoryPath).split('\\')[1]
+        elementName = getElementNameForOBJPath(assetOBJPath, self.SourceDirectoryPath)
         rootPath = '/' + elementName
         modelRootPrimSpec = Sdf.CreatePrimInLayer(layer, rootPath)
         modelRootPrimSpec.specifier = Sdf.SpecifierDef
@@ -98,8 +763,26 @@ class AssetConverter(ContentConverter):
         layer.defaultPrim = elementName
         ## ##
 
-        usdPoints = objStream.GetVerts()
-        objPoints = objStream.GetPoints()
+        geometryLayer = layer
+        if self._usePayloads:
+            geometryLayer = Sdf.Layer.CreateAnonymous(self.USDFileExtension)
+            geometryRootPrimSpec = Sdf.CreatePrimInLayer(geometryLayer, rootPath)
+            geometryRootPrimSpec.specifier = Sdf.SpecifierDef
+            geometryRootPrimSpec.typeName = 'Xform'
+            geometryLayer.defaultPrim = elementName
+
+        # Bounds of the Meshes authored in the layer:
+        extentMin = None
+        extentMax = None
+
+        # (Group name, Material name) of the Meshes authored in the layer:
+        meshGroups = []
+        # (Material record, Color map file path) of the Materials to author in
+        # the layer, indexed by path:
+        localMaterials = collections.OrderedDict()
+        usesMaterialLibrary = False
+        libraryMaterialPrimNames = self._getMaterialPrimNames(elementName)
+        libraryMaterialNames = set(libraryMaterialPrimNames.values())
 
 
         # Leverage the SDF API instead of the USD API in order to batch-create
@@ -108,208 +791,138 @@ class AssetConverter(ContentConverter):
         # Prims -- which is the case here (sometimes upwards of a million Prims).
         with Sdf.ChangeBlock():
             meshGeoSpecPath = rootPath + '/' + self._geometryPrimName
-            meshGeoSpec = Sdf.CreatePrimInLayer(layer, meshGeoSpecPath)
+            meshGeoSpec = Sdf.CreatePrimInLayer(geometryLayer, meshGeoSpecPath)
             meshGeoSpec.specifier = Sdf.SpecifierDef
 
-            for group in objStream.GetGroups():
-                if not group.faces:
+            # Groups are consumed one at a time, so that the content of each
+            # Group can be released once its Mesh has been authored:
+            for group in objGroups:
+                if len(group.faceVertexCounts) == 0:
                     continue
+                meshGroups.append((group.name, group.materialName))
 
-                groupVertexBuffer = []
-                objectToGroupVertexBufferMap = {}
-                groupVertexIndices = []
-
-                faceVertexCounts = []
-                faceVertexIndices = []
-                for face in group.faces:
-                    faceVertexCounts.append(face.size())
-                    for pointIndex in xrange(face.pointsBegin, face.pointsEnd):
-                        objPoint = objPoints[pointIndex]
-
-                        # Vertices:
-                        vertexIndex = objPoint.vertIndex
-                        faceVertexIndices.append(vertexIndex)
-                        smallBufferIndex = objectToGroupVertexBufferMap.get(vertexIndex)
-                        if smallBufferIndex is None:
-                            smallBufferIndex = len(groupVertexBuffer)
-                            objectToGroupVertexBufferMap.update({ vertexIndex: smallBufferIndex })
-                            groupVertexBuffer.append(usdPoints[vertexIndex])
-                        groupVertexIndices.append(smallBufferIndex)
-
-
-                materialName = objStream.GetMaterialForGroup(group.name)
-                baseColor = getDisplayColorForMaterial(assetOBJPath, materialName, self.SourceDirectoryPath)
-                alpha = getDisplayOpacityForMaterial(assetOBJPath, materialName, self.SourceDirectoryPath)
-
-                groupExtent = Gf.Range3f()
-                for groupVertex in groupVertexBuffer:
-                    groupExtent.UnionWith(groupVertex)
+                materialRecord = self._materialDatabase.GetMaterial(elementName, group.materialName)
 
+                groupExtent = numpy.array([group.points.min(axis=0), group.points.max(axis=0)])
+                if extentMin is None:
+                    extentMin, extentMax = groupExtent
+                else:
+                    extentMin = numpy.minimum(extentMin, groupExtent[0])
+                    extentMax = numpy.maximum(extentMax, groupExtent[1])
 
                 meshPrimSpecPath = self._getMeshPath(rootPath, group.name)
-                meshPrimSpec = Sdf.CreatePrimInLayer(layer, meshPrimSpecPath)
-                meshPrimSpec.specifier = Sdf.SpecifierDef
-                meshPrimSpec.typeName = 'Mesh'
-                meshPrimSpec.instanceable = True
-
-                # Add geometry information:
-                subdivisionSchemeAttribute = Sdf.AttributeSpec(
-                    meshPrimSpec,
-                    UsdGeom.Tokens.subdivisionScheme,
-                    Sdf.ValueTypeNames.Token,
-                    variability=Sdf.VariabilityUniform)
-                subdivisionSchemeAttribute.default = UsdGeom.Tokens.catmullClark
-
-                faceVertexCountsAttribute = Sdf.AttributeSpec(
-                    meshPrimSpec,
-                    UsdGeom.Tokens.faceVertexCounts,
-                    Sdf.ValueTypeNames.IntArray)
-                faceVertexCountsAttribute.default = faceVertexCounts
-
-                faceVertexIndicesAttribute = Sdf.AttributeSpec(
-                    meshPrimSpec,
-                    UsdGeom.Tokens.faceVertexIndices,
-                    Sdf.ValueTypeNames.IntArray)
-                faceVertexIndicesAttribute.default = groupVertexIndices
-
-                pointsAttribute = Sdf.AttributeSpec(
-                    meshPrimSpec,
-                    UsdGeom.Tokens.points,
-                    Sdf.ValueTypeNames.Point3fArray)
-                pointsAttribute.default = groupVertexBuffer
+                meshPrimSpec = Sdf.CreatePrimInLayer(geometryLayer, meshPrimSpecPath)
+                if self._isTiled(elementName, group):
+                    # Split Meshes with too many faces into spatial tiles under
+                    # an Xform, so that each tile can be culled and paged
+                    # independently:
+                    meshPrimSpec.specifier = Sdf.SpecifierDef
+                    meshPrimSpec.typeName = 'Xform'
+                    tiles = splitIntoTiles(
+                        group.faceVertexCounts,
+                        group.faceVertexIndices,
+                        group.points,
+                        self._maxMeshFaceCount)
+                    for tileCoordinates, faceVertexCounts, faceVertexIndices, points in tiles:
+                        tilePrimSpec = Sdf.CreatePrimInLayer(geometryLayer, meshPrimSpecPath + '/' + self._getTileName(tileCoordinates))
+                        tileGroup = OBJGroupData(group.name, group.materialName, faceVertexCounts, faceVertexIndices, points)
+                        self._createMeshSpec(tilePrimSpec, tileGroup, materialRecord)
+                else:
+                    self._createMeshSpec(meshPrimSpec, group, materialRecord, groupExtent)
+
+                # Add a decimated proxy of heavy Meshes, drawn instead of the
+                # full-resolution Mesh by viewers displaying proxies:
+                proxyGroup = self._getProxyGroup(group)
+                if proxyGroup is not None:
+                    proxyPrimSpecPath = self._getProxyPath(rootPath, group.name)
+                    proxyPrimSpec = Sdf.CreatePrimInLayer(geometryLayer, proxyPrimSpecPath)
+                    proxyPrimSpec.nameParent.specifier = Sdf.SpecifierDef
+                    self._createMeshSpec(proxyPrimSpec, proxyGroup, materialRecord, subdivisionScheme=UsdGeom.Tokens.none)
+                    self._createPurposeSpec(proxyPrimSpec, UsdGeom.Tokens.proxy)
+
+                    self._createPurposeSpec(meshPrimSpec, UsdGeom.Tokens.render)
+                    proxyPrimRelationshipSpec = Sdf.RelationshipSpec(
+                        meshPrimSpec,
+                        UsdGeom.Tokens.proxyPrim,
+                        custom=False)
+                    proxyPrimRelationshipSpec.targetPathList.explicitItems.append(proxyPrimSpecPath)
+
+                # Bind the Material of the Group, shared through the library
+                # of the Element unless the Group has a texture of its own
+                # (Ptex textures being specific to the faces of each Mesh):
+                colorMapFilePath = self._getColorMapFilePath(elementName, group.name, materialRecord)
+                if colorMapFilePath is not None:
+                    materialPrimName = group.name.replace('_geo', '_mat')
+                    if materialPrimName in libraryMaterialNames:
+                        materialPrimName += '_textured'
+                    materialPath = self._getMaterialPath(rootPath, materialPrimName)
+                    localMaterials[materialPath] = (materialRecord, colorMapFilePath)
+                elif materialRecord is None:
+                    materialPath = self._getMaterialPath(rootPath, self._getMaterialPrimName(group.materialName, libraryMaterialNames))
+                    localMaterials[materialPath] = (None, None)
+                else:
+                    materialPath = self._getMaterialPath(rootPath, libraryMaterialPrimNames[group.materialName])
+                    usesMaterialLibrary = True
 
-                extentAttribute = Sdf.AttributeSpec(
+                meshPrimSpec.SetInfo('apiSchemas', Sdf.TokenListOp.Create(prependedItems=['MaterialBindingAPI']))
+                materialBindingSpec = Sdf.RelationshipSpec(
                     meshPrimSpec,
-                    UsdGeom.Tokens.extent,
+                    UsdShade.Tokens.materialBinding,
+                    custom=False)
+                materialBindingSpec.targetPathList.explicitItems.append(materialPath)
+
+
+            # Reference the material library of the Element, and author the
+            # Materials which could not be shared through it in the asset:
+            if localMaterials or usesMaterialLibrary:
+                materialsPrimSpec = Sdf.CreatePrimInLayer(layer, rootPath + '/' + self._materialsPrimName)
+                materialsPrimSpec.specifier = Sdf.SpecifierDef
+                if usesMaterialLibrary:
+                    materialsPrimSpec.referenceList.Prepend( Sdf.Reference(self._getMaterialLibraryReference(elementName)) )
+            for materialPath, (materialRecord, colorMapFilePath) in localMaterials.items():
+                self._authorMaterial(layer, materialPath, elementName, materialRecord, colorMapFilePath)
+
+
+            if meshGroups:
+                extentsHintAttribute = Sdf.AttributeSpec(
+                    modelRootPrimSpec,
+                    UsdGeom.Tokens.extentsHint,
                     Sdf.ValueTypeNames.Float3Array)
-                extentAttribute.default = [groupExtent.GetMin(), groupExtent.GetMax()]
+                extentsHintAttribute.default = Vt.Vec3fArray.FromNumpy(
+                    numpy.array([extentMin, extentMax], dtype=numpy.float32))
 
-                # Add display color:
-                if baseColor:
-                    displayColorAttribute = Sdf.AttributeSpec(
-                        meshPrimSpec,
-                        UsdGeom.Tokens.primvarsDisplayColor,
-                        Sdf.ValueTypeNames.Color3fArray)
-                    displayColorAttribute.default = [Gf.Vec3f(*baseColor[:3])]
-
-                # Add display opacity:
-                if alpha:
-                    displayOpacityAttribute = Sdf.AttributeSpec(
-                        meshPrimSpec,
-                        UsdGeom.Tokens.primvarsDisplayOpacity,
-                        Sdf.ValueTypeNames.FloatArray)
-                    displayOpacityAttribute.default = [alpha]
+            if self._usePayloads:
+                modelRootPrimSpec.payloadList.Prepend( Sdf.Payload(
+                    './' + os.path.basename(self._getAssetPayloadStagePath(assetOBJPath))) )
 
 
-        # TODO: Change this to only read content from the JSON material file
-        # once per asset (it is also read above)
-        materialInfo = {}
-        materialFilePath = os.path.join(self.SourceDirectoryPath, 'json', elementName, 'materials.json')
-        with open(materialFilePath, 'r') as f:
-            materialInfo = json.load(f)
+        if not meshGroups:
+            return
 
-        def getMaterialDataForGroup(groupName):
-            materialName = objStream.GetMaterialForGroup(groupName)
-            return materialInfo.get(materialName)
-
-        stage = Usd.Stage.Open(layer, load=Usd.Stage.LoadNone)
-
-        for group in objStream.GetGroups():
-            if not group.faces:
-                continue
-
-            # TODO: Avoid duplicating materials and shaders if they share the
-            # same properties?
-            materialPath = self._getMaterialPath(rootPath, group.name.replace('_geo', '_mat'))
-            material = UsdShade.Material.Define(stage, materialPath)
-
-            previewSurfaceShaderPath = self._getShaderPath(materialPath)
-            previewSurfaceShader = UsdShade.Shader.Define(stage, previewSurfaceShaderPath)
-            previewSurfaceShader.CreateIdAttr('UsdPreviewSurface')
-
-            materialData = getMaterialDataForGroup(group.name)
-            if materialData is not None:
-                baseColor = materialData.get('baseColor')
-                if baseColor is not None and baseColor != [1, 0, 0] and baseColor != [1, 0, 1]:
-                    previewSurfaceShader.CreateInput('diffuseColor', Sdf.ValueTypeNames.Color3f).Set( Gf.Vec3f(*baseColor[:3]) )
-
-                    if elementName == 'osOcean':
-                        previewSurfaceShader.CreateInput('opacity', Sdf.ValueTypeNames.Float).Set(0.2)
-                    elif len(baseColor) >= 4:
-                        previewSurfaceShader.CreateInput('opacity', Sdf.ValueTypeNames.Float).Set(baseColor[3])
-                else:
-                    baseColor = [1.0, 1.0, 1.0]
-                    previewSurfaceShader.CreateInput('diffuseColor', Sdf.ValueTypeNames.Color3f).Set( Gf.Vec3f(*baseColor[:3]) )
-
-                roughness = materialData.get('roughness')
-                if roughness is not None:
-                    previewSurfaceShader.CreateInput('roughness', Sdf.ValueTypeNames.Float).Set(roughness)
-
-                metallic = materialData.get('metallic')
-                if metallic is not None:
-                    previewSurfaceShader.CreateInput('metallic', Sdf.ValueTypeNames.Float).Set(metallic)
-
-                clearcoat = materialData.get('clearcoat')
-                if clearcoat is not None:
-                    previewSurfaceShader.CreateInput('clearcoat', Sdf.ValueTypeNames.Float).Set(clearcoat)
-
-                ior = materialData.get('ior')
-                if ior is not None:
-                    previewSurfaceShader.CreateInput('ior', Sdf.ValueTypeNames.Float).Set(ior)
-
-                clearcoatGloss = materialData.get('clearcoatGloss')
-                if clearcoatGloss is not None:
-                    clearcoatRoughness = max(1 - clearcoatGloss, 0.01)
-                    previewSurfaceShader.CreateInput('clearcoatRoughness', Sdf.ValueTypeNames.Float).Set(clearcoatRoughness)
-
-                if self._loadTextures:
-                    # TODO: Use texture path provided in the JSON metadata file
-                    # instead of relying on the naming convention.
-                    colorMapFilePath = os.path.join(self.SourceDirectoryPath, 'textures', elementName, 'Color', group.name + '.ptx')
-                    if os.path.exists(colorMapFilePath):
-                        colorMapShaderPath = materialPath + '/colorMap'
-                        colorMapShader = UsdShade.Shader.Define(stage, colorMapShaderPath)
-                        colorMapShader.CreateIdAttr(UsdHydra.Tokens.HwPtexTexture_1)
-                        colorMapShader.CreateInput('file', Sdf.ValueTypeNames.Asset).Set( colorMapFilePath.replace('\\', '/') )
-                        colorMapShader.CreateOutput('rgb', Sdf.ValueTypeNames.Color3f)
-
-                        previewSurfaceShader.CreateInput('diffuseColor', Sdf.ValueTypeNames.Color3f).ConnectToSource(colorMapShader, 'rgb')
-
-                    # TODO: This needs to be changed: Need to map a single-channel
-                    # "displacement" to a 3-channel "rgb" output?
-                    # displacementMapFilePath = os.path.join(self.SourceDirectoryPath, 'textures', elementName, 'Displacement', group.name + '.ptx')
-                    # if os.path.exists(displacementMapFilePath):
-                    #     displacementMapShaderPath = materialPath + '/displacementMap'
-                    #     displacementMapShader = UsdShade.Shader.Define(stage, displacementMapShaderPath)
-                    #     displacementMapShader.CreateIdAttr(UsdHydra.Tokens.HwPtexTexture_1)
-                    #     displacementMapShader.CreateInput('file', Sdf.ValueTypeNames.Asset).Set( displacementMapFilePath.replace('\\', '/') )
-                    #     displacementMapShader.CreateOutput('rgb', Sdf.ValueTypeNames.Color3f)
-
-                    #     previewSurfaceShader.CreateInput('displacement', Sdf.ValueTypeNames.Float).ConnectToSource(displacementMapShader, 'r')
-
-
-            # Connect the output of the PreviewSurface Shader to the material:
-            material.CreateSurfaceOutput().ConnectToSource(previewSurfaceShader, 'surface')
-            # material.CreateDisplacementOutput().ConnectToSource(previewSurfaceShader, 'displacement')
-
-            # Bind the material to mesh:
-            meshPath = self._getMeshPath(rootPath, group.name)
-            mesh = UsdGeom.Mesh(stage.GetPrimAtPath(meshPath))
-            UsdShade.MaterialBindingAPI(mesh).Bind(material)
-
-        # Export the resulting USD asset stage:
+        # Export the resulting USD asset stage, along with its geometry payload:
+        if self._usePayloads:
+            geometryLayer.Export(self._getAssetPayloadStagePath(assetOBJPath), comment='')
         assetStagePath = self._getAssetsStagePath(assetOBJPath)
         layer.Export(assetStagePath, comment='')
 
+    def _iterOBJGroups(self, assetOBJPath):
+        # type: (str) -> Iterator[moana2usd.obj_parser.OBJGroupData]
+        """
+        Return an iterator over the Groups of the given OBJ file.
+        """
+        if self._arrayCache is not None:
+            return getCachedOBJStreamForFile(assetOBJPath, self._arrayCache, jobs=self._parserJobs).IterGroupData()
+        elif self._parserJobs > 1:
+            return getOBJStreamForFile(assetOBJPath, jobs=self._parserJobs).IterGroupData()
+        return iterOBJGroupsForFile(assetOBJPath)
+
     def _translateOBJFileIntoUSD(self, assetOBJPath):
         # type: (str) -> None
         """
         Convert the given OBJ file into a USD Mesh with associated USD
         Materials and Shaders.
         """
-        objStream = getOBJStreamForFile(assetOBJPath)
-        if objStream.GetVerts():
-            self._convertOBJToUSD(assetOBJPath, objStream)
+        self._convertOBJToUSD(assetOBJPath, self._iterOBJGroups(assetOBJPath))
 
     def _createAssets(self):
         # type: () -> None
@@ -317,332 +930,150 @@ class AssetConverter(ContentConverter):
         Convert the OBJ assets from the Moana Island Scene dataset into USD
         assets.
         """
-        assetOBJFiles = [
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBayCedarA1', 'isBayCedarA1.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBayCedarA1', 'isBayCedarA1_bonsaiA.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBayCedarA1', 'isBayCedarA1_bonsaiB.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBayCedarA1', 'isBayCedarA1_bonsaiC.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBayCedarA1', 'archives', 'archivebaycedar0001_mod.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'isBeach.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgFibers_archivepineneedle0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgFibers_archivepineneedle0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgFibers_archivepineneedle0003_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgFibers_archiveseedpodb_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveCoral0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveCoral0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveCoral0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveCoral0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveCoral0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveCoral0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveCoral0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveCoral0008_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveCoral0009_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveRock0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveRock0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveRock0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveRock0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveRock0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveRock0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveRock0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveShell0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveShell0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveShell0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveShell0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveShell0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveShell0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveShell0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgGroundCover_archiveShell0008_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgHibiscus_archiveHibiscusFlower0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgHibiscus_archiveHibiscusFlower0003_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgHibiscus_archiveHibiscusFlower0004_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgHibiscus_archiveHibiscusFlower0005_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgHibiscus_archiveHibiscusFlower0006_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgHibiscus_archiveHibiscusFlower0007_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgHibiscus_archiveHibiscusFlower0008_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgHibiscus_archiveHibiscusFlower0009_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPalmDebris_archiveLeaflet0123_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPalmDebris_archiveLeaflet0124_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPalmDebris_archiveLeaflet0125_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPalmDebris_archiveLeaflet0126_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPalmDebris_archiveLeaflet0127_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveCoral0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveCoral0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveCoral0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveCoral0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveCoral0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveCoral0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveCoral0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveCoral0008_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveCoral0009_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveRock0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveRock0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveRock0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveRock0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveRock0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveRock0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgPebbles_archiveRock0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgSeaweed_archiveSeaweed0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgSeaweed_archiveSeaweed0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgSeaweed_archiveSeaweed0003_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgSeaweed_archiveSeaweed0063_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgSeaweed_archiveSeaweed0064_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgSeaweed_archiveSeaweed0065_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShells_archiveShell0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShells_archiveShell0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShells_archiveShell0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShells_archiveShell0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShells_archiveShell0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShells_archiveShell0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShells_archiveShell0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShells_archiveShell0008_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShellsSmall_archiveShell0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShellsSmall_archiveShell0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShellsSmall_archiveShell0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShellsSmall_archiveShell0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShellsSmall_archiveShell0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShellsSmall_archiveShell0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShellsSmall_archiveShell0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgShellsSmall_archiveShell0008_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgStones_archiveRock0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgStones_archiveRock0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgStones_archiveRock0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgStones_archiveRock0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgStones_archiveRock0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgStones_archiveRock0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isBeach', 'archives', 'xgStones_archiveRock0007_geo.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'isCoastline.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'archives', 'xgFibers_archivepineneedle0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'archives', 'xgFibers_archivepineneedle0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'archives', 'xgFibers_archivepineneedle0003_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'archives', 'xgFibers_archiveseedpodb_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'archives', 'xgPalmDebris_archiveLeaflet0123_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'archives', 'xgPalmDebris_archiveLeaflet0124_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'archives', 'xgPalmDebris_archiveLeaflet0125_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'archives', 'xgPalmDebris_archiveLeaflet0126_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoastline', 'archives', 'xgPalmDebris_archiveLeaflet0127_geo.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'isCoral.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'isCoral1.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'isCoral2.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'isCoral3.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'isCoral4.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'isCoral5.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgAntlers_archivecoral_antler0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgAntlers_archivecoral_antler0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgAntlers_archivecoral_antler0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgAntlers_archivecoral_antler0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgAntlers_archivecoral_antler0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgAntlers_archivecoral_antler0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgAntlers_archivecoral_antler0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgAntlers_archivecoral_antler0008_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgAntlers_archivecoral_antler0009_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgCabbage_archivecoral_cabbage0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgCabbage_archivecoral_cabbage0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgCabbage_archivecoral_cabbage0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgCabbage_archivecoral_cabbage0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgCabbage_archivecoral_cabbage0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgCabbage_archivecoral_cabbage0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgCabbage_archivecoral_cabbage0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgCabbage_archivecoral_cabbage0008_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgCabbage_archivecoral_cabbage0009_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgFlutes_flutes.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0008_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0009_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isCoral', 'archives', 'xgStaghorn_archivecoral_staghorn0010_geo.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'isDunesA.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgDebris_archivepineneedle0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgDebris_archivepineneedle0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgDebris_archivepineneedle0003_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgDebris_archiveseedpoda_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgDebris_archiveseedpodb_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgHibiscusFlower_archiveHibiscusFlower0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgHibiscusFlower_archiveHibiscusFlower0003_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgHibiscusFlower_archiveHibiscusFlower0004_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgHibiscusFlower_archiveHibiscusFlower0005_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgHibiscusFlower_archiveHibiscusFlower0006_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgHibiscusFlower_archiveHibiscusFlower0007_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgHibiscusFlower_archiveHibiscusFlower0008_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgHibiscusFlower_archiveHibiscusFlower0009_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgMuskFern_fern0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgMuskFern_fern0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgMuskFern_fern0003_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgMuskFern_fern0004_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesA', 'archives', 'xgMuskFern_fern0005_mod.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'isDunesB.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgPandanus_isPandanusAlo_base.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0001_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0002_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0003_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0004_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0005_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0006_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0007_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0008_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0009_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0010_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0011_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0012_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0013_geo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isDunesB', 'archives', 'xgRoots_archiveroot0014_geo.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'isGardeniaA.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardenia0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardenia0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardenia0003_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardenia0004_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardenia0005_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardenia0006_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardenia0007_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardenia0008_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardenia0009_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardeniaflw0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardeniaflw0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isGardeniaA', 'archives', 'archivegardeniaflw0003_mod.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isHibiscus', 'isHibiscus.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isHibiscus', 'archives', 'archiveHibiscusFlower0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isHibiscus', 'archives', 'archiveHibiscusLeaf0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isHibiscus', 'archives', 'archiveHibiscusLeaf0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isHibiscus', 'archives', 'archiveHibiscusLeaf0003_mod.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isHibiscusYoung', 'isHibiscusYoung.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isIronwoodA1', 'isIronwoodA1.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isIronwoodA1', 'isIronwoodA1_variantA_lo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isIronwoodA1', 'isIronwoodA1_variantB_lo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isIronwoodA1', 'archives', 'archiveseedpodb_mod.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isIronwoodB', 'isIronwoodB.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isIronwoodB', 'archives', 'archiveseedpodb_mod.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isKava', 'isKava.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isKava', 'archives', 'archive_kava0001_mod.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isLavaRocks', 'isLavaRocks.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isLavaRocks', 'isLavaRocks1.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'isMountainA.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgBreadFruit_archiveBreadFruitBaked.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig1.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig2.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig3.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig4.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig5.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig6.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig7.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig8.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig12.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig13.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig14.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig15.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig16.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgCocoPalms_isPalmRig17.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainA', 'archives', 'xgFoliageC_treeMadronaBaked_canopyOnly_lo.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'isMountainB.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgBreadFruit_archiveBreadFruitBaked.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig1.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig2.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig3.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig6.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig8.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig12.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig13.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig14.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig15.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig16.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgCocoPalms_isPalmRig17.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0001_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0002_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0003_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0004_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0005_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0006_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0007_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0008_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0009_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0010_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0011_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0012_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0013_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFern_fern0014_mod.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFoliageA_treeMadronaBaked_canopyOnly_lo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFoliageAd_treeMadronaBaked_canopyOnly_lo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFoliageB_treeMadronaBaked_canopyOnly_lo.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isMountainB', 'archives', 'xgFoliageC_treeMadronaBaked_canopyOnly_lo.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isNaupakaA', 'isNaupakaA.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isNaupakaA', 'isNaupakaA1.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isNaupakaA', 'isNaupakaA2.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isNaupakaA', 'isNaupakaA3.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isNaupakaA', 'archives', 'xgBonsai_isNaupakaBon_bon_hero_ALL.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmDead', 'isPalmDead.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig2.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig3.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig4.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig5.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig6.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig7.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig8.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig9.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig10.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig11.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig12.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig13.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig14.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig15.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig16.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig17.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig18.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig19.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig20.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig21.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig22.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig23.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig24.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig25.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig26.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig27.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig28.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig29.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig30.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig31.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig32.obj'),
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPalmRig', 'isPalmRig33.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'isPandanusA', 'isPandanusA.obj'),
-
-            os.path.join(self.SourceDirectoryPath, 'obj', 'osOcean', 'osOcean.obj')
-        ]
-
+        assetOBJFiles = self._getUniqueAssetOBJFilePaths(self.Catalog.GetAssetOBJFilePaths())
+
+
+        # Outputs are recorded in the build manifest as they are written, and
+        # the manifest is saved once all assets are translated (or failed to),
+        # before failures are reported:
+        try:
+            # Filter out OBJ files that have already been translated to USD
+            # from their current content (perhaps as a result of a previous
+            # run):
+            upToDateAssetOBJFiles = set(
+                assetOBJFile
+                for assetOBJFile in assetOBJFiles
+                if self._isAssetUpToDate(assetOBJFile))
+
+            # Find the Meshes shared by several assets, and translate again the
+            # assets whose shared Meshes changed or whose prototypes are out of
+            # date:
+            outdatedPrototypeHashes = set()
+            if self._shareMeshes:
+                self._sharedPrototypeHashes = self._findSharedPrototypes(assetOBJFiles, upToDateAssetOBJFiles)
+                outdatedPrototypeHashes = self._removeOutdatedPrototypes()
+                upToDateAssetOBJFiles = set(
+                    assetOBJFile
+                    for assetOBJFile in upToDateAssetOBJFiles
+                    if (self._buildManifest.GetMetadata(self._getAssetsStagePath(assetOBJFile)) or {}).get('prototypeHashes') == self._getAssetPrototypeHashes(assetOBJFile)
+                    and not outdatedPrototypeHashes.intersection(self._getAssetPrototypeHashes(assetOBJFile)))
+
+            assetsOBJFilesThatDoNotExist = [
+                assetOBJFile
+                for assetOBJFile in assetOBJFiles
+                if assetOBJFile not in upToDateAssetOBJFiles
+            ]
+
+
+            # Author the materials shared by the assets of each Element:
+            self._createMaterialLibraries(assetOBJFiles)
+
+            # Translate OBJ files into USD:
+            if self._jobs > 1:
+                failedAssets = self._translateOBJFilesInParallel(assetsOBJFilesThatDoNotExist)
+            else:
+                failedAssets = []
+                with tqdm(total=len(assetsOBJFilesThatDoNotExist), desc='Translating assets', ncols=self.ProgressBarWidth) as progressBar:
+                    for assetOBJPath in assetsOBJFilesThatDoNotExist:
+                        try:
+                            self._translateOBJFileIntoUSD(assetOBJPath)
+                        except Exception:
+                            failedAssets.append((assetOBJPath, traceback.format_exc()))
+                        else:
+                            self._recordAsset(assetOBJPath)
+                        progressBar.update()
+
+            self._recordPrototypes(outdatedPrototypeHashes)
+        finally:
+            self._buildManifest.Save()
+
+        if failedAssets:
+            raise ConversionError('translate', failedAssets)
+
+    def _getUniqueAssetOBJFilePaths(self, assetOBJPaths):
+        # type: (List[str]) -> List[str]
+        """
+        Return the given OBJ files, without the ones whose USD asset would be
+        written to the same file as one of a previous OBJ file.
+        """
+        uniqueAssetOBJPaths = []
+        assetOBJPathsByStagePath = {}
+        for assetOBJPath in assetOBJPaths:
+            assetStagePath = self._getAssetsStagePath(assetOBJPath)
+            if assetStagePath in assetOBJPathsByStagePath:
+                print('Warning: Skipping "{assetOBJPath}", whose USD asset would overwrite the one of "{otherAssetOBJPath}".'.format(
+                    assetOBJPath=assetOBJPath,
+                    otherAssetOBJPath=assetOBJPathsByStagePath[assetStagePath]))
+                continue
+            assetOBJPathsByStagePath[assetStagePath] = assetOBJPath
+            uniqueAssetOBJPaths.append(assetOBJPath)
+        return uniqueAssetOBJPaths
 
-        # Filter out OBJ files that have already been translated to USD (perhaps
-        # as a result of a previous run):
-        assetsOBJFilesThatDoNotExist = []
-        for assetOBJFile in assetOBJFiles:
-            translatedUSDFilePath = self._getAssetsStagePath(assetOBJFile)
-            if not os.path.exists(translatedUSDFilePath):
-                assetsOBJFilesThatDoNotExist.append(assetOBJFile)
+    def _translateOBJFilesInParallel(self, assetOBJPaths):
+        # type: (List[str]) -> List[Tuple[str, str]]
+        """
+        Convert the given OBJ files into USD assets using a pool of worker
+        processes, returning the (OBJ file path, traceback) of the ones that
+        could not be translated.
 
+        The largest files are submitted first, so that the longest translations
+        do not end up running alone at the end of the batch. A failure to
+        translate an asset does not interrupt the translation of the others.
+        """
+        assetOBJPaths = sorted(assetOBJPaths, key=self.Catalog.GetFileSize, reverse=True)
+
+        failedAssets = []
+        pool = multiprocessing.Pool(
+            processes=min(self._jobs, max(len(assetOBJPaths), 1)),
+            initializer=_initializeAssetTranslationWorker,
+            initargs=(self,))
+        try:
+            with tqdm(total=len(assetOBJPaths), desc='Translating assets', ncols=self.ProgressBarWidth) as progressBar:
+                for assetOBJPath, error in pool.imap_unordered(_translateAssetInWorker, assetOBJPaths, chunksize=1):
+                    if error is not None:
+                        failedAssets.append((assetOBJPath, error))
+                    else:
+                        self._recordAsset(assetOBJPath)
+                    progressBar.set_description('Translated {assetName}'.format(assetName=self._getAssetElementName(assetOBJPath)))
+                    progressBar.update()
+        finally:
+            pool.close()
+            pool.join()
+
+        return failedAssets
+
+
+# AssetConverter used by the current worker process, when translating assets
+# in parallel:
+_workerAssetConverter = None
+
+def _initializeAssetTranslationWorker(assetConverter):
+    # type: (AssetConverter) -> None
+    """
+    Set the AssetConverter to use in the current worker process.
+    """
+    global _workerAssetConverter
+    _workerAssetConverter = assetConverter
+    # Worker processes cannot start pools of their own, so OBJ files are parsed
+    # by a single process within each worker:
+    _workerAssetConverter._parserJobs = 1
+
+def _hashAssetInWorker(assetOBJPath):
+    # type: (str) -> Tuple[str, List[str]]
+    """
+    Return the hashes of the Meshes of the given OBJ file which may be shared
+    with other assets, computed in the current worker process.
+    """
+    return (assetOBJPath, _workerAssetConverter._getGroupHashes(assetOBJPath))
 
-        # Translate OBJ files into USD:
-        with tqdm(total=len(assetsOBJFilesThatDoNotExist), desc='Translating assets', ncols=self.ProgressBarWidth) as progressBar:
-            for assetOBJPath in assetsOBJFilesThatDoNotExist:
-                self._translateOBJFileIntoUSD(assetOBJPath)
-                progressBar.update()
+def _translateAssetInWorker(assetOBJPath):
+    # type: (str) -> Tuple[str, str or None]
+    """
+    Convert the given OBJ file into a USD asset in the current worker process,
+    returning the traceback of the error that occurred, if any.
+    """
+    try:
+        _workerAssetConverter._translateOBJFileIntoUSD(assetOBJPath)
+    except Exception:
+        return (assetOBJPath, traceback.format_exc())
+    return (assetOBJPath, None)
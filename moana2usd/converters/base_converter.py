@@ -6,14 +6,39 @@ Base class for the conversion of content to USD format.
 
 import os
 
+from moana2usd.dataset.catalog import DatasetCatalog
+
+
+class ConversionError(Exception):
+    """
+    Error raised once a conversion phase completed, when some of its files
+    could not be converted.
+    """
+
+    def __init__(self, description, failures):
+        # type: (str, List[Tuple[str, str]]) -> ConversionError
+        """
+        Initialize the error with the given description of the phase, and the
+        (file path, traceback) of each file that could not be converted.
+        """
+        message = 'Could not {description} {count} file(s):\n{errors}'.format(
+            description=description,
+            count=len(failures),
+            errors='\n'.join(
+                '"{filePath}":\n{error}'.format(filePath=filePath, error=error)
+                for filePath, error in failures
+            ))
+        super(ConversionError, self).__init__(message)
+        self.Failures = failures
+
 
 class ContentConverter(object):
     """
     Base content converter class, to be extended by concern-specific subclasses.
     """
 
-    def __init__(self, fileFormat, sourceDirectoryPath, destinationDirectoryPath):
-        # type: (str, str, str) -> ContentConverter
+    def __init__(self, fileFormat, sourceDirectoryPath, destinationDirectoryPath, catalog=None):
+        # type: (str, str, str, moana2usd.dataset.catalog.DatasetCatalog) -> ContentConverter
         """
         Initialize the converter using the provided USD file format, dataset
         source directory path and destination folder path.
@@ -21,6 +46,7 @@ class ContentConverter(object):
         self._fileFormat = fileFormat
         self._sourceDirectoryPath = sourceDirectoryPath
         self._destinationDirectoryPath = destinationDirectoryPath
+        self._catalog = catalog
 
     def convert(self):
         # type: () -> None
@@ -56,6 +82,16 @@ class ContentConverter(object):
         """
         return self._sourceDirectoryPath
 
+    @property
+    def Catalog(self):
+        # type: () -> moana2usd.dataset.catalog.DatasetCatalog
+        """
+        Return the catalog of the files of the Moana Island Scene dataset.
+        """
+        if self._catalog is None:
+            self._catalog = DatasetCatalog(self._sourceDirectoryPath)
+        return self._catalog
+
     @property
     def DestinationDirectoryPath(self):
         # type: () -> str
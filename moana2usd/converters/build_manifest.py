@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+
+"""
+Manifest of the USD layers built from the dataset, used for incremental builds.
+"""
+
+import hashlib
+import json
+import os
+
+
+# Version of the conversion code, to be incremented whenever the content it
+# authors changes so that layers built by previous versions get rebuilt:
+CONVERTER_VERSION = 5
+
+
+def _getFileHash(filePath):
+    # type: (str) -> str
+    """
+    Return the SHA-1 hash of the content of the given file.
+    """
+    fileHash = hashlib.sha1()
+    with open(filePath, 'rb') as f:
+        for data in iter(lambda: f.read(1024 * 1024), b''):
+            fileHash.update(data)
+    return fileHash.hexdigest()
+
+
+class BuildManifest(object):
+    """
+    Record of the inputs each output layer was built from.
+
+    For each output layer, the manifest stores the content hash of each of its
+    input files, along with the converter version and the conversion options
+    used. An output only needs to be rebuilt when one of these changed, or
+    when the output itself no longer matches what was written. Input files
+    are only hashed again when their size or modification time changed.
+
+    Changes are kept in memory until the manifest is saved, which converters
+    do once at the end of each of their phases.
+    """
+
+    FILE_NAME = 'moana2usd_manifest.json'
+
+    def __init__(self, destinationDirectoryPath, sourceDirectoryPath):
+        # type: (str, str) -> BuildManifest
+        """
+        Load the manifest of the given destination directory, if it exists.
+        """
+        self._destinationDirectoryPath = destinationDirectoryPath
+        self._sourceDirectoryPath = sourceDirectoryPath
+        self._entries = {}
+        self._isModified = False
+
+        if os.path.exists(self.ManifestFilePath):
+            with open(self.ManifestFilePath, 'r') as f:
+                self._entries = json.load(f).get('outputs', {})
+
+    @property
+    def ManifestFilePath(self):
+        # type: () -> str
+        """
+        Return the path of the manifest file.
+        """
+        return os.path.join(self._destinationDirectoryPath, self.FILE_NAME)
+
+    def IsUpToDate(self, outputFilePath, inputFilePaths, options):
+        # type: (str, List[str], dict) -> boolean
+        """
+        Check if the given output was built from the current content of the
+        given inputs, with the given options and the current converter.
+        """
+        entry = self._entries.get(self._getOutputKey(outputFilePath))
+        if entry is None:
+            return False
+        if entry.get('converterVersion') != CONVERTER_VERSION or entry.get('options') != self._normalizeOptions(options):
+            return False
+        outputFingerprint = self._getFileFingerprint(outputFilePath, entry.get('output'))
+        if outputFingerprint is None or outputFingerprint.get('sha1') != (entry.get('output') or {}).get('sha1'):
+            return False
+
+        return self._areInputsUpToDate(entry, inputFilePaths)
+
+    def Record(self, outputFilePath, inputFilePaths, options, metadata=None):
+        # type: (str, List[str], dict, dict or None) -> None
+        """
+        Record that the given output was built from the given inputs, with the
+        given options, along with the given metadata describing the output (if
+        any).
+        """
+        outputKey = self._getOutputKey(outputFilePath)
+        previousEntry = self._entries.get(outputKey, {})
+        self._entries[outputKey] = {
+            'converterVersion': CONVERTER_VERSION,
+            'options': self._normalizeOptions(options),
+            'inputs': self._getInputFingerprints(inputFilePaths, previousEntry.get('inputs')),
+            'output': self._getFileFingerprint(outputFilePath, withHash=True)
+        }
+        if metadata is not None:
+            self._entries[outputKey]['metadata'] = self._normalizeOptions(metadata)
+        self._isModified = True
+
+    def GetMetadata(self, outputFilePath, inputFilePaths=None):
+        # type: (str, List[str] or None) -> dict or None
+        """
+        Return the metadata recorded for the given output, if any.
+
+        When inputs are given, the metadata is only returned if it was recorded
+        by the current converter from the current content of these inputs,
+        regardless of the options used.
+        """
+        entry = self._entries.get(self._getOutputKey(outputFilePath))
+        if entry is None:
+            return None
+        if inputFilePaths is not None:
+            if entry.get('converterVersion') != CONVERTER_VERSION or not self._areInputsUpToDate(entry, inputFilePaths):
+                return None
+        return entry.get('metadata')
+
+    def SetMetadata(self, outputFilePath, metadata):
+        # type: (str, dict) -> None
+        """
+        Replace the metadata recorded for the given output, if it was recorded.
+        """
+        entry = self._entries.get(self._getOutputKey(outputFilePath))
+        if entry is not None:
+            entry['metadata'] = self._normalizeOptions(metadata)
+            self._isModified = True
+
+    def Save(self):
+        # type: () -> None
+        """
+        Write the manifest to disk if it changed, replacing the previous one in
+        a single step so that an interrupted run never leaves a partial
+        manifest.
+        """
+        if not self._isModified:
+            return
+        temporaryFilePath = self.ManifestFilePath + '.tmp'
+        with open(temporaryFilePath, 'w') as f:
+            json.dump({ 'outputs': self._entries }, f, indent=1, sort_keys=True)
+        if os.path.exists(self.ManifestFilePath):
+            os.remove(self.ManifestFilePath)
+        os.rename(temporaryFilePath, self.ManifestFilePath)
+        self._isModified = False
+
+    def Verify(self):
+        # type: () -> List[Tuple[str, str]]
+        """
+        Check all the outputs recorded in the manifest, returning the
+        (output file path, reason) of the ones which are out of date.
+        """
+        staleOutputs = []
+        for outputKey, entry in sorted(self._entries.items()):
+            outputFilePath = os.path.join(self._destinationDirectoryPath, outputKey)
+            inputFilePaths = [self._getInputFilePath(inputKey) for inputKey in entry.get('inputs')]
+
+            reason = None
+            if not os.path.exists(outputFilePath):
+                reason = 'missing output'
+            elif self._getFileFingerprint(outputFilePath, withHash=True).get('sha1') != (entry.get('output') or {}).get('sha1'):
+                reason = 'output modified or partially written'
+            elif entry.get('converterVersion') != CONVERTER_VERSION:
+                reason = 'built by converter version {version}'.format(version=entry.get('converterVersion'))
+            elif self._getHashes(self._getInputFingerprints(inputFilePaths, entry.get('inputs'))) != self._getHashes(entry.get('inputs')):
+                reason = 'inputs changed'
+
+            if reason is not None:
+                staleOutputs.append((outputFilePath, reason))
+        return staleOutputs
+
+    def _getOutputKey(self, outputFilePath):
+        # type: (str) -> str
+        """
+        Return the key of the given output, relative to the destination
+        directory.
+        """
+        return os.path.relpath(outputFilePath, self._destinationDirectoryPath).replace('\\', '/')
+
+    def _getInputKey(self, inputFilePath):
+        # type: (str) -> str
+        """
+        Return the key of the given input, relative to the source directory.
+        """
+        return os.path.relpath(inputFilePath, self._sourceDirectoryPath).replace('\\', '/')
+
+    def _getInputFilePath(self, inputKey):
+        # type: (str) -> str
+        """
+        Return the path of the input with the given key.
+        """
+        return os.path.join(self._sourceDirectoryPath, *inputKey.split('/'))
+
+    def _areInputsUpToDate(self, entry, inputFilePaths):
+        # type: (dict, List[str]) -> boolean
+        """
+        Check if the given inputs have the content recorded in the given entry.
+        """
+        inputFingerprints = self._getInputFingerprints(inputFilePaths, entry.get('inputs'))
+        if self._getHashes(inputFingerprints) != self._getHashes(entry.get('inputs')):
+            return False
+        # Inputs which were touched without being modified are up to date, and
+        # do not need to be hashed again on the next run:
+        if inputFingerprints != entry.get('inputs'):
+            entry['inputs'] = inputFingerprints
+            self._isModified = True
+        return True
+
+    def _getInputFingerprints(self, inputFilePaths, previousFingerprints):
+        # type: (List[str], dict or None) -> dict
+        """
+        Return the fingerprints of the given inputs, reusing the hashes of the
+        previous fingerprints for files which have not been touched.
+        """
+        previousFingerprints = previousFingerprints or {}
+        fingerprints = {}
+        for inputFilePath in inputFilePaths:
+            inputKey = self._getInputKey(inputFilePath)
+            fingerprints[inputKey] = self._getFileFingerprint(inputFilePath, previousFingerprints.get(inputKey), withHash=True)
+        return fingerprints
+
+    def _getHashes(self, fingerprints):
+        # type: (dict) -> dict
+        """
+        Return the content hashes of the given file fingerprints.
+        """
+        return dict(
+            (key, fingerprint.get('sha1') if fingerprint is not None else None)
+            for key, fingerprint in fingerprints.items()
+        )
+
+    def _getFileFingerprint(self, filePath, previousFingerprint=None, withHash=False):
+        # type: (str, dict or None, boolean) -> dict or None
+        """
+        Return the size, modification time and (optionally) content hash of
+        the given file, or `None` if it does not exist.
+
+        When a previous fingerprint is given, only its fields are computed, and
+        its hash is reused if the size and modification time did not change.
+        """
+        if not os.path.exists(filePath):
+            return None
+        fileStat = os.stat(filePath)
+        fingerprint = {
+            'size': fileStat.st_size,
+            'mtime': fileStat.st_mtime
+        }
+        if previousFingerprint is not None:
+            withHash = 'sha1' in previousFingerprint
+        if withHash:
+            if previousFingerprint is not None and \
+                    previousFingerprint.get('size') == fingerprint.get('size') and \
+                    previousFingerprint.get('mtime') == fingerprint.get('mtime'):
+                fingerprint['sha1'] = previousFingerprint.get('sha1')
+            else:
+                fingerprint['sha1'] = _getFileHash(filePath)
+        return fingerprint
+
+    def _normalizeOptions(self, options):
+        # type: (dict) -> dict
+        """
+        Return the given options (or metadata) as they are stored in the
+        manifest.
+        """
+        return json.loads(json.dumps(options))
@@ -129,15 +129,7 @@ class CameraConverter(ContentConverter):
         Create a USD Stage with USD Cameras from the JSON camera definitions
         files contained in the Moana Island Scene dataset.
         """
-        cameraJSONFiles = [
-            os.path.join(self.SourceDirectoryPath, 'json', 'cameras', 'beachCam.json'),
-            os.path.join(self.SourceDirectoryPath, 'json', 'cameras', 'birdseyeCam.json'),
-            os.path.join(self.SourceDirectoryPath, 'json', 'cameras', 'dunesACam.json'),
-            os.path.join(self.SourceDirectoryPath, 'json', 'cameras', 'grassCam.json'),
-            os.path.join(self.SourceDirectoryPath, 'json', 'cameras', 'palmsCam.json'),
-            os.path.join(self.SourceDirectoryPath, 'json', 'cameras', 'rootsCam.json'),
-            os.path.join(self.SourceDirectoryPath, 'json', 'cameras', 'shotCam.json')
-        ]
+        cameraJSONFiles = self.Catalog.GetCameraJSONFilePaths()
 
         # Create USD Stage containing only references to cameras, along with a
         # root "/cameras" Prim under which all other Prims will be attached:
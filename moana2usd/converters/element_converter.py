@@ -4,29 +4,80 @@
 Element instancing from JSON to USD.
 """
 
+from __future__ import print_function
+
+import collections
 import json
+import multiprocessing
 import os
+import traceback
+
+import numpy
 
-from moana2usd.converters.base_converter import ContentConverter
+from moana2usd.converters.base_converter import ContentConverter, ConversionError
+from moana2usd.converters.build_manifest import BuildManifest
+from moana2usd.dataset.instance_json import concatenateInstanceTransforms, countInstances, getCachedInstanceTransformsForFile, iterInstanceTransforms
+from moana2usd.dataset.material_database import getElementNameForOBJPath
+from moana2usd.geometry.thinning import getThinningMask
+from moana2usd.geometry.tiling import splitPointsIntoTiles
+from moana2usd.geometry.transforms import composeTransforms, decomposeTransforms, transformExtent
 
-from pxr import Gf, Sdf, Usd, UsdGeom, UsdLux
+from pxr import Gf, Sdf, UsdGeom, UsdLux, Vt
 from tqdm import tqdm
 
 
+# Largest deviation allowed between the corners of the geometry of an
+# instanced copy as placed by its transform and by the PointInstancer
+# collapsing it, relative to the size of the geometry:
+COLLAPSED_COPY_TOLERANCE = 1e-3
+
+# Smallest number of instanced copies worth collapsing into a PointInstancer:
+COLLAPSED_COPY_MIN_COUNT = 2
+
+
 class ElementConverter(ContentConverter):
     """
     Converter for JSON Elements into USD Stages.
     """
 
-    def __init__(self, fileFormat, sourceDirectoryPath, destinationDirectoryPath, omitSmallInstances=False):
-        # type: (str, str, str, boolean) -> ElementConverter
+    def __init__(self, fileFormat, sourceDirectoryPath, destinationDirectoryPath, omitSmallInstances=False, buildManifest=None, catalog=None, jobs=1, arrayCache=None, maxCellInstanceCount=0, useCellPayloads=False, mergeInstancers=False, collapseInstancedCopies=False, instanceKeepFractions=None, maxElementInstanceCount=0):
+        # type: (str, str, str, boolean, moana2usd.converters.build_manifest.BuildManifest, moana2usd.dataset.catalog.DatasetCatalog, int, moana2usd.dataset.array_cache.ArrayCache, int, boolean, boolean, boolean, Dict[str, float], int) -> ElementConverter
         """
         Initialize the converter using the provided USD file format, dataset
         source directory path and destination folder path.
+
+        PointInstancers with more instances than `maxCellInstanceCount` are
+        split into spatial cells (unless 0), each optionally brought in as a
+        payload. With `mergeInstancers`, a single PointInstancer is created for
+        each instance JSON file rather than one for each of its archives. With
+        `collapseInstancedCopies`, the instanced copies of each Element that
+        share the same content are gathered into a PointInstancer.
+
+        Instances are thinned out to the fraction of `instanceKeepFractions`
+        given for the name of their archive or of their sub-instance (or for
+        "*"), and so that Elements hold at most about
+        `maxElementInstanceCount` instances (unless 0).
         """
-        super(ElementConverter, self).__init__(fileFormat, sourceDirectoryPath, destinationDirectoryPath)
+        super(ElementConverter, self).__init__(fileFormat, sourceDirectoryPath, destinationDirectoryPath, catalog)
 
         self._omitSmallInstances = omitSmallInstances
+        self._buildManifest = buildManifest or BuildManifest(destinationDirectoryPath, sourceDirectoryPath)
+        self._jobs = jobs
+        self._arrayCache = arrayCache
+        self._maxCellInstanceCount = maxCellInstanceCount
+        self._useCellPayloads = useCellPayloads
+        self._mergeInstancers = mergeInstancers
+        self._collapseInstancedCopies = collapseInstancedCopies
+        self._instanceKeepFractions = dict(instanceKeepFractions or {})
+        self._maxElementInstanceCount = maxElementInstanceCount
+
+        self._instancersPrimName = 'Instancers'
+        self._cellPayloadsPrimName = '_InstancerCells'
+        self._instancedCopiesPrimName = 'instancedCopies'
+        self._assetExtents = {}
+        self._subInstanceNames = {}
+        self._instanceBudgetFractions = {}
+        self._instanceCounts = {}
 
         self._ITEM_PB_INDEX = 2
         self._SUBINSTANCE_PB_INDEX = 1
@@ -51,12 +102,17 @@ class ElementConverter(ContentConverter):
     def _getAssetFilePathFromOBJFilePath(self, assetOBJPath):
         # type: (str) -> str
         """
-        Return the absolute file path of the USD Stage for the given OBJ asset.
+        Return the absolute file path of the USD Stage for the given OBJ asset,
+        stored along with the other assets of its Element.
         """
         assetOBJFileName = os.path.basename(assetOBJPath)
         baseName = os.path.splitext(assetOBJFileName)[0]
+        elementName = getElementNameForOBJPath(
+            os.path.join(self.SourceDirectoryPath, assetOBJPath),
+            self.SourceDirectoryPath)
         return os.path.join(
             self.PrimitivesDirectory,
+            elementName,
             baseName + self.USDFileExtension)
 
     def _getAssetSubInstanceStageFilePath(self, jsonFilename):
@@ -76,6 +132,167 @@ class ElementConverter(ContentConverter):
         """
         return os.path.basename(filename).rsplit('.')[0]
 
+    def _getBuildOptions(self, jsonFilename):
+        # type: (str) -> dict
+        """
+        Return the options affecting the content of the USD sub-instance Stage
+        of the given instance JSON file.
+        """
+        return {
+            'format': self._fileFormat,
+            'cellInstanceCount': self._maxCellInstanceCount,
+            'cellPayloads': self._useCellPayloads,
+            'mergeInstancers': self._mergeInstancers,
+            'keepFractions': self._instanceKeepFractions,
+            'budgetFraction': self._instanceBudgetFractions.get(jsonFilename, 1.0)
+        }
+
+    def _getInstanceLayerInputFilePaths(self, jsonFilename):
+        # type: (str) -> List[str]
+        """
+        Return the paths of the source files from which the USD sub-instance
+        Stage of the given instance JSON file is created.
+
+        When instances are split into cells, the extents of the cells also
+        depend on the OBJ archives being instanced.
+        """
+        inputFilePaths = [jsonFilename]
+        if self._maxCellInstanceCount > 0:
+            inputFilePaths.extend(self.Catalog.GetInstanceJSONArchiveFilePaths(jsonFilename))
+        return inputFilePaths
+
+    def _getCellName(self, cellCoordinates):
+        # type: (Tuple[int, int, int]) -> str
+        """
+        Return the name of the PointInstancer for the cell at the given grid
+        coordinates.
+        """
+        return 'cell_{x}_{y}_{z}'.format(
+            x=cellCoordinates[0],
+            y=cellCoordinates[1],
+            z=cellCoordinates[2])
+
+    def _getAssetExtent(self, assetOBJPath):
+        # type: (str) -> numpy.ndarray or None
+        """
+        Return the (2, 3) extent of the USD asset translated from the given OBJ
+        file, as found in the `extentsHint` of its model root, if available.
+        """
+        assetFilePath = self._getAssetFilePathFromOBJFilePath(assetOBJPath)
+        if assetFilePath not in self._assetExtents:
+            assetExtent = None
+            assetLayer = Sdf.Layer.FindOrOpen(assetFilePath) if os.path.isfile(assetFilePath) else None
+            if assetLayer is not None and assetLayer.defaultPrim:
+                extentsHintSpec = assetLayer.GetAttributeAtPath(
+                    Sdf.Path('/' + assetLayer.defaultPrim).AppendProperty(UsdGeom.Tokens.extentsHint))
+                if extentsHintSpec is not None and extentsHintSpec.default is not None and len(extentsHintSpec.default) >= 2:
+                    assetExtent = numpy.array(list(extentsHintSpec.default)[:2], dtype=numpy.float64)
+            self._assetExtents[assetFilePath] = assetExtent
+        return self._assetExtents[assetFilePath]
+
+    def _getInstanceExtents(self, prototypes, transformMatrices, protoIndices):
+        # type: (List[Tuple[str, str]], numpy.ndarray, numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        Return the minimum and maximum corners of the bounds of each instance
+        of the given prototypes, falling back to the positions of the instances
+        of prototypes whose asset extent is not available.
+        """
+        extentMins = numpy.array(transformMatrices[:, 12:15], dtype=numpy.float64)
+        extentMaxs = extentMins.copy()
+        for protoIndex, (_, assetOBJPath) in enumerate(prototypes):
+            assetExtent = self._getAssetExtent(assetOBJPath)
+            if assetExtent is None:
+                continue
+            instanceMask = protoIndices == protoIndex
+            extentMins[instanceMask], extentMaxs[instanceMask] = transformExtent(assetExtent, transformMatrices[instanceMask])
+        return (extentMins, extentMaxs)
+
+    def _getInstanceKeepFraction(self, jsonFilename, archiveName):
+        # type: (str, str) -> float
+        """
+        Return the fraction of the instances of the given archive of the given
+        instance JSON file to keep.
+
+        Instance JSON files shared by several sub-instance names are authored
+        in a single USD sub-instance Stage, which keeps the largest of the
+        fractions given for these names.
+        """
+        keepFraction = 1.0
+        subInstanceKeepFractions = [
+            self._instanceKeepFractions[subInstanceName]
+            for subInstanceName in self._subInstanceNames.get(jsonFilename, ())
+            if subInstanceName in self._instanceKeepFractions
+        ]
+        archiveBasename = self._getFileBasename(archiveName)
+        if archiveBasename in self._instanceKeepFractions:
+            keepFraction = self._instanceKeepFractions[archiveBasename]
+        elif subInstanceKeepFractions:
+            keepFraction = max(subInstanceKeepFractions)
+        elif '*' in self._instanceKeepFractions:
+            keepFraction = self._instanceKeepFractions['*']
+        return keepFraction * self._instanceBudgetFractions.get(jsonFilename, 1.0)
+
+    def _thinInstances(self, jsonFilename, archives):
+        # type: (str, Iterable[Tuple[str, numpy.ndarray]]) -> Iterator[Tuple[str, numpy.ndarray]]
+        """
+        Yield the given archives of the given instance JSON file, along with
+        the transform matrices of the instances to keep.
+
+        Instances are pruned deterministically based on their position, so
+        that the same instances are kept from one conversion to the next.
+        """
+        for archiveName, transformMatrices in archives:
+            keepFraction = self._getInstanceKeepFraction(jsonFilename, archiveName)
+            if keepFraction < 1.0:
+                transformMatrices = transformMatrices[getThinningMask(transformMatrices[:, 12:15], keepFraction)]
+            yield (archiveName, transformMatrices)
+
+    def _getInstanceCount(self, jsonFilename):
+        # type: (str) -> int
+        """
+        Return the number of instances of the given instance JSON file.
+
+        The count is recorded in the build manifest along with the USD
+        sub-instance Stage of the file, so that it is only counted again once
+        the file changes.
+        """
+        subInstanceStageFilePath = self._getAssetSubInstanceStageFilePath(jsonFilename)
+        metadata = self._buildManifest.GetMetadata(subInstanceStageFilePath, self._getInstanceLayerInputFilePaths(jsonFilename)) or {}
+        if 'instanceCount' not in metadata:
+            metadata = {'instanceCount': countInstances(jsonFilename)}
+            self._buildManifest.SetMetadata(subInstanceStageFilePath, metadata)
+        self._instanceCounts[jsonFilename] = metadata['instanceCount']
+        return self._instanceCounts[jsonFilename]
+
+    def _computeInstanceBudgetFractions(self, elementDataList):
+        # type: (List[dict]) -> None
+        """
+        Compute the fraction of the instances of each instance JSON file to
+        keep so that each of the given Elements holds at most about
+        `maxElementInstanceCount` instances.
+
+        Instance JSON files shared by instanced copies are authored in a single
+        USD sub-instance Stage, but are counted once for each copy referencing
+        them, as each copy renders all of their instances. The budget applies
+        to the instances of the source files, before they are thinned out by
+        their keep fraction.
+        """
+        self._instanceBudgetFractions = {}
+        self._instanceCounts = {}
+        if self._maxElementInstanceCount <= 0:
+            return
+
+        for elementData in elementDataList:
+            jsonFileReferenceCounts = collections.Counter(self._getElementInstanceJSONFiles(elementData))
+            instanceCount = sum(
+                self._getInstanceCount(jsonFilename) * referenceCount
+                for jsonFilename, referenceCount in jsonFileReferenceCounts.items()
+            )
+            if instanceCount > self._maxElementInstanceCount:
+                budgetFraction = float(self._maxElementInstanceCount) / instanceCount
+                for jsonFilename in jsonFileReferenceCounts:
+                    self._instanceBudgetFractions[jsonFilename] = min(budgetFraction, self._instanceBudgetFractions.get(jsonFilename, 1.0))
+
     def _subInstanceIsTooSmallToInstance(self, subInstanceName):
         # type: (str) -> boolean
         """
@@ -85,15 +302,169 @@ class ElementConverter(ContentConverter):
         """
         return subInstanceName in ['xgGroundCover', 'xgPalmDebris', 'xgFlutes', 'xgDebris']
 
+    def _getInstancedSubInstances(self, subInstances):
+        # type: (dict or None) -> List[Tuple[str, str]]
+        """
+        Return the name and the absolute JSON file path of the given
+        sub-instances that are instantiated through a USD sub-instance Stage.
+        """
+        instancedSubInstances = []
+        if subInstances is not None:
+            for subInstanceName, subInstanceData in subInstances.items():
+                if subInstanceData.get('type') == 'archive' and not self._subInstanceIsTooSmallToInstance(subInstanceName):
+                    jsonFilename = os.path.join(self.SourceDirectoryPath, subInstanceData.get('jsonFile'))
+                    instancedSubInstances.append((subInstanceName, jsonFilename))
+                    self._subInstanceNames.setdefault(jsonFilename, set()).add(subInstanceName)
+        return instancedSubInstances
+
+    def _getElementInstanceJSONFiles(self, elementData):
+        # type: (dict) -> List[str]
+        """
+        Return the absolute paths of the instance JSON files referenced by the
+        given Element data, including those of its instanced copies.
+        """
+        elementInstancedPrimitives = elementData.get('instancedPrimitiveJsonFiles')
+        subInstancesList = [elementInstancedPrimitives]
+        for instanceData in (elementData.get('instancedCopies') or {}).values():
+            subInstancesList.append(instanceData.get('instancedPrimitiveJsonFiles', elementInstancedPrimitives))
+
+        return [
+            jsonFilename
+            for subInstances in subInstancesList
+            for _, jsonFilename in self._getInstancedSubInstances(subInstances)
+        ]
+
+    def _createPointInstancerSpec(self, layer, pointInstancerPrimSpecPath, prototypes, transformMatrices, protoIndices, extent=None):
+        # type: (pxr.Sdf.Layer, str, List[Tuple[str, str]], numpy.ndarray, numpy.ndarray, Tuple[numpy.ndarray, numpy.ndarray] or None) -> pxr.Sdf.PrimSpec
+        """
+        Create a PointInstancer at the given path of the given layer, placing
+        instances of the given prototypes using the given (N, 16) transform
+        matrices and prototype indices.
+
+        Prototypes are given as the name of the Prim referencing the USD
+        asset, along with the path of the OBJ file of the asset.
+        """
+        pointInstancerPrimSpec = Sdf.CreatePrimInLayer(layer, pointInstancerPrimSpecPath)
+        pointInstancerPrimSpec.specifier = Sdf.SpecifierDef
+        pointInstancerPrimSpec.typeName = 'PointInstancer'
+
+        # Decompose the transforms of all instances at once:
+        positions, orientations, scales = decomposeTransforms(transformMatrices)
+        self._createInstanceAttributeSpecs(pointInstancerPrimSpec, positions, orientations, scales, protoIndices)
+
+        if extent is not None:
+            self._createExtentSpec(pointInstancerPrimSpec, extent)
+
+        relationshipSpec = Sdf.RelationshipSpec(
+            pointInstancerPrimSpec,
+            'prototypes',
+            custom=False)
+
+        for prototypeName, assetOBJPath in prototypes:
+            meshReferencePrimSpecPath = pointInstancerPrimSpecPath + '/' + prototypeName
+            meshReferencePrimSpec = Sdf.CreatePrimInLayer(layer, meshReferencePrimSpecPath)
+            meshReferencePrimSpec.specifier = Sdf.SpecifierDef
+            meshReferencePrimSpec.typeName = 'Mesh'
+            relativeAssetFilePath = './' + os.path.relpath(
+                self._getAssetFilePathFromOBJFilePath(assetOBJPath),
+                self.PrimitivesDirectory
+            ).replace('\\', '/')
+            meshReferencePrimSpec.referenceList.Prepend( Sdf.Reference(relativeAssetFilePath) )
+
+            relationshipSpec.targetPathList.explicitItems.append(meshReferencePrimSpecPath)
+
+        return pointInstancerPrimSpec
+
+    def _createInstanceAttributeSpecs(self, pointInstancerPrimSpec, positions, orientations, scales, protoIndices):
+        # type: (pxr.Sdf.PrimSpec, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> None
+        """
+        Author the given positions, (i, j, k, real) orientations, scales and
+        prototype indices of instances on the given PointInstancer.
+        """
+        positionsAttribute = Sdf.AttributeSpec(
+            pointInstancerPrimSpec,
+            'positions',
+            Sdf.ValueTypeNames.Vector3fArray)
+        positionsAttribute.default = Vt.Vec3fArray.FromNumpy(positions)
+
+        orientationsAttribute = Sdf.AttributeSpec(
+            pointInstancerPrimSpec,
+            'orientations',
+            Sdf.ValueTypeNames.QuathArray)
+        orientationsAttribute.default = Vt.QuathArray.FromNumpy(orientations.astype(numpy.float16))
+
+        scalesAttribute = Sdf.AttributeSpec(
+            pointInstancerPrimSpec,
+            'scales',
+            Sdf.ValueTypeNames.Float3Array)
+        scalesAttribute.default = Vt.Vec3fArray.FromNumpy(scales)
+
+        protoIndicesAttribute = Sdf.AttributeSpec(
+            pointInstancerPrimSpec,
+            'protoIndices',
+            Sdf.ValueTypeNames.IntArray)
+        protoIndicesAttribute.default = Vt.IntArray.FromNumpy(numpy.asarray(protoIndices, dtype=numpy.int32))
+
+    def _createExtentSpec(self, primSpec, extent):
+        # type: (pxr.Sdf.PrimSpec, Tuple[numpy.ndarray, numpy.ndarray]) -> None
+        """
+        Author the given minimum and maximum corners as the extent of the given
+        Prim.
+        """
+        extentAttribute = Sdf.AttributeSpec(
+            primSpec,
+            UsdGeom.Tokens.extent,
+            Sdf.ValueTypeNames.Float3Array)
+        extentAttribute.default = Vt.Vec3fArray.FromNumpy(numpy.array(extent, dtype=numpy.float32))
+
+    def _createPointInstancerCellSpecs(self, layer, cellsPrimSpecPath, prototypes, transformMatrices, protoIndices):
+        # type: (pxr.Sdf.Layer, str, List[Tuple[str, str]], numpy.ndarray, numpy.ndarray) -> None
+        """
+        Create PointInstancers of the given prototypes under an Xform at the
+        given path of the given layer, one for each cell of a grid holding
+        about `maxCellInstanceCount` instances.
+
+        Each cell carries the extent of its instances, and only lists the
+        prototypes it instances, so that it can be culled without being
+        loaded. When payloads are used, the content of each cell is authored
+        under an abstract Prim of the same layer, and brought in as an internal
+        payload of the cell.
+        """
+        cellsPrimSpec = Sdf.CreatePrimInLayer(layer, cellsPrimSpecPath)
+        cellsPrimSpec.specifier = Sdf.SpecifierDef
+        cellsPrimSpec.typeName = 'Xform'
+
+        extentMins, extentMaxs = self._getInstanceExtents(prototypes, transformMatrices, protoIndices)
+        cells = splitPointsIntoTiles(transformMatrices[:, 12:15], self._maxCellInstanceCount)
+        for cellCoordinates, instanceIndices in cells:
+            cellPrimSpecPath = cellsPrimSpecPath + '/' + self._getCellName(cellCoordinates)
+            cellExtent = (extentMins[instanceIndices].min(axis=0), extentMaxs[instanceIndices].max(axis=0))
+            cellProtoIndices = protoIndices[instanceIndices]
+            usedProtoIndices = numpy.unique(cellProtoIndices)
+            cellPrototypes = [prototypes[protoIndex] for protoIndex in usedProtoIndices]
+            cellProtoIndices = numpy.searchsorted(usedProtoIndices, cellProtoIndices)
+
+            if not self._useCellPayloads:
+                self._createPointInstancerSpec(layer, cellPrimSpecPath, cellPrototypes, transformMatrices[instanceIndices], cellProtoIndices, cellExtent)
+                continue
+
+            cellPayloadPrimSpecPath = cellPrimSpecPath.replace('/' + self._instancersPrimName + '/', '/' + self._cellPayloadsPrimName + '/', 1)
+            cellPayloadPrimSpec = self._createPointInstancerSpec(layer, cellPayloadPrimSpecPath, cellPrototypes, transformMatrices[instanceIndices], cellProtoIndices, cellExtent)
+            cellPayloadPrimSpec.nameParent.specifier = Sdf.SpecifierDef
+            # The content of the cells is only composed through their payloads:
+            cellPayloadPrimSpec.nameParent.nameParent.specifier = Sdf.SpecifierClass
+
+            cellPrimSpec = Sdf.CreatePrimInLayer(layer, cellPrimSpecPath)
+            cellPrimSpec.specifier = Sdf.SpecifierDef
+            cellPrimSpec.typeName = 'PointInstancer'
+            self._createExtentSpec(cellPrimSpec, cellExtent)
+            cellPrimSpec.payloadList.Prepend( Sdf.Payload(primPath=cellPayloadPrimSpecPath) )
+
     def _parseInstanceJSONFile(self, jsonFilename, subInstanceStageFilePath):
         # type: (str, str) -> None
         """
         Create USD Prim instances from the given Element JSON file.
         """
-        with open(jsonFilename, 'r') as f:
-            jsonData = json.load(f)
-
-
         layer = Sdf.Layer.CreateAnonymous(self.USDFileExtension)
 
         # Leverage the SDF API instead of the USD API in order to batch-create
@@ -102,107 +473,184 @@ class ElementConverter(ContentConverter):
         # instances -- which is the case here (sometimes upwards of a million
         # instances).
         with Sdf.ChangeBlock():
-            instancersPrimSpecPath = '/Instancers'
+            instancersPrimSpecPath = '/' + self._instancersPrimName
             instancersPrimSpec = Sdf.CreatePrimInLayer(layer, instancersPrimSpecPath)
             instancersPrimSpec.specifier = Sdf.SpecifierDef
-            layer.defaultPrim = 'Instancers'
-
-            for name, instances in jsonData.items():
-                pointInstancerPrimSpecPath = instancersPrimSpecPath + '/' + self._getFileBasename(name)
-                pointInstancerPrimSpec = Sdf.CreatePrimInLayer(layer, pointInstancerPrimSpecPath)
-                pointInstancerPrimSpec.specifier = Sdf.SpecifierDef
-                pointInstancerPrimSpec.typeName = 'PointInstancer'
-
-                positionsBuffer = []
-                orientationsBuffer = []
-                for instanceName, instanceTransform in instances.items():
-                    transformMatrix = Gf.Matrix4d(*instanceTransform)
-                    positionsBuffer.append(transformMatrix.ExtractTranslation())
-
-                    quaternion = transformMatrix.ExtractRotation().GetQuaternion().GetNormalized()
-                    imaginaryComponents = quaternion.GetImaginary()
-                    orientationsBuffer.append(
-                        Gf.Quath(
-                            quaternion.GetReal(),
-                            Gf.Vec3h(imaginaryComponents[0], imaginaryComponents[1], imaginaryComponents[2])
-                        )
-                    )
-
-                positionsAttribute = Sdf.AttributeSpec(
-                    pointInstancerPrimSpec,
-                    'positions',
-                    Sdf.ValueTypeNames.Vector3fArray)
-                positionsAttribute.default = positionsBuffer
-
-                orientationsAttribute = Sdf.AttributeSpec(
-                    pointInstancerPrimSpec,
-                    'orientations',
-                    Sdf.ValueTypeNames.QuathArray)
-                orientationsAttribute.default = orientationsBuffer
-
-                protoIndicesAttribute = Sdf.AttributeSpec(
-                    pointInstancerPrimSpec,
-                    'protoIndices',
-                    Sdf.ValueTypeNames.IntArray)
-                protoIndicesAttribute.default = [0] * len(instances.items())
-
-                meshReferencePrimSpecPath = pointInstancerPrimSpecPath + '/mesh'
-                meshReferencePrimSpec = Sdf.CreatePrimInLayer(layer, meshReferencePrimSpecPath)
-                meshReferencePrimSpec.specifier = Sdf.SpecifierDef
-                meshReferencePrimSpec.typeName = 'Mesh'
-                relativeAssetFilePath = './' + os.path.relpath(
-                    self._getAssetFilePathFromOBJFilePath(name),
-                    self.PrimitivesDirectory
-                ).replace('\\', '/')
-                meshReferencePrimSpec.referenceList.Prepend( Sdf.Reference(relativeAssetFilePath) )
-
-                relationshipSpec = Sdf.RelationshipSpec(
-                    pointInstancerPrimSpec,
-                    'prototypes',
-                    custom=False)
-                relationshipSpec.targetPathList.explicitItems.append(meshReferencePrimSpecPath)
+            layer.defaultPrim = self._instancersPrimName
+
+            # Stream the transforms of each archive instead of loading the
+            # whole JSON document, which can be hundreds of megabytes (or
+            # read them back from the cache of decoded transforms):
+            if self._arrayCache is not None:
+                archives = getCachedInstanceTransformsForFile(jsonFilename, self._arrayCache)
+            else:
+                archives = iterInstanceTransforms(jsonFilename)
+            archives = self._thinInstances(jsonFilename, archives)
+
+            if self._mergeInstancers:
+                # Gather the instances of all archives in a single
+                # PointInstancer, with one prototype per archive:
+                archiveNames, transformMatrices, protoIndices = concatenateInstanceTransforms(archives)
+                prototypes = [(self._getFileBasename(name), name) for name in archiveNames]
+                instancerBatches = [(self._getFileBasename(jsonFilename), prototypes, transformMatrices, protoIndices)]
+            else:
+                instancerBatches = (
+                    (self._getFileBasename(name), [('mesh', name)], transformMatrices, numpy.zeros(len(transformMatrices), dtype=numpy.int32))
+                    for name, transformMatrices in archives
+                )
+
+            for instancerName, prototypes, transformMatrices, protoIndices in instancerBatches:
+                pointInstancerPrimSpecPath = instancersPrimSpecPath + '/' + instancerName
+                if 0 < self._maxCellInstanceCount < len(transformMatrices):
+                    self._createPointInstancerCellSpecs(layer, pointInstancerPrimSpecPath, prototypes, transformMatrices, protoIndices)
+                else:
+                    self._createPointInstancerSpec(layer, pointInstancerPrimSpecPath, prototypes, transformMatrices, protoIndices)
 
         layer.Export(subInstanceStageFilePath, comment='')
 
-    def _createInstance(self, stage, sdfPath, transform, subInstances, geometryFile):
-        # type: (pxr.Usd.Stage, str, List[float], dict, str) -> None
+    def _createInstance(self, layer, primPath, transform, subInstances, geometryFile):
+        # type: (pxr.Sdf.Layer, pxr.Sdf.Path, List[float], dict, str) -> None
         """
         Create instances for the given geometry instances.
         """
-        geoPrim = UsdGeom.Xform.Define(stage, sdfPath)
-        geoPrim.AddTransformOp().Set(Gf.Matrix4d(*transform))
+        geoPrimSpec = Sdf.CreatePrimInLayer(layer, primPath)
+        geoPrimSpec.specifier = Sdf.SpecifierDef
+        geoPrimSpec.typeName = 'Xform'
+
+        transformAttribute = Sdf.AttributeSpec(
+            geoPrimSpec,
+            'xformOp:transform',
+            Sdf.ValueTypeNames.Matrix4d)
+        transformAttribute.default = Gf.Matrix4d(*transform)
+        xformOpOrderAttribute = Sdf.AttributeSpec(
+            geoPrimSpec,
+            UsdGeom.Tokens.xformOpOrder,
+            Sdf.ValueTypeNames.TokenArray,
+            Sdf.VariabilityUniform)
+        xformOpOrderAttribute.default = Vt.TokenArray(['xformOp:transform'])
 
         # Create geometry mesh:
         if geometryFile:
             geometryUSDFile = self._getAssetFilePathFromOBJFilePath(geometryFile)
             relativeGeometryUSDFile = os.path.relpath(
                 geometryUSDFile,
-                self.PrimitivesDirectory)
-            geoPrim.GetPrim().GetReferences().AddReference('./' + relativeGeometryUSDFile)
-
-        if subInstances is not None:
-            with tqdm(total=len(subInstances.items()), desc='Creating instances', ncols=self.ProgressBarWidth, position=self._SUBINSTANCE_PB_INDEX, leave=None) as progressBar:
-                for subInstanceName, subInstanceData in subInstances.items():
-                    progressBar.set_description('Instantiating {subInstanceName}'.format(subInstanceName=subInstanceName))
-
-                    if subInstanceData.get('type') == 'archive' and not self._subInstanceIsTooSmallToInstance(subInstanceName):
-                        jsonFilename = os.path.join(self.SourceDirectoryPath, subInstanceData.get('jsonFile'))
-
-                        # Get USD Stage name from the JSON file:
-                        subInstanceStageFilePath = self._getAssetSubInstanceStageFilePath(jsonFilename)
-
-                        if not os.path.exists(subInstanceStageFilePath):
-                            self._parseInstanceJSONFile(jsonFilename, subInstanceStageFilePath)
-
-                        # Reference subDir Stage:
-                        subPrim = stage.DefinePrim(sdfPath.AppendChild(subInstanceName))
-                        relativeSubInstancesStageFilePath = os.path.relpath(
-                            subInstanceStageFilePath,
-                            self.PrimitivesDirectory
-                        )
-                        subPrim.GetReferences().AddReference('./' + relativeSubInstancesStageFilePath)
+                self.PrimitivesDirectory).replace('\\', '/')
+            geoPrimSpec.referenceList.Prepend( Sdf.Reference('./' + relativeGeometryUSDFile) )
+
+        # Reference the sub-instance Stages, created beforehand:
+        for subInstanceName, jsonFilename in self._getInstancedSubInstances(subInstances):
+            subInstanceStageFilePath = self._getAssetSubInstanceStageFilePath(jsonFilename)
+            subPrimSpec = Sdf.CreatePrimInLayer(layer, primPath.AppendChild(subInstanceName))
+            subPrimSpec.specifier = Sdf.SpecifierDef
+            relativeSubInstancesStageFilePath = os.path.relpath(
+                subInstanceStageFilePath,
+                self.PrimitivesDirectory
+            )
+            subPrimSpec.referenceList.Prepend( Sdf.Reference('./' + relativeSubInstancesStageFilePath) )
+
+    def _getCompatibleCopyMask(self, geometryFile, transformMatrices, positions, orientations, scales):
+        # type: (str or None, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+        """
+        Return whether each of the given (N, 16) transform matrices of
+        instanced copies is reproduced by the given PointInstancer positions,
+        orientations and scales, within `COLLAPSED_COPY_TOLERANCE` of the size
+        of the geometry of the given OBJ file.
+
+        Transforms with shear cannot be decomposed into PointInstancer
+        attributes, and quantized orientations lose precision far away from
+        the pivot of the copies, so that not all copies can be collapsed.
+        """
+        extent = self._getAssetExtent(geometryFile) if geometryFile else None
+        if extent is None:
+            extent = numpy.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+        corners = numpy.array([[x, y, z, 1.0] for x in extent[:, 0] for y in extent[:, 1] for z in extent[:, 2]])
+        extentSize = numpy.linalg.norm(extent[1] - extent[0])
+        tolerance = COLLAPSED_COPY_TOLERANCE * (extentSize if extentSize > 0 else 1.0)
+
+        composedMatrices = composeTransforms(positions, orientations, scales).reshape(-1, 4, 4)
+        deviations = numpy.einsum('cj,njk->nck', corners, transformMatrices.reshape(-1, 4, 4) - composedMatrices)
+        return numpy.abs(deviations[:, :, :3]).max(axis=(1, 2)) <= tolerance
+
+    def _getInstancedCopyGroups(self, instancedCopies, subInstances, geometryFile):
+        # type: (dict, dict, str) -> List[Tuple[str, dict, List[str]]]
+        """
+        Return the (geometry file, sub-instances, copy names) groups of the
+        given instanced copies sharing the same content, starting with the
+        copies sharing the given content of their Element.
+        """
+        elementGroupKey = (geometryFile, json.dumps(subInstances, sort_keys=True))
+        copyGroups = collections.OrderedDict([(elementGroupKey, (geometryFile, subInstances, []))])
+        for instanceName in sorted(instancedCopies):
+            instanceData = instancedCopies[instanceName]
+            copyGeometryFile = instanceData.get('geomObjFile', geometryFile)
+            copySubInstances = instanceData.get('instancedPrimitiveJsonFiles', subInstances)
+            groupKey = (copyGeometryFile, json.dumps(copySubInstances, sort_keys=True))
+            if groupKey not in copyGroups:
+                copyGroups[groupKey] = (copyGeometryFile, copySubInstances, [])
+            copyGroups[groupKey][2].append(instanceName)
+        return list(copyGroups.values())
+
+    def _createCollapsedInstancedCopies(self, layer, rootPrimPath, instancedCopies, subInstances, geometryFile):
+        # type: (pxr.Sdf.Layer, pxr.Sdf.Path, dict, dict, str) -> Set[str]
+        """
+        Create a PointInstancer for each group of the given instanced copies
+        sharing the same geometry and sub-instances, under the given root Prim,
+        and return the names of the copies they place.
 
-                    progressBar.update()
+        Copies whose transform cannot be reproduced by a PointInstancer, or
+        whose content is shared by too few copies, are left to be created as
+        individual Prims.
+        """
+        collapsedInstanceNames = set()
+        pointInstancerCount = 0
+        for copyGeometryFile, copySubInstances, copyNames in self._getInstancedCopyGroups(instancedCopies, subInstances, geometryFile):
+            if len(copyNames) < COLLAPSED_COPY_MIN_COUNT:
+                continue
+
+            transformMatrices = numpy.array(
+                [instancedCopies[instanceName].get('transformMatrix') for instanceName in copyNames],
+                dtype=numpy.float64).reshape(-1, 16)
+            positions, orientations, scales = decomposeTransforms(transformMatrices)
+            # Orientations are validated as authored, at half precision:
+            orientations = orientations.astype(numpy.float16)
+            compatibleMask = self._getCompatibleCopyMask(copyGeometryFile, transformMatrices, positions, orientations, scales)
+            if compatibleMask.sum() < COLLAPSED_COPY_MIN_COUNT:
+                continue
+
+            pointInstancerPrimName = self._instancedCopiesPrimName
+            if pointInstancerCount > 0:
+                pointInstancerPrimName += '_{}'.format(pointInstancerCount)
+            pointInstancerCount += 1
+            pointInstancerPrimSpecPath = rootPrimPath.AppendChild(pointInstancerPrimName)
+            pointInstancerPrimSpec = Sdf.CreatePrimInLayer(layer, pointInstancerPrimSpecPath)
+            pointInstancerPrimSpec.specifier = Sdf.SpecifierDef
+            pointInstancerPrimSpec.typeName = 'PointInstancer'
+            self._createInstanceAttributeSpecs(
+                pointInstancerPrimSpec,
+                positions[compatibleMask],
+                orientations[compatibleMask],
+                scales[compatibleMask],
+                numpy.zeros(int(compatibleMask.sum()), dtype=numpy.int32))
+
+            # The prototype holds the content shared by the copies, without
+            # the transform of the Element:
+            prototypePrimSpecPath = pointInstancerPrimSpecPath.AppendChild('prototype')
+            self._createInstance(
+                layer=layer,
+                primPath=prototypePrimSpecPath,
+                transform=numpy.identity(4).reshape(-1).tolist(),
+                subInstances=copySubInstances,
+                geometryFile=copyGeometryFile)
+
+            relationshipSpec = Sdf.RelationshipSpec(
+                pointInstancerPrimSpec,
+                'prototypes',
+                custom=False)
+            relationshipSpec.targetPathList.explicitItems.append(prototypePrimSpecPath)
+
+            collapsedInstanceNames.update(instanceName for instanceName, isCompatible in zip(copyNames, compatibleMask) if isCompatible)
+
+        return collapsedInstanceNames
 
     def _processElementData(self, elementData):
         # type: (dict) -> None
@@ -216,72 +664,194 @@ class ElementConverter(ContentConverter):
         elementInstancedPrimitives = elementData.get('instancedPrimitiveJsonFiles')
         elementInstancedCopies = elementData.get('instancedCopies')
 
-        elementStageFilePath = self.getElementStageFilePath(elementName)
-        elementStage = Usd.Stage.CreateNew(elementStageFilePath, load=Usd.Stage.LoadNone)
-        rootPrimPath = '/' + elementName
-        rootPrim = elementStage.DefinePrim(rootPrimPath, 'Xform')
-        elementStage.SetDefaultPrim(rootPrim)
-
-        # Create main Prim:
-        self._createInstance(
-            stage=elementStage,
-            sdfPath=rootPrim.GetPath().AppendChild(elementName),
-            transform=elementTransformMatrix,
-            subInstances=elementInstancedPrimitives,
-            geometryFile=elementOBJFile)
-
-        # Create instanced copies:
-        if elementInstancedCopies:
-            for instanceName, instanceData in elementInstancedCopies.items():
-                self._createInstance(
-                    stage=elementStage,
-                    sdfPath=rootPrim.GetPath().AppendChild(instanceName),
-                    transform=instanceData.get('transformMatrix'),
-                    subInstances=instanceData.get('instancedPrimitiveJsonFiles', elementInstancedPrimitives),
-                    geometryFile=instanceData.get('geomObjFile', elementOBJFile))
-
-        elementStage.GetRootLayer().Save()
-
-    def _handleElementFile(self, elementJSONFile):
-        # type: (str) -> None
+        layer = Sdf.Layer.CreateAnonymous(self.USDFileExtension)
+
+        # Author the Element through the SDF API, as some Elements have
+        # thousands of instanced copies for which fanning out change
+        # notifications would dominate the conversion time:
+        with Sdf.ChangeBlock():
+            rootPrimPath = Sdf.Path('/' + elementName)
+            rootPrimSpec = Sdf.CreatePrimInLayer(layer, rootPrimPath)
+            rootPrimSpec.specifier = Sdf.SpecifierDef
+            rootPrimSpec.typeName = 'Xform'
+            layer.defaultPrim = elementName
+
+            # Create main Prim:
+            self._createInstance(
+                layer=layer,
+                primPath=rootPrimPath.AppendChild(elementName),
+                transform=elementTransformMatrix,
+                subInstances=elementInstancedPrimitives,
+                geometryFile=elementOBJFile)
+
+            # Create instanced copies:
+            if elementInstancedCopies:
+                collapsedInstanceNames = set()
+                if self._collapseInstancedCopies:
+                    collapsedInstanceNames = self._createCollapsedInstancedCopies(
+                        layer,
+                        rootPrimPath,
+                        elementInstancedCopies,
+                        elementInstancedPrimitives,
+                        elementOBJFile)
+
+                for instanceName, instanceData in elementInstancedCopies.items():
+                    if instanceName in collapsedInstanceNames:
+                        continue
+                    self._createInstance(
+                        layer=layer,
+                        primPath=rootPrimPath.AppendChild(instanceName),
+                        transform=instanceData.get('transformMatrix'),
+                        subInstances=instanceData.get('instancedPrimitiveJsonFiles', elementInstancedPrimitives),
+                        geometryFile=instanceData.get('geomObjFile', elementOBJFile))
+
+        layer.Export(self.getElementStageFilePath(elementName), comment='')
+
+    def _readElementFile(self, elementJSONFile):
+        # type: (str) -> dict
         """
-        Handle a single Element JSON file.
+        Return the data of a single Element JSON file.
         """
         with open(elementJSONFile, 'r') as f:
-            elementData = json.load(f)
-        self._processElementData(elementData)
+            return json.load(f)
+
+    def _recordInstanceLayer(self, jsonFilename):
+        # type: (str) -> None
+        """
+        Record the USD sub-instance Stage of the given instance JSON file in
+        the build manifest.
+        """
+        metadata = None
+        if jsonFilename in self._instanceCounts:
+            metadata = {'instanceCount': self._instanceCounts[jsonFilename]}
+        self._buildManifest.Record(self._getAssetSubInstanceStageFilePath(jsonFilename), self._getInstanceLayerInputFilePaths(jsonFilename), self._getBuildOptions(jsonFilename), metadata)
+
+    def _createInstanceLayer(self, jsonFilename):
+        # type: (str) -> None
+        """
+        Create the USD sub-instance Stage of the given instance JSON file.
+        """
+        self._parseInstanceJSONFile(jsonFilename, self._getAssetSubInstanceStageFilePath(jsonFilename))
+
+    def _createInstanceLayers(self, jsonFilenames):
+        # type: (List[str]) -> None
+        """
+        Create the USD sub-instance Stages of the given instance JSON files,
+        skipping those that are already up to date, and save the build
+        manifest once they are created (or failed to be) before reporting
+        failures.
+        """
+        try:
+            outdatedJSONFilenames = [
+                jsonFilename
+                for jsonFilename in jsonFilenames
+                if not self._buildManifest.IsUpToDate(self._getAssetSubInstanceStageFilePath(jsonFilename), self._getInstanceLayerInputFilePaths(jsonFilename), self._getBuildOptions(jsonFilename))
+            ]
+
+            if self._jobs > 1:
+                failedJSONFilenames = self._createInstanceLayersInParallel(outdatedJSONFilenames)
+            else:
+                failedJSONFilenames = []
+                with tqdm(total=len(outdatedJSONFilenames), desc='Creating instances', ncols=self.ProgressBarWidth, position=self._SUBINSTANCE_PB_INDEX, leave=None) as progressBar:
+                    for jsonFilename in outdatedJSONFilenames:
+                        progressBar.set_description('Instantiating {jsonName}'.format(jsonName=self._getFileBasename(jsonFilename)))
+                        try:
+                            self._createInstanceLayer(jsonFilename)
+                        except Exception:
+                            failedJSONFilenames.append((jsonFilename, traceback.format_exc()))
+                        else:
+                            self._recordInstanceLayer(jsonFilename)
+                        progressBar.update()
+        finally:
+            self._buildManifest.Save()
+
+        if failedJSONFilenames:
+            raise ConversionError('create the instances of', failedJSONFilenames)
+
+    def _createInstanceLayersInParallel(self, jsonFilenames):
+        # type: (List[str]) -> List[Tuple[str, str]]
+        """
+        Create the USD sub-instance Stages of the given instance JSON files
+        using a pool of worker processes, returning the (JSON file path,
+        traceback) of the ones that could not be created.
+
+        The largest files are submitted first, so that the longest conversions
+        do not end up running alone at the end of the batch. A failure to
+        convert a file does not interrupt the conversion of the others.
+        """
+        jsonFilenames = sorted(jsonFilenames, key=self.Catalog.GetFileSize, reverse=True)
+
+        failedJSONFilenames = []
+        pool = multiprocessing.Pool(
+            processes=min(self._jobs, max(len(jsonFilenames), 1)),
+            initializer=_initializeInstanceLayerWorker,
+            initargs=(self,))
+        try:
+            with tqdm(total=len(jsonFilenames), desc='Creating instances', ncols=self.ProgressBarWidth, position=self._SUBINSTANCE_PB_INDEX, leave=None) as progressBar:
+                for jsonFilename, error in pool.imap_unordered(_createInstanceLayerInWorker, jsonFilenames, chunksize=1):
+                    if error is not None:
+                        failedJSONFilenames.append((jsonFilename, error))
+                    else:
+                        self._recordInstanceLayer(jsonFilename)
+                    progressBar.set_description('Instantiated {jsonName}'.format(jsonName=self._getFileBasename(jsonFilename)))
+                    progressBar.update()
+        finally:
+            pool.close()
+            pool.join()
+
+        return failedJSONFilenames
 
     def _createElements(self):
         # type: () -> None
         """
         Create instances for all scene Elements.
+
+        The USD sub-instance Stages are independent from one another, and are
+        created first (once per instance JSON file, as it may be shared by
+        several instanced copies) before the Element Stages referencing them
+        are assembled.
         """
-        elementJSONFiles = [
-            ('isBayCedarA1', os.path.join(self.SourceDirectoryPath, 'json', 'isBayCedarA1', 'isBayCedarA1.json')),
-            ('isBeach', os.path.join(self.SourceDirectoryPath, 'json', 'isBeach', 'isBeach.json')),
-            ('isCoastline', os.path.join(self.SourceDirectoryPath, 'json', 'isCoastline', 'isCoastline.json')),
-            ('isCoral', os.path.join(self.SourceDirectoryPath, 'json', 'isCoral', 'isCoral.json')),
-            ('isDunesA', os.path.join(self.SourceDirectoryPath, 'json', 'isDunesA', 'isDunesA.json')),
-            ('isDunesB', os.path.join(self.SourceDirectoryPath, 'json', 'isDunesB', 'isDunesB.json')),
-            ('isGardeniaA', os.path.join(self.SourceDirectoryPath, 'json', 'isGardeniaA', 'isGardeniaA.json')),
-            ('isHibiscus', os.path.join(self.SourceDirectoryPath, 'json', 'isHibiscus', 'isHibiscus.json')),
-            ('isHibiscusYoung', os.path.join(self.SourceDirectoryPath, 'json', 'isHibiscusYoung', 'isHibiscusYoung.json')),
-            ('isIronwoodA1', os.path.join(self.SourceDirectoryPath, 'json', 'isIronwoodA1', 'isIronwoodA1.json')),
-            ('isIronwoodB', os.path.join(self.SourceDirectoryPath, 'json', 'isIronwoodB', 'isIronwoodB.json')),
-            ('isKava', os.path.join(self.SourceDirectoryPath, 'json', 'isKava', 'isKava.json')),
-            ('isLavaRocks', os.path.join(self.SourceDirectoryPath, 'json', 'isLavaRocks', 'isLavaRocks.json')),
-            ('isMountainA', os.path.join(self.SourceDirectoryPath, 'json', 'isMountainA', 'isMountainA.json')),
-            ('isMountainB', os.path.join(self.SourceDirectoryPath, 'json', 'isMountainB', 'isMountainB.json')),
-            ('isNaupakaA', os.path.join(self.SourceDirectoryPath, 'json', 'isNaupakaA', 'isNaupakaA.json')),
-            ('isPalmDead', os.path.join(self.SourceDirectoryPath, 'json', 'isPalmDead', 'isPalmDead.json')),
-            ('isPalmRig', os.path.join(self.SourceDirectoryPath, 'json', 'isPalmRig', 'isPalmRig.json')),
-            ('isPandanusA', os.path.join(self.SourceDirectoryPath, 'json', 'isPandanusA', 'isPandanusA.json')),
-            ('osOcean', os.path.join(self.SourceDirectoryPath, 'json', 'osOcean', 'osOcean.json'))
+        elementDataList = [
+            self._readElementFile(self.Catalog.GetElementJSONFilePath(elementName))
+            for elementName in self.Catalog.GetElementNames()
         ]
 
-
-        with tqdm(total=len(elementJSONFiles), desc='Processing Elements', ncols=self.ProgressBarWidth, position=self._ELEMENT_PB_INDEX, leave=None) as progressBar:
-            for elementName, elementJSONFile in elementJSONFiles:
-                progressBar.set_description('Processing Element {elementName}'.format(elementName=elementName))
-                self._handleElementFile(elementJSONFile)
+        jsonFilenames = []
+        for elementData in elementDataList:
+            for jsonFilename in self._getElementInstanceJSONFiles(elementData):
+                if jsonFilename not in jsonFilenames:
+                    jsonFilenames.append(jsonFilename)
+        self._computeInstanceBudgetFractions(elementDataList)
+        self._createInstanceLayers(jsonFilenames)
+
+        with tqdm(total=len(elementDataList), desc='Processing Elements', ncols=self.ProgressBarWidth, position=self._ELEMENT_PB_INDEX, leave=None) as progressBar:
+            for elementData in elementDataList:
+                progressBar.set_description('Processing Element {elementName}'.format(elementName=elementData.get('name')))
+                self._processElementData(elementData)
                 progressBar.update()
+
+
+# ElementConverter used by the current worker process, when creating USD
+# sub-instance Stages in parallel:
+_workerElementConverter = None
+
+def _initializeInstanceLayerWorker(elementConverter):
+    # type: (ElementConverter) -> None
+    """
+    Set the ElementConverter to use in the current worker process.
+    """
+    global _workerElementConverter
+    _workerElementConverter = elementConverter
+
+def _createInstanceLayerInWorker(jsonFilename):
+    # type: (str) -> Tuple[str, str or None]
+    """
+    Create the USD sub-instance Stage of the given instance JSON file in the
+    current worker process, returning the traceback of the error that
+    occurred, if any.
+    """
+    try:
+        _workerElementConverter._createInstanceLayer(jsonFilename)
+    except Exception:
+        return (jsonFilename, traceback.format_exc())
+    return (jsonFilename, None)
@@ -85,9 +85,7 @@ class LightConverter(ContentConverter):
         Create a USD Stage containing USD lights, build from the light
         definitions contained in JSON format in the Moana Island Scene dataset.
         """
-        lightJSONFiles = [
-            os.path.join(self.SourceDirectoryPath, 'json', 'lights', 'lights.json')
-        ]
+        lightJSONFiles = self.Catalog.GetLightJSONFilePaths()
 
         # Create USD Stage containing only references to lights:
         lightStage = Usd.Stage.CreateInMemory(load=Usd.Stage.LoadNone)
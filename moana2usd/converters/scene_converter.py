@@ -7,6 +7,10 @@ Moana Island Scene conversion from OBJ and JSON to USD.
 import os
 
 from moana2usd.converters.base_converter import ContentConverter
+from moana2usd.converters.build_manifest import BuildManifest
+from moana2usd.dataset.array_cache import ArrayCache
+from moana2usd.dataset.catalog import DatasetCatalog
+from moana2usd.dataset.material_database import getSharedMaterialDatabase
 
 from pxr import Gf, Sdf, Usd, UsdLux
 from tqdm import tqdm
@@ -22,34 +26,70 @@ class SceneConverter(ContentConverter):
     Converter for the Moana Island Scene into USD.
     """
 
-    def __init__(self, fileFormat, sourceDirectoryPath, destinationDirectoryPath, loadTextures=True, omitSmallInstances=False):
-        # type: (str, str, str, boolean, boolean) -> SceneConverter
+    def __init__(self, fileFormat, sourceDirectoryPath, destinationDirectoryPath, loadTextures=True, omitSmallInstances=False, jobs=1, parserJobs=1, cacheDirectoryPath=None, cacheMaxSize=None, usePayloads=False, useElementPayloads=False, proxyResolution=0, maxMeshFaceCount=0, shareMeshes=False, maxCellInstanceCount=0, useCellPayloads=False, mergeInstancers=False, collapseInstancedCopies=False, instanceKeepFractions=None, maxElementInstanceCount=0):
+        # type: (str, str, str, boolean, boolean, int, int, str, int, boolean, boolean, int, int, boolean, int, boolean, boolean, boolean, Dict[str, float], int) -> SceneConverter
         """
         Initialize the converter using the provided USD file format, dataset
         source directory path and destination folder path.
         """
-        super(SceneConverter, self).__init__(fileFormat, sourceDirectoryPath, destinationDirectoryPath)
+        super(SceneConverter, self).__init__(
+            fileFormat,
+            sourceDirectoryPath,
+            destinationDirectoryPath,
+            DatasetCatalog(
+                sourceDirectoryPath,
+                indexFilePath=os.path.join(destinationDirectoryPath, 'moana2usd_catalog.json'),
+                jobs=jobs))
 
         self._loadTextures = loadTextures
+        self._useElementPayloads = useElementPayloads
+
+        self._buildManifest = BuildManifest(destinationDirectoryPath, sourceDirectoryPath)
+
+        arrayCache = None
+        if cacheDirectoryPath is not None:
+            arrayCache = ArrayCache(cacheDirectoryPath, maxSizeBytes=cacheMaxSize)
 
         self._cameraConverter = CameraConverter(
             fileFormat=fileFormat,
             sourceDirectoryPath=sourceDirectoryPath,
-            destinationDirectoryPath=destinationDirectoryPath)
+            destinationDirectoryPath=destinationDirectoryPath,
+            catalog=self.Catalog)
         self._lightConverter = LightConverter(
             fileFormat=fileFormat,
             sourceDirectoryPath=sourceDirectoryPath,
-            destinationDirectoryPath=destinationDirectoryPath)
+            destinationDirectoryPath=destinationDirectoryPath,
+            catalog=self.Catalog)
         self._assetConverter = AssetConverter(
             fileFormat=fileFormat,
             sourceDirectoryPath=sourceDirectoryPath,
             destinationDirectoryPath=destinationDirectoryPath,
-            loadTextures=loadTextures)
+            loadTextures=loadTextures,
+            parserJobs=parserJobs,
+            arrayCache=arrayCache,
+            materialDatabase=getSharedMaterialDatabase(sourceDirectoryPath),
+            jobs=jobs,
+            buildManifest=self._buildManifest,
+            catalog=self.Catalog,
+            usePayloads=usePayloads,
+            proxyResolution=proxyResolution,
+            maxMeshFaceCount=maxMeshFaceCount,
+            shareMeshes=shareMeshes)
         self._elementConverter = ElementConverter(
             fileFormat=fileFormat,
             sourceDirectoryPath=sourceDirectoryPath,
             destinationDirectoryPath=destinationDirectoryPath,
-            omitSmallInstances=omitSmallInstances)
+            omitSmallInstances=omitSmallInstances,
+            buildManifest=self._buildManifest,
+            catalog=self.Catalog,
+            jobs=jobs,
+            arrayCache=arrayCache,
+            maxCellInstanceCount=maxCellInstanceCount,
+            useCellPayloads=useCellPayloads,
+            mergeInstancers=mergeInstancers,
+            collapseInstancedCopies=collapseInstancedCopies,
+            instanceKeepFractions=instanceKeepFractions,
+            maxElementInstanceCount=maxElementInstanceCount)
 
     def convert(self):
         # type: () -> None
@@ -76,6 +116,20 @@ class SceneConverter(ContentConverter):
 
         print('Done!')
 
+    def verify(self):
+        # type: () -> List[Tuple[str, str]]
+        """
+        Check the previously converted content against the build manifest,
+        returning the (output file path, reason) of outdated outputs.
+        """
+        staleOutputs = self._buildManifest.Verify()
+        for outputFilePath, reason in staleOutputs:
+            print('Outdated: "{outputFilePath}" ({reason})'.format(
+                outputFilePath=outputFilePath,
+                reason=reason))
+        print('{staleOutputCount} outdated output(s) found.'.format(staleOutputCount=len(staleOutputs)))
+        return staleOutputs
+
     def _createSceneStage(self):
         # type: () -> None
         """
@@ -84,28 +138,11 @@ class SceneConverter(ContentConverter):
         """
         subStageFilePaths = [
             ('cameras', self._cameraConverter.getCameraStageFilePath()),
-            ('lights', self._lightConverter.getLightStageFilePath()),
-            ('isBayCedarA1', self._elementConverter.getElementStageFilePath('isBayCedarA1')),
-            ('isBeach', self._elementConverter.getElementStageFilePath('isBeach')),
-            ('isCoastline', self._elementConverter.getElementStageFilePath('isCoastline')),
-            ('isCoral', self._elementConverter.getElementStageFilePath('isCoral')),
-            ('isDunesA', self._elementConverter.getElementStageFilePath('isDunesA')),
-            ('isDunesB', self._elementConverter.getElementStageFilePath('isDunesB')),
-            ('isGardeniaA', self._elementConverter.getElementStageFilePath('isGardeniaA')),
-            ('isHibiscus', self._elementConverter.getElementStageFilePath('isHibiscus')),
-            ('isHibiscusYoung', self._elementConverter.getElementStageFilePath('isHibiscusYoung')),
-            ('isIronwoodA1', self._elementConverter.getElementStageFilePath('isIronwoodA1')),
-            ('isIronwoodB', self._elementConverter.getElementStageFilePath('isIronwoodB')),
-            ('isKava', self._elementConverter.getElementStageFilePath('isKava')),
-            ('isLavaRocks', self._elementConverter.getElementStageFilePath('isLavaRocks')),
-            ('isMountainA', self._elementConverter.getElementStageFilePath('isMountainA')),
-            ('isMountainB', self._elementConverter.getElementStageFilePath('isMountainB')),
-            ('isNaupakaA', self._elementConverter.getElementStageFilePath('isNaupakaA')),
-            ('isPalmDead', self._elementConverter.getElementStageFilePath('isPalmDead')),
-            ('isPalmRig', self._elementConverter.getElementStageFilePath('isPalmRig')),
-            ('isPandanusA', self._elementConverter.getElementStageFilePath('isPandanusA')),
-            ('osOcean', self._elementConverter.getElementStageFilePath('osOcean'))
+            ('lights', self._lightConverter.getLightStageFilePath())
         ]
+        subStageFilePaths.extend(
+            (elementName, self._elementConverter.getElementStageFilePath(elementName))
+            for elementName in self.Catalog.GetElementNames())
 
         # List of Elements/Stages to set as "active" by default.
         #
@@ -149,7 +186,10 @@ class SceneConverter(ContentConverter):
 
                 elementPrimSpecPath = moanaIslandPrimSpecPath + '/' + elementName
                 elementPrimSpec = Sdf.CreatePrimInLayer(layer, elementPrimSpecPath)
-                elementPrimSpec.referenceList.Prepend( Sdf.Reference(relativeElementStagePath.replace('\\', '/')) )
+                if self._useElementPayloads and elementName not in ['cameras', 'lights']:
+                    elementPrimSpec.payloadList.Prepend( Sdf.Payload(relativeElementStagePath.replace('\\', '/')) )
+                else:
+                    elementPrimSpec.referenceList.Prepend( Sdf.Reference(relativeElementStagePath.replace('\\', '/')) )
 
                 if elementName not in activeElementNames:
                     elementPrimSpec.active = False
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+"""
+Persistent on-disk cache of arrays parsed from dataset files.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+import numpy
+
+
+class ArrayCache(object):
+    """
+    Cache of NumPy arrays (and small JSON metadata) derived from source files,
+    keyed by a fingerprint of the source file and of the version of the code
+    that produced them.
+
+    Each entry is a directory of `.npy` files, which are memory-mapped when
+    read back so that a warm cache costs about as much as reading the arrays
+    from disk. Least-recently used entries are evicted once the total size of
+    the cache exceeds its budget.
+    """
+
+    METADATA_FILE_NAME = 'metadata.json'
+
+    def __init__(self, cacheDirectoryPath, maxSizeBytes=None):
+        # type: (str, int or None) -> ArrayCache
+        """
+        Create a cache storing its entries in the given directory, using at
+        most the given number of bytes (or an unbounded size if `None`).
+        """
+        self._cacheDirectoryPath = cacheDirectoryPath
+        self._maxSizeBytes = maxSizeBytes
+
+    @property
+    def CacheDirectoryPath(self):
+        # type: () -> str
+        """
+        Return the directory path where cache entries are stored.
+        """
+        return self._cacheDirectoryPath
+
+    def GetKey(self, sourceFilePath, version):
+        # type: (str, str) -> str
+        """
+        Return the key of the entry for the given source file, as parsed by the
+        given version of a parser.
+
+        The key changes whenever the source file is moved, resized or
+        modified, or whenever the parser version changes.
+        """
+        sourceFilePath = os.path.abspath(sourceFilePath)
+        fileStat = os.stat(sourceFilePath)
+        fingerprint = '{sourceFilePath}|{size}|{mtime!r}|{version}'.format(
+            sourceFilePath=sourceFilePath,
+            size=fileStat.st_size,
+            mtime=fileStat.st_mtime,
+            version=version)
+        return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
+
+    def Load(self, sourceFilePath, version):
+        # type: (str, str) -> Tuple[Dict[str, numpy.ndarray], dict] or None
+        """
+        Return the memory-mapped arrays and the metadata cached for the given
+        source file, or `None` if no valid entry exists.
+        """
+        entryDirectoryPath = os.path.join(self._cacheDirectoryPath, self.GetKey(sourceFilePath, version))
+        metadataFilePath = os.path.join(entryDirectoryPath, self.METADATA_FILE_NAME)
+        try:
+            with open(metadataFilePath, 'r') as f:
+                entry = json.load(f)
+            arrays = {}
+            for arrayName in entry.get('arrays'):
+                arrays[arrayName] = self._loadArray(os.path.join(entryDirectoryPath, arrayName + '.npy'))
+        except (IOError, OSError, ValueError):
+            return None
+
+        # Mark the entry as recently used:
+        try:
+            os.utime(metadataFilePath, None)
+        except OSError:
+            pass
+
+        return (arrays, entry.get('metadata'))
+
+    def Store(self, sourceFilePath, version, arrays, metadata):
+        # type: (str, str, Dict[str, numpy.ndarray], dict) -> None
+        """
+        Cache the given arrays and JSON-serializable metadata for the given
+        source file, then evict old entries if the cache is over budget.
+        """
+        key = self.GetKey(sourceFilePath, version)
+        entryDirectoryPath = os.path.join(self._cacheDirectoryPath, key)
+        if os.path.isdir(entryDirectoryPath):
+            return
+
+        # Write the entry in a temporary directory first, so that concurrent
+        # or interrupted runs never observe partially-written entries:
+        temporaryDirectoryPath = '{entryDirectoryPath}.{pid}.tmp'.format(
+            entryDirectoryPath=entryDirectoryPath,
+            pid=os.getpid())
+        if not os.path.isdir(temporaryDirectoryPath):
+            os.makedirs(temporaryDirectoryPath)
+        try:
+            for arrayName, array in arrays.items():
+                numpy.save(os.path.join(temporaryDirectoryPath, arrayName + '.npy'), numpy.ascontiguousarray(array))
+            with open(os.path.join(temporaryDirectoryPath, self.METADATA_FILE_NAME), 'w') as f:
+                json.dump({
+                    'sourceFilePath': os.path.abspath(sourceFilePath),
+                    'version': version,
+                    'arrays': sorted(arrays.keys()),
+                    'metadata': metadata
+                }, f)
+            os.rename(temporaryDirectoryPath, entryDirectoryPath)
+        except OSError:
+            # Another process may have stored the same entry in the meantime:
+            if not os.path.isdir(entryDirectoryPath):
+                raise
+        finally:
+            shutil.rmtree(temporaryDirectoryPath, ignore_errors=True)
+
+        self.Evict(keep=key)
+
+    def Evict(self, keep=None):
+        # type: (str or None) -> None
+        """
+        Remove the least-recently used entries until the cache fits in its
+        budget, never removing the entry with the given key.
+        """
+        if self._maxSizeBytes is None or not os.path.isdir(self._cacheDirectoryPath):
+            return
+
+        entries = []
+        totalSize = 0
+        for key in os.listdir(self._cacheDirectoryPath):
+            entryDirectoryPath = os.path.join(self._cacheDirectoryPath, key)
+            metadataFilePath = os.path.join(entryDirectoryPath, self.METADATA_FILE_NAME)
+            if not os.path.isfile(metadataFilePath):
+                continue
+            entrySize = 0
+            for fileName in os.listdir(entryDirectoryPath):
+                entrySize += os.path.getsize(os.path.join(entryDirectoryPath, fileName))
+            entries.append((os.path.getmtime(metadataFilePath), key, entrySize))
+            totalSize += entrySize
+
+        for _, key, entrySize in sorted(entries):
+            if totalSize <= self._maxSizeBytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(os.path.join(self._cacheDirectoryPath, key), ignore_errors=True)
+            totalSize -= entrySize
+
+    def _loadArray(self, arrayFilePath):
+        # type: (str) -> numpy.ndarray
+        """
+        Memory-map the given array file.
+        """
+        try:
+            return numpy.load(arrayFilePath, mmap_mode='r')
+        except ValueError:
+            # Empty arrays cannot be memory-mapped by some versions of NumPy:
+            return numpy.load(arrayFilePath)
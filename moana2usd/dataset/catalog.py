@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+
+"""
+Catalog of the files of the Moana Island Scene dataset.
+"""
+
+import json
+import multiprocessing
+import os
+
+
+# Version of the index file format, to be incremented whenever its content
+# changes so that indices written by previous versions get rebuilt:
+CATALOG_VERSION = 2
+
+# Top-level directories of the dataset indexed by the catalog:
+CATALOG_DIRECTORY_NAMES = ['obj', 'json', 'textures']
+
+# Directories of the `json` directory which do not describe Elements:
+NON_ELEMENT_JSON_DIRECTORY_NAMES = ['cameras', 'lights']
+
+
+def _scanDirectoryTree(directoryPath):
+    # type: (str) -> Tuple[Dict[str, float], Dict[str, Tuple[int, float]]]
+    """
+    Return the modification time of each directory under the given one, along
+    with the size and modification time of each of their files.
+    """
+    directories = {}
+    files = {}
+    for currentDirectoryPath, _, fileNames in os.walk(directoryPath):
+        directories[currentDirectoryPath] = os.path.getmtime(currentDirectoryPath)
+        for fileName in fileNames:
+            filePath = os.path.join(currentDirectoryPath, fileName)
+            fileStat = os.stat(filePath)
+            files[filePath] = (fileStat.st_size, fileStat.st_mtime)
+    return (directories, files)
+
+
+class DatasetCatalog(object):
+    """
+    Index of the files of the dataset, and of the dependencies between its
+    Elements, their instance JSON files and OBJ files.
+
+    The `obj`, `json` and `textures` directories are scanned once, with one
+    process per Element directory, and the result can be persisted to an
+    index file. The index is reused by subsequent runs as long as no file was
+    added to or removed from the dataset since, in which case only the files
+    of the `obj` and `json` directories are checked again for changes.
+    """
+
+    def __init__(self, sourceDirectoryPath, indexFilePath=None, jobs=1):
+        # type: (str, str or None, int) -> DatasetCatalog
+        """
+        Create a catalog of the dataset at the given location, persisted to
+        the given index file (if any) and scanned using the given number of
+        processes.
+        """
+        self._sourceDirectoryPath = sourceDirectoryPath
+        self._indexFilePath = indexFilePath
+        self._jobs = jobs
+        self._directories = None
+        self._files = None
+        self._elements = None
+
+    def __getstate__(self):
+        # type: () -> dict
+        """
+        Return the state to pickle, scanning the dataset beforehand so that
+        other processes do not have to scan it again.
+        """
+        self._ensureLoaded()
+        return self.__dict__.copy()
+
+    @property
+    def SourceDirectoryPath(self):
+        # type: () -> str
+        """
+        Return the directory path of the dataset.
+        """
+        return self._sourceDirectoryPath
+
+    @property
+    def IndexFilePath(self):
+        # type: () -> str or None
+        """
+        Return the path of the index file of the catalog, if it is persisted.
+        """
+        return self._indexFilePath
+
+    def Exists(self, filePath):
+        # type: (str) -> boolean
+        """
+        Check if the given file is part of the dataset.
+        """
+        self._ensureLoaded()
+        return self._getKey(filePath) in self._files
+
+    def GetFileSize(self, filePath):
+        # type: (str) -> int
+        """
+        Return the size of the given file of the dataset, in bytes (or 0 if it
+        does not exist).
+        """
+        self._ensureLoaded()
+        return self._files.get(self._getKey(filePath), (0, 0.0))[0]
+
+    def GetFileModificationTime(self, filePath):
+        # type: (str) -> float
+        """
+        Return the modification time of the given file of the dataset (or 0 if
+        it does not exist).
+        """
+        self._ensureLoaded()
+        return self._files.get(self._getKey(filePath), (0, 0.0))[1]
+
+    def GetFilePaths(self, directoryName, extension=None):
+        # type: (str, str or None) -> List[str]
+        """
+        Return the sorted paths of the files under the given directory of the
+        dataset, optionally only those with the given extension.
+        """
+        self._ensureLoaded()
+        prefix = directoryName.replace('\\', '/').rstrip('/') + '/'
+        return [
+            self._getFilePath(key)
+            for key in sorted(self._files.keys())
+            if key.startswith(prefix) and (extension is None or key.endswith(extension))
+        ]
+
+    def GetElementNames(self):
+        # type: () -> List[str]
+        """
+        Return the sorted names of the Elements of the dataset.
+        """
+        self._ensureLoaded()
+        return sorted(self._elements.keys())
+
+    def GetElementJSONFilePath(self, elementName):
+        # type: (str) -> str
+        """
+        Return the path of the JSON file describing the given Element.
+        """
+        return self._getFilePath(self._getElementJSONKey(elementName))
+
+    def GetAssetOBJFilePaths(self, elementName=None):
+        # type: (str or None) -> List[str]
+        """
+        Return the paths of the OBJ files of the dataset, optionally only
+        those of the given Element.
+        """
+        if elementName is None:
+            return self.GetFilePaths('obj', extension='.obj')
+        return self.GetFilePaths('obj/' + elementName, extension='.obj')
+
+    def GetCameraJSONFilePaths(self):
+        # type: () -> List[str]
+        """
+        Return the paths of the JSON camera definition files of the dataset.
+        """
+        return self.GetFilePaths('json/cameras', extension='.json')
+
+    def GetLightJSONFilePaths(self):
+        # type: () -> List[str]
+        """
+        Return the paths of the JSON light definition files of the dataset.
+        """
+        return self.GetFilePaths('json/lights', extension='.json')
+
+    def GetElementOBJFilePaths(self, elementName):
+        # type: (str) -> List[str]
+        """
+        Return the paths of the OBJ files referenced by the given Element,
+        either directly or through its instance JSON files.
+        """
+        self._ensureLoaded()
+        element = self._elements.get(elementName, {})
+        keys = set(element.get('objFiles', []))
+        for archiveKeys in element.get('instanceJSONFiles', {}).values():
+            keys.update(archiveKeys)
+        return [self._getFilePath(key) for key in sorted(keys)]
+
+    def GetElementInstanceJSONFilePaths(self, elementName):
+        # type: (str) -> List[str]
+        """
+        Return the paths of the instance JSON files referenced by the given
+        Element.
+        """
+        self._ensureLoaded()
+        element = self._elements.get(elementName, {})
+        return [self._getFilePath(key) for key in sorted(element.get('instanceJSONFiles', {}).keys())]
+
+    def GetInstanceJSONArchiveFilePaths(self, instanceJSONFilePath):
+        # type: (str) -> List[str]
+        """
+        Return the paths of the OBJ archives instanced by the given instance
+        JSON file.
+        """
+        self._ensureLoaded()
+        instanceJSONKey = self._getKey(instanceJSONFilePath)
+        for element in self._elements.values():
+            archiveKeys = element.get('instanceJSONFiles', {}).get(instanceJSONKey)
+            if archiveKeys is not None:
+                return [self._getFilePath(key) for key in archiveKeys]
+        return []
+
+    def Refresh(self):
+        # type: () -> None
+        """
+        Scan the dataset again, and persist the result to the index file (if
+        any).
+        """
+        self._scan()
+        self.Save()
+
+    def Save(self):
+        # type: () -> None
+        """
+        Write the catalog to its index file (if any).
+        """
+        if self._indexFilePath is None:
+            return
+        self._ensureLoaded()
+        temporaryFilePath = self._indexFilePath + '.tmp'
+        with open(temporaryFilePath, 'w') as f:
+            json.dump({
+                'version': CATALOG_VERSION,
+                'sourceDirectoryPath': os.path.abspath(self._sourceDirectoryPath),
+                'directories': self._directories,
+                'files': self._files,
+                'elements': self._elements
+            }, f, sort_keys=True)
+        if os.path.exists(self._indexFilePath):
+            os.remove(self._indexFilePath)
+        os.rename(temporaryFilePath, self._indexFilePath)
+
+    def _ensureLoaded(self):
+        # type: () -> None
+        """
+        Load the catalog from its index file, or scan the dataset if there is
+        no up-to-date index.
+        """
+        if self._files is not None:
+            return
+        if not self._loadIndex():
+            self.Refresh()
+
+    def _loadIndex(self):
+        # type: () -> boolean
+        """
+        Load the index file of the catalog, if it describes the current
+        content of the dataset.
+        """
+        if self._indexFilePath is None or not os.path.exists(self._indexFilePath):
+            return False
+        try:
+            with open(self._indexFilePath, 'r') as f:
+                index = json.load(f)
+        except ValueError:
+            return False
+        if index.get('version') != CATALOG_VERSION or index.get('sourceDirectoryPath') != os.path.abspath(self._sourceDirectoryPath):
+            return False
+
+        # Files being added or removed is detected through the modification
+        # time of their directory:
+        directories = index.get('directories', {})
+        for key, mtime in directories.items():
+            directoryPath = self._getFilePath(key)
+            if not os.path.isdir(directoryPath) or os.path.getmtime(directoryPath) != mtime:
+                return False
+
+        # Files modified in place are detected for the (comparatively few)
+        # OBJ and JSON files, whose size drives scheduling and whose content
+        # drives the dependencies between Elements:
+        files = dict((key, tuple(value)) for key, value in index.get('files', {}).items())
+        elementsChanged = False
+        for key in files.keys():
+            if key.startswith('textures/'):
+                continue
+            fileStat = os.stat(self._getFilePath(key))
+            if files[key] != (fileStat.st_size, fileStat.st_mtime):
+                files[key] = (fileStat.st_size, fileStat.st_mtime)
+                elementsChanged = elementsChanged or key.startswith('json/')
+
+        self._directories = directories
+        self._files = files
+        self._elements = index.get('elements', {})
+        if elementsChanged:
+            self._elements = self._getElements()
+            self.Save()
+        return True
+
+    def _scan(self):
+        # type: () -> None
+        """
+        Scan the indexed directories of the dataset, using one task per
+        Element directory.
+        """
+        directories = {}
+        rootDirectoryPaths = []
+        for directoryName in CATALOG_DIRECTORY_NAMES:
+            directoryPath = os.path.join(self._sourceDirectoryPath, directoryName)
+            if os.path.isdir(directoryPath):
+                directories[directoryPath] = os.path.getmtime(directoryPath)
+                rootDirectoryPaths.extend(
+                    os.path.join(directoryPath, name)
+                    for name in sorted(os.listdir(directoryPath)))
+
+        files = {}
+        for filePath in rootDirectoryPaths:
+            if not os.path.isdir(filePath):
+                fileStat = os.stat(filePath)
+                files[filePath] = (fileStat.st_size, fileStat.st_mtime)
+        subdirectoryPaths = [filePath for filePath in rootDirectoryPaths if os.path.isdir(filePath)]
+
+        if self._jobs > 1 and len(subdirectoryPaths) > 1:
+            pool = multiprocessing.Pool(processes=min(self._jobs, len(subdirectoryPaths)))
+            try:
+                results = pool.map(_scanDirectoryTree, subdirectoryPaths, chunksize=1)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [_scanDirectoryTree(directoryPath) for directoryPath in subdirectoryPaths]
+        for scannedDirectories, scannedFiles in results:
+            directories.update(scannedDirectories)
+            files.update(scannedFiles)
+
+        self._directories = dict((self._getKey(path), mtime) for path, mtime in directories.items())
+        self._files = dict((self._getKey(path), fingerprint) for path, fingerprint in files.items())
+        self._elements = self._getElements()
+
+    def _getElements(self):
+        # type: () -> dict
+        """
+        Return the dependencies of each Element of the dataset, read from
+        their JSON description.
+        """
+        elements = {}
+        for key in self._files.keys():
+            parts = key.split('/')
+            if len(parts) != 3 or parts[0] != 'json' or parts[2] != parts[1] + '.json':
+                continue
+            if parts[1] in NON_ELEMENT_JSON_DIRECTORY_NAMES:
+                continue
+            elementName = parts[1]
+            with open(self._getFilePath(key), 'r') as f:
+                elementData = json.load(f)
+
+            # Only JSON files describing geometry are Elements (the dataset
+            # also has e.g. `json/lights/lights.json`):
+            if not isinstance(elementData, dict) or not elementData.get('name'):
+                continue
+            if not elementData.get('geomObjFile') and not elementData.get('instancedPrimitiveJsonFiles'):
+                continue
+
+            objFiles = set()
+            instanceJSONFiles = {}
+            instances = [elementData] + list((elementData.get('instancedCopies') or {}).values())
+            for instanceData in instances:
+                if instanceData.get('geomObjFile'):
+                    objFiles.add(self._getKey(instanceData.get('geomObjFile')))
+                for subInstanceData in (instanceData.get('instancedPrimitiveJsonFiles') or {}).values():
+                    if subInstanceData.get('jsonFile'):
+                        instanceJSONFiles[self._getKey(subInstanceData.get('jsonFile'))] = sorted(
+                            self._getKey(archive) for archive in subInstanceData.get('archives', []))
+
+            elements[elementName] = {
+                'objFiles': sorted(objFiles),
+                'instanceJSONFiles': instanceJSONFiles
+            }
+        return elements
+
+    def _getElementJSONKey(self, elementName):
+        # type: (str) -> str
+        """
+        Return the key of the JSON file describing the given Element.
+        """
+        return 'json/{elementName}/{elementName}.json'.format(elementName=elementName)
+
+    def _getKey(self, filePath):
+        # type: (str) -> str
+        """
+        Return the key of the given file in the catalog, which is its path
+        relative to the dataset using forward slashes.
+        """
+        if os.path.isabs(filePath):
+            filePath = os.path.relpath(filePath, self._sourceDirectoryPath)
+        return filePath.replace('\\', '/')
+
+    def _getFilePath(self, key):
+        # type: (str) -> str
+        """
+        Return the path of the file with the given key in the catalog.
+        """
+        return os.path.join(self._sourceDirectoryPath, *key.split('/'))
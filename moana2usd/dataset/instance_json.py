@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+
+"""
+Incremental reader for the instance JSON files of the Moana Island Scene
+dataset.
+"""
+
+import json
+import re
+
+import numpy
+
+
+# Number of characters read from instance JSON files at once:
+INSTANCE_JSON_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Version of the instance JSON reader, to be incremented whenever its output
+# changes so that previously cached transforms get invalidated:
+INSTANCE_JSON_READER_VERSION = '1'
+
+# Either the name of an archive followed by the opening brace of its
+# instances, or the name of an instance followed by its transform matrix:
+_INSTANCE_JSON_TOKEN_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"\s*:\s*(?:(\{)|\[([^\]]*)\])')
+
+
+class _TransformBuffer(object):
+    """
+    Buffer of 4x4 transform matrices to which matrices can be appended in
+    amortized constant time.
+    """
+
+    def __init__(self):
+        # type: () -> _TransformBuffer
+        """
+        Create an empty buffer of transform matrices.
+        """
+        self._buffer = numpy.zeros(1024 * 16, dtype=numpy.float64)
+        self._size = 0
+
+    def Extend(self, values):
+        # type: (numpy.ndarray) -> None
+        """
+        Append the given flat array of matrix values to the buffer.
+        """
+        requiredSize = self._size + len(values)
+        if requiredSize > len(self._buffer):
+            newBuffer = numpy.zeros(max(requiredSize, 2 * len(self._buffer)), dtype=self._buffer.dtype)
+            newBuffer[:self._size] = self._buffer[:self._size]
+            self._buffer = newBuffer
+        self._buffer[self._size:requiredSize] = values
+        self._size = requiredSize
+
+    def GetArray(self):
+        # type: () -> numpy.ndarray
+        """
+        Return the matrices appended so far, as (N, 16) row-major values.
+        """
+        return self._buffer[:self._size].reshape(-1, 16)
+
+
+def iterInstanceTransforms(jsonFilePath, chunkSize=INSTANCE_JSON_CHUNK_SIZE):
+    # type: (str, int) -> Iterator[Tuple[str, numpy.ndarray]]
+    """
+    Yield the name of each archive of the given instance JSON file along with
+    the (N, 16) transform matrices of its instances, in file order.
+
+    Instance JSON files map archive names to their instances, themselves
+    mapping instance names to row-major transform matrices. Rather than
+    loading the whole document, the file is read in chunks whose matrices are
+    appended to a numeric buffer for the current archive, so that memory use
+    stays close to the size of the matrices of a single archive. Instance
+    names are not retained.
+    """
+    archiveName = None
+    transformBuffer = None
+    pendingText = ''
+
+    with open(jsonFilePath, 'r') as f:
+        while True:
+            chunk = f.read(chunkSize)
+            text = pendingText + chunk
+
+            matrixTexts = []
+            parsedLength = 0
+            for match in _INSTANCE_JSON_TOKEN_PATTERN.finditer(text):
+                if match.group(2) is not None:
+                    if archiveName is not None:
+                        _extendTransformBuffer(transformBuffer, matrixTexts, jsonFilePath)
+                        matrixTexts = []
+                        yield (archiveName, transformBuffer.GetArray())
+                    archiveName = json.loads('"' + match.group(1) + '"')
+                    transformBuffer = _TransformBuffer()
+                else:
+                    matrixTexts.append(match.group(3))
+                parsedLength = match.end()
+
+            if matrixTexts:
+                _extendTransformBuffer(transformBuffer, matrixTexts, jsonFilePath)
+
+            # Tokens cut at the end of the chunk are parsed along with the next
+            # one:
+            pendingText = text[parsedLength:]
+            if not chunk:
+                break
+
+    if archiveName is not None:
+        yield (archiveName, transformBuffer.GetArray())
+
+def countInstances(jsonFilePath, chunkSize=INSTANCE_JSON_CHUNK_SIZE):
+    # type: (str, int) -> int
+    """
+    Return the number of instances of the given instance JSON file, without
+    parsing their transform matrices.
+
+    Each instance of the file has a single transform matrix array, so that
+    instances are counted by counting opening brackets.
+    """
+    instanceCount = 0
+    with open(jsonFilePath, 'rb') as f:
+        while True:
+            chunk = f.read(chunkSize)
+            if not chunk:
+                break
+            instanceCount += chunk.count(b'[')
+    return instanceCount
+
+def getCachedInstanceTransformsForFile(jsonFilePath, arrayCache):
+    # type: (str, moana2usd.dataset.array_cache.ArrayCache) -> List[Tuple[str, numpy.ndarray]]
+    """
+    Return the name of each archive of the given instance JSON file along with
+    the (N, 16) transform matrices of its instances from the given cache,
+    reading the file and caching the result if it was not cached yet.
+
+    Cached arrays are memory-mapped, so that a warm cache skips text parsing
+    altogether.
+    """
+    cachedEntry = arrayCache.Load(jsonFilePath, INSTANCE_JSON_READER_VERSION)
+    if cachedEntry is not None:
+        arrays, metadata = cachedEntry
+        return [
+            (archiveName, arrays.get(_getTransformArrayName(archiveIndex)))
+            for archiveIndex, archiveName in enumerate(metadata.get('archives'))
+        ]
+
+    archives = list(iterInstanceTransforms(jsonFilePath))
+    arrayCache.Store(
+        jsonFilePath,
+        INSTANCE_JSON_READER_VERSION,
+        arrays=dict(
+            (_getTransformArrayName(archiveIndex), transformMatrices)
+            for archiveIndex, (_, transformMatrices) in enumerate(archives)
+        ),
+        metadata={
+            'archives': [archiveName for archiveName, _ in archives]
+        })
+    return archives
+
+def concatenateInstanceTransforms(archives):
+    # type: (Iterable[Tuple[str, numpy.ndarray]]) -> Tuple[List[str], numpy.ndarray, numpy.ndarray]
+    """
+    Return the names of the given archives, along with the (N, 16) transform
+    matrices of all of their instances and the index of the archive of each
+    instance.
+
+    Archives are appended to a single buffer as they are read, so that the
+    matrices of a whole instance JSON file can be gathered in one pass.
+    """
+    archiveNames = []
+    archiveSizes = []
+    transformBuffer = _TransformBuffer()
+    for archiveName, transformMatrices in archives:
+        archiveNames.append(archiveName)
+        archiveSizes.append(len(transformMatrices))
+        transformBuffer.Extend(numpy.asarray(transformMatrices).reshape(-1))
+    archiveIndices = numpy.repeat(numpy.arange(len(archiveNames), dtype=numpy.int32), archiveSizes)
+    return (archiveNames, transformBuffer.GetArray(), archiveIndices)
+
+def _getTransformArrayName(archiveIndex):
+    # type: (int) -> str
+    """
+    Return the name of the cached array of transform matrices of the archive
+    at the given index.
+    """
+    return 'transforms{archiveIndex}'.format(archiveIndex=archiveIndex)
+
+def _extendTransformBuffer(transformBuffer, matrixTexts, jsonFilePath):
+    # type: (_TransformBuffer, List[str], str) -> None
+    """
+    Append the transform matrices of the given JSON arrays (without their
+    brackets) to the given buffer.
+    """
+    if transformBuffer is None:
+        raise ValueError('Instance found outside of an archive in "{jsonFilePath}".'.format(jsonFilePath=jsonFilePath))
+
+    values = numpy.fromstring(','.join(matrixTexts), dtype=numpy.float64, sep=',')
+    if len(values) != 16 * len(matrixTexts):
+        raise ValueError('Malformed instance transform matrices in "{jsonFilePath}".'.format(jsonFilePath=jsonFilePath))
+    transformBuffer.Extend(values)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+
+"""
+Shared in-memory database of the Materials of the dataset Elements.
+"""
+
+import collections
+import json
+import os
+
+
+# Base colors used in the dataset to flag Materials without a meaningful
+# color, which should not be used as display colors:
+PLACEHOLDER_BASE_COLORS = [
+    [1.0, 0.0, 0.0],
+    [1.0, 0.0, 1.0]
+]
+
+
+def getElementNameForOBJPath(assetOBJPath, sourceDirectoryPath):
+    # type: (str, str) -> str
+    """
+    Return the name of the Element the given OBJ asset belongs to, from its
+    location in the "obj/<elementName>/" directory of the dataset.
+    """
+    relativeOBJPath = os.path.relpath(assetOBJPath, sourceDirectoryPath).replace('\\', '/')
+    return relativeOBJPath.split('/')[1]
+
+
+class MaterialRecord(object):
+    """
+    Material properties resolved from a "materials.json" entry.
+    """
+
+    __slots__ = (
+        'name',
+        'baseColor',
+        'displayColor',
+        'opacity',
+        'roughness',
+        'metallic',
+        'clearcoat',
+        'clearcoatRoughness',
+        'ior',
+        'colorMap',
+        'displacementMap'
+    )
+
+    def __init__(self, name, materialData):
+        # type: (str, dict) -> MaterialRecord
+        """
+        Resolve the properties of the given Material from its JSON data.
+        """
+        self.name = name
+
+        # Raw base color, which may include an alpha component:
+        self.baseColor = materialData.get('baseColor')
+        # RGB color to display the Material with, if it has a meaningful one:
+        self.displayColor = None
+        if self.baseColor is not None and list(self.baseColor) not in PLACEHOLDER_BASE_COLORS:
+            self.displayColor = tuple(self.baseColor[:3])
+        self.opacity = None
+        if self.baseColor is not None and len(self.baseColor) >= 4:
+            self.opacity = self.baseColor[3]
+
+        self.roughness = materialData.get('roughness')
+        self.metallic = materialData.get('metallic')
+        self.clearcoat = materialData.get('clearcoat')
+        self.clearcoatRoughness = None
+        clearcoatGloss = materialData.get('clearcoatGloss')
+        if clearcoatGloss is not None:
+            self.clearcoatRoughness = max(1 - clearcoatGloss, 0.01)
+        self.ior = materialData.get('ior')
+
+        self.colorMap = materialData.get('colorMap') or None
+        self.displacementMap = materialData.get('displacementMap') or None
+
+
+class MaterialDatabase(object):
+    """
+    Database of the Materials of each Element, parsing each "materials.json"
+    file only once and keeping the most recently used ones in memory.
+    """
+
+    def __init__(self, sourceDirectoryPath, maxElementCount=32):
+        # type: (str, int) -> MaterialDatabase
+        """
+        Create a database for the dataset at the given location, keeping the
+        Materials of at most the given number of Elements in memory.
+        """
+        self._sourceDirectoryPath = sourceDirectoryPath
+        self._maxElementCount = maxElementCount
+        self._elementMaterials = collections.OrderedDict()
+
+    def __getstate__(self):
+        # type: () -> dict
+        """
+        Return the state to pickle, leaving out loaded Materials so that
+        databases are cheap to send to other processes.
+        """
+        state = self.__dict__.copy()
+        state['_elementMaterials'] = collections.OrderedDict()
+        return state
+
+    def GetMaterialFilePath(self, elementName):
+        # type: (str) -> str
+        """
+        Return the path of the "materials.json" file of the given Element.
+        """
+        return os.path.join(self._sourceDirectoryPath, 'json', elementName, 'materials.json')
+
+    def GetMaterials(self, elementName):
+        # type: (str) -> Dict[str, MaterialRecord]
+        """
+        Return the Materials of the given Element, indexed by name.
+        """
+        materials = self._elementMaterials.pop(elementName, None)
+        if materials is None:
+            materials = self._loadMaterials(elementName)
+        # (Re)insert the Element as the most recently used one:
+        self._elementMaterials[elementName] = materials
+        while len(self._elementMaterials) > self._maxElementCount:
+            self._elementMaterials.popitem(last=False)
+        return materials
+
+    def GetMaterial(self, elementName, materialName):
+        # type: (str, str) -> MaterialRecord or None
+        """
+        Return the given Material of the given Element, if it exists.
+        """
+        return self.GetMaterials(elementName).get(materialName)
+
+    def _loadMaterials(self, elementName):
+        # type: (str) -> Dict[str, MaterialRecord]
+        """
+        Parse the "materials.json" file of the given Element.
+        """
+        materialFilePath = self.GetMaterialFilePath(elementName)
+        if not os.path.exists(materialFilePath):
+            return {}
+        with open(materialFilePath, 'r') as f:
+            materialJSONData = json.load(f)
+        return dict(
+            (materialName, MaterialRecord(materialName, materialData))
+            for materialName, materialData in materialJSONData.items()
+        )
+
+
+_SHARED_MATERIAL_DATABASES = {}
+
+def getSharedMaterialDatabase(sourceDirectoryPath):
+    # type: (str) -> MaterialDatabase
+    """
+    Return the Material database shared by all converters of the dataset at
+    the given location.
+    """
+    materialDatabase = _SHARED_MATERIAL_DATABASES.get(sourceDirectoryPath)
+    if materialDatabase is None:
+        materialDatabase = MaterialDatabase(sourceDirectoryPath)
+        _SHARED_MATERIAL_DATABASES.update({ sourceDirectoryPath: materialDatabase })
+    return materialDatabase
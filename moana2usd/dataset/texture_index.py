@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+"""
+Index of the Ptex texture maps of the Moana Island Scene dataset.
+"""
+
+import os
+
+
+class TextureIndex(object):
+    """
+    Index of the texture maps of each Element, listing each texture directory
+    only once instead of checking for the existence of each map.
+
+    Directory listings are taken from the dataset catalog when one is given,
+    so that the dataset does not need to be accessed at all.
+    """
+
+    COLOR_MAP_TYPE = 'Color'
+    DISPLACEMENT_MAP_TYPE = 'Displacement'
+
+    def __init__(self, sourceDirectoryPath, catalog=None):
+        # type: (str, moana2usd.dataset.catalog.DatasetCatalog or None) -> TextureIndex
+        """
+        Create an index of the texture maps of the dataset at the given
+        location, listed through the given catalog (if any).
+        """
+        self._sourceDirectoryPath = sourceDirectoryPath
+        self._catalog = catalog
+        self._directoryListings = {}
+
+    def GetColorMapFilePath(self, elementName, groupName, mapPath=None):
+        # type: (str, str, str or None) -> str or None
+        """
+        Return the path of the color map of the given OBJ group, if it has
+        one.
+        """
+        return self.GetMapFilePath(elementName, self.COLOR_MAP_TYPE, groupName, mapPath)
+
+    def GetDisplacementMapFilePath(self, elementName, groupName, mapPath=None):
+        # type: (str, str, str or None) -> str or None
+        """
+        Return the path of the displacement map of the given OBJ group, if it
+        has one.
+        """
+        return self.GetMapFilePath(elementName, self.DISPLACEMENT_MAP_TYPE, groupName, mapPath)
+
+    def GetMapFilePath(self, elementName, mapType, groupName, mapPath=None):
+        # type: (str, str, str, str or None) -> str or None
+        """
+        Return the path of the map of the given type for the given OBJ group,
+        if it has one.
+
+        The map path of the material, as found in "materials.json", is used
+        when provided: either a Ptex file, or a directory of Ptex files named
+        after the groups they apply to. Otherwise, the map is looked up in the
+        `textures/<Element>/<map type>` directory of the dataset.
+        """
+        if mapPath:
+            # Map paths are relative to the dataset, possibly with leading
+            # parent directory components:
+            mapPathParts = [part for part in mapPath.replace('\\', '/').split('/') if part not in ('', '.', '..')]
+            mapFilePath = os.path.join(self._sourceDirectoryPath, *mapPathParts)
+            if os.path.splitext(mapFilePath)[1].lower() == '.ptx':
+                directoryPath, fileName = os.path.split(mapFilePath)
+                return self._getDirectoryListing(directoryPath).get(fileName)
+            directoryPath = mapFilePath
+        else:
+            directoryPath = os.path.join(self._sourceDirectoryPath, 'textures', elementName, mapType)
+        return self._getDirectoryListing(directoryPath).get(groupName + '.ptx')
+
+    def _getDirectoryListing(self, directoryPath):
+        # type: (str) -> Dict[str, str]
+        """
+        Return the paths of the files of the given directory, indexed by name.
+        """
+        directoryListing = self._directoryListings.get(directoryPath)
+        if directoryListing is None:
+            if self._catalog is not None:
+                relativeDirectoryPath = os.path.relpath(directoryPath, self._sourceDirectoryPath)
+                filePaths = [
+                    filePath
+                    for filePath in self._catalog.GetFilePaths(relativeDirectoryPath)
+                    if os.path.dirname(filePath) == directoryPath
+                ]
+            elif os.path.isdir(directoryPath):
+                filePaths = [os.path.join(directoryPath, fileName) for fileName in os.listdir(directoryPath)]
+            else:
+                filePaths = []
+            directoryListing = dict((os.path.basename(filePath), filePath) for filePath in filePaths)
+            self._directoryListings[directoryPath] = directoryListing
+        return directoryListing
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+Decimation of Meshes into lightweight proxies.
+"""
+
+import numpy
+
+
+def triangulateFaces(faceVertexCounts, faceVertexIndices):
+    # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+    """
+    Return the (N, 3) vertex indices of the triangle fans of the given faces.
+    Faces with fewer than 3 vertices are dropped.
+    """
+    faceVertexCounts = numpy.asarray(faceVertexCounts, dtype=numpy.int64)
+    faceVertexIndices = numpy.asarray(faceVertexIndices)
+    faceOffsets = numpy.cumsum(faceVertexCounts) - faceVertexCounts
+    triangleCounts = numpy.maximum(faceVertexCounts - 2, 0)
+    if triangleCounts.sum() == 0:
+        return numpy.zeros((0, 3), dtype=faceVertexIndices.dtype)
+
+    # Offset of the first vertex of the face of each triangle, and rank of the
+    # triangle within its fan:
+    triangleFaceOffsets = numpy.repeat(faceOffsets, triangleCounts)
+    triangleStarts = numpy.cumsum(triangleCounts) - triangleCounts
+    triangleRanks = numpy.arange(triangleCounts.sum()) - numpy.repeat(triangleStarts, triangleCounts)
+
+    return numpy.stack([
+        faceVertexIndices[triangleFaceOffsets],
+        faceVertexIndices[triangleFaceOffsets + triangleRanks + 1],
+        faceVertexIndices[triangleFaceOffsets + triangleRanks + 2]
+    ], axis=1)
+
+
+def decimateByVertexClustering(faceVertexCounts, faceVertexIndices, points, resolution):
+    # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, int) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    Decimate the given Mesh by clustering its vertices on a regular grid with
+    the given number of cells along the longest side of its bounding box.
+
+    The vertices of each cell are merged at their average position, and the
+    triangles which collapse (or become duplicates) in the process are
+    dropped. Return the face vertex counts, face vertex indices and points of
+    the resulting triangle Mesh.
+    """
+    points = numpy.asarray(points, dtype=numpy.float32)
+    triangles = triangulateFaces(faceVertexCounts, faceVertexIndices)
+    if len(points) == 0 or len(triangles) == 0:
+        return (numpy.zeros(0, dtype=numpy.int32), numpy.zeros(0, dtype=numpy.int32), numpy.zeros((0, 3), dtype=numpy.float32))
+
+    # Assign each vertex to the cell of the grid containing it:
+    boundsMin = points.min(axis=0)
+    boundsSize = points.max(axis=0) - boundsMin
+    cellSize = max(float(boundsSize.max()) / max(resolution, 1), 1e-12)
+    cells = numpy.floor((points - boundsMin) / cellSize).astype(numpy.int64)
+    cells = numpy.minimum(cells, resolution)
+    # Compare rows rather than packed integer keys, which would overflow past
+    # 2**21 cells (or clusters) per axis:
+    _, clusterIndices = numpy.unique(cells, axis=0, return_inverse=True)
+    clusterIndices = clusterIndices.reshape(-1)
+
+    # Drop triangles with collapsed edges, then duplicate triangles:
+    triangles = clusterIndices[triangles]
+    isDegenerate = (triangles[:, 0] == triangles[:, 1]) | (triangles[:, 1] == triangles[:, 2]) | (triangles[:, 0] == triangles[:, 2])
+    triangles = triangles[~isDegenerate]
+    if len(triangles) == 0:
+        return (numpy.zeros(0, dtype=numpy.int32), numpy.zeros(0, dtype=numpy.int32), numpy.zeros((0, 3), dtype=numpy.float32))
+    clusterCount = clusterIndices.max() + 1
+    sortedTriangles = numpy.sort(triangles, axis=1)
+    _, uniqueTriangleIndices = numpy.unique(sortedTriangles, axis=0, return_index=True)
+    triangles = triangles[numpy.sort(uniqueTriangleIndices)]
+
+    # Only keep the clusters still referenced by a triangle, positioned at the
+    # average of the vertices they merge:
+    usedClusters, triangleVertexIndices = numpy.unique(triangles, return_inverse=True)
+    clusterSizes = numpy.bincount(clusterIndices, minlength=clusterCount).astype(numpy.float64)
+    clusterPoints = numpy.stack([
+        numpy.bincount(clusterIndices, weights=points[:, axis], minlength=clusterCount) / numpy.maximum(clusterSizes, 1)
+        for axis in range(3)
+    ], axis=1)
+
+    faceVertexIndices = triangleVertexIndices.reshape(-1).astype(numpy.int32)
+    return (
+        numpy.full(len(triangles), 3, dtype=numpy.int32),
+        faceVertexIndices,
+        clusterPoints[usedClusters].astype(numpy.float32)
+    )
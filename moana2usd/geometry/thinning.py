@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+"""
+Deterministic thinning of large sets of instances.
+"""
+
+import numpy
+
+
+def getInstanceSamples(positions, seed=0):
+    # type: (numpy.ndarray, int) -> numpy.ndarray
+    """
+    Return a pseudo-random sample in [0, 1) for each of the given (N, 3)
+    instance positions, derived from a hash of the positions themselves.
+
+    Samples do not depend on the order of the instances or on the other
+    instances of the set, so that the same instances are kept from one
+    conversion to the next.
+    """
+    positions = numpy.ascontiguousarray(positions, dtype=numpy.float64).reshape(-1, 3)
+    bits = positions.view(numpy.uint64)
+
+    # Combine the bits of the coordinates, then mix them using the finalizer of
+    # the SplitMix64 generator (relying on the wrapping of unsigned integer
+    # arithmetic):
+    with numpy.errstate(over='ignore'):
+        hashes = numpy.uint64(seed) + numpy.uint64(0x9E3779B97F4A7C15)
+        hashes = hashes ^ (bits[:, 0] * numpy.uint64(0xBF58476D1CE4E5B9))
+        hashes = hashes ^ (bits[:, 1] * numpy.uint64(0x94D049BB133111EB))
+        hashes = hashes ^ (bits[:, 2] * numpy.uint64(0xD6E8FEB86659FD93))
+        hashes = (hashes ^ (hashes >> numpy.uint64(30))) * numpy.uint64(0xBF58476D1CE4E5B9)
+        hashes = (hashes ^ (hashes >> numpy.uint64(27))) * numpy.uint64(0x94D049BB133111EB)
+        hashes = hashes ^ (hashes >> numpy.uint64(31))
+    return (hashes >> numpy.uint64(11)).astype(numpy.float64) / float(1 << 53)
+
+
+def getThinningMask(positions, keepFraction, seed=0):
+    # type: (numpy.ndarray, float, int) -> numpy.ndarray
+    """
+    Return whether to keep each of the instances at the given (N, 3)
+    positions, keeping about the given fraction of them.
+
+    Instances kept for a given fraction are also kept for all larger
+    fractions, so that thinned sets are nested.
+    """
+    if keepFraction >= 1.0:
+        return numpy.ones(len(positions), dtype=bool)
+    return getInstanceSamples(positions, seed) < keepFraction
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+"""
+Spatial tiling of large Meshes and point sets.
+"""
+
+import math
+
+import numpy
+
+
+def getTileGridSize(boundsSize, tileCount):
+    # type: (numpy.ndarray, int) -> Tuple[int, int, int]
+    """
+    Return the number of tiles along each axis of a grid of about the given
+    number of tiles, spanning the two largest axes of the given bounds so that
+    tiles are about square.
+    """
+    gridSize = [1, 1, 1]
+    if tileCount <= 1:
+        return tuple(gridSize)
+    majorAxis, minorAxis = [int(axis) for axis in numpy.argsort(boundsSize)[::-1][:2]]
+    majorSize = float(boundsSize[majorAxis])
+    minorSize = float(boundsSize[minorAxis])
+    majorTileCount = tileCount
+    if minorSize > 0:
+        majorTileCount = min(max(int(round(math.sqrt(tileCount * majorSize / minorSize))), 1), tileCount)
+    gridSize[majorAxis] = majorTileCount
+    gridSize[minorAxis] = int(math.ceil(float(tileCount) / majorTileCount))
+    return tuple(gridSize)
+
+
+def splitIntoTiles(faceVertexCounts, faceVertexIndices, points, maxFaceCount):
+    # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, int) -> List[Tuple[Tuple[int, int, int], numpy.ndarray, numpy.ndarray, numpy.ndarray]]
+    """
+    Split the given Mesh into a regular grid of tiles holding about the given
+    number of faces each, assigning each face to the tile containing its
+    centroid.
+
+    Return the (x, y, z) grid coordinates, face vertex counts, face vertex
+    indices and points of each non-empty tile. Each tile only holds the
+    points its faces reference.
+    """
+    faceVertexCounts = numpy.asarray(faceVertexCounts)
+    faceVertexIndices = numpy.asarray(faceVertexIndices)
+    points = numpy.asarray(points)
+    faceCount = len(faceVertexCounts)
+    if faceCount == 0:
+        return []
+
+    # Compute the centroid of each face:
+    faceOffsets = numpy.cumsum(faceVertexCounts) - faceVertexCounts
+    faceCentroids = numpy.add.reduceat(points[faceVertexIndices].astype(numpy.float64), faceOffsets, axis=0)
+    faceCentroids /= faceVertexCounts[:, numpy.newaxis]
+
+    # Assign each face to a tile of the grid:
+    boundsMin = points.min(axis=0).astype(numpy.float64)
+    boundsSize = points.max(axis=0) - boundsMin
+    gridSize = numpy.array(getTileGridSize(boundsSize, int(math.ceil(float(faceCount) / max(maxFaceCount, 1)))))
+    tileSize = numpy.maximum(boundsSize / gridSize, 1e-12)
+    faceTiles = numpy.clip(numpy.floor((faceCentroids - boundsMin) / tileSize).astype(numpy.int64), 0, gridSize - 1)
+    faceTileKeys = (faceTiles[:, 0] * gridSize[1] + faceTiles[:, 1]) * gridSize[2] + faceTiles[:, 2]
+
+    # Gather the face vertices of each tile, with the faces of a tile kept in
+    # their original order:
+    faceOrder = numpy.argsort(faceTileKeys, kind='mergesort')
+    tileKeys, tileStarts = numpy.unique(faceTileKeys[faceOrder], return_index=True)
+    tileEnds = numpy.append(tileStarts[1:], faceCount)
+    faceVertexOrder = numpy.repeat(faceOffsets[faceOrder], faceVertexCounts[faceOrder])
+    faceVertexOrder += numpy.arange(len(faceVertexOrder)) - numpy.repeat(
+        numpy.cumsum(faceVertexCounts[faceOrder]) - faceVertexCounts[faceOrder],
+        faceVertexCounts[faceOrder])
+    orderedFaceVertexCounts = faceVertexCounts[faceOrder]
+    orderedFaceVertexIndices = faceVertexIndices[faceVertexOrder]
+    orderedFaceVertexOffsets = numpy.append(0, numpy.cumsum(orderedFaceVertexCounts))
+
+    tiles = []
+    for tileKey, tileStart, tileEnd in zip(tileKeys, tileStarts, tileEnds):
+        tileFaceVertexIndices = orderedFaceVertexIndices[orderedFaceVertexOffsets[tileStart]:orderedFaceVertexOffsets[tileEnd]]
+        usedPointIndices, tileFaceVertexIndices = numpy.unique(tileFaceVertexIndices, return_inverse=True)
+        tileCoordinates = (
+            int(tileKey // (gridSize[1] * gridSize[2])),
+            int(tileKey // gridSize[2] % gridSize[1]),
+            int(tileKey % gridSize[2]))
+        tiles.append((
+            tileCoordinates,
+            orderedFaceVertexCounts[tileStart:tileEnd],
+            tileFaceVertexIndices.reshape(-1).astype(faceVertexIndices.dtype),
+            points[usedPointIndices]))
+    return tiles
+
+
+def splitPointsIntoTiles(points, maxPointCount):
+    # type: (numpy.ndarray, int) -> List[Tuple[Tuple[int, int, int], numpy.ndarray]]
+    """
+    Split the given points into a regular grid of tiles holding about the
+    given number of points each.
+
+    Return the (x, y, z) grid coordinates and the indices of the points of
+    each non-empty tile, with the points of a tile kept in their original
+    order.
+    """
+    points = numpy.asarray(points)
+    pointCount = len(points)
+    if pointCount == 0:
+        return []
+
+    # Assign each point to a tile of the grid:
+    boundsMin = points.min(axis=0).astype(numpy.float64)
+    boundsSize = points.max(axis=0) - boundsMin
+    gridSize = numpy.array(getTileGridSize(boundsSize, int(math.ceil(float(pointCount) / max(maxPointCount, 1)))))
+    tileSize = numpy.maximum(boundsSize / gridSize, 1e-12)
+    pointTiles = numpy.clip(numpy.floor((points - boundsMin) / tileSize).astype(numpy.int64), 0, gridSize - 1)
+    pointTileKeys = (pointTiles[:, 0] * gridSize[1] + pointTiles[:, 1]) * gridSize[2] + pointTiles[:, 2]
+
+    pointOrder = numpy.argsort(pointTileKeys, kind='mergesort')
+    tileKeys, tileStarts = numpy.unique(pointTileKeys[pointOrder], return_index=True)
+    tileEnds = numpy.append(tileStarts[1:], pointCount)
+
+    tiles = []
+    for tileKey, tileStart, tileEnd in zip(tileKeys, tileStarts, tileEnds):
+        tileCoordinates = (
+            int(tileKey // (gridSize[1] * gridSize[2])),
+            int(tileKey // gridSize[2] % gridSize[1]),
+            int(tileKey % gridSize[2]))
+        tiles.append((tileCoordinates, pointOrder[tileStart:tileEnd]))
+    return tiles
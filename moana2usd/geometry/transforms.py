@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+"""
+Batched operations on affine transformation matrices.
+"""
+
+import numpy
+
+
+def decomposeTransforms(matrices):
+    # type: (numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    Decompose the given (N, 16) row-major affine matrices (using the row
+    vector convention of `Gf.Matrix4d`) into the positions, orientations and
+    scales of PointInstancer instances.
+
+    Each matrix is treated as a scale, followed by a rotation and a
+    translation. Orientations are unit quaternions laid out as (i, j, k,
+    real), which is the memory layout of `Gf.Quath`. Mirroring matrices are
+    decomposed with a negative scale along their first axis.
+    """
+    matrices = numpy.asarray(matrices, dtype=numpy.float64).reshape(-1, 4, 4)
+    positions = matrices[:, 3, :3]
+
+    # The rows of the upper 3x3 block are the scaled axes of each instance:
+    basis = matrices[:, :3, :3]
+    scales = numpy.sqrt((basis ** 2).sum(axis=2))
+    scales[numpy.linalg.det(basis) < 0, 0] *= -1
+    rotations = basis / numpy.where(scales == 0, 1, scales)[:, :, numpy.newaxis]
+
+    return (
+        positions.astype(numpy.float32),
+        rotationMatricesToQuaternions(rotations),
+        scales.astype(numpy.float32))
+
+
+def rotationMatricesToQuaternions(rotations):
+    # type: (numpy.ndarray) -> numpy.ndarray
+    """
+    Convert the given (N, 3, 3) rotation matrices (using the row vector
+    convention of `Gf.Matrix4d`) into (N, 4) unit quaternions, laid out as
+    (i, j, k, real).
+
+    Each quaternion is computed from the largest of its components, so that
+    the conversion remains accurate for all angles.
+    """
+    rotations = numpy.asarray(rotations, dtype=numpy.float64)
+    m00, m01, m02 = rotations[:, 0, 0], rotations[:, 0, 1], rotations[:, 0, 2]
+    m10, m11, m12 = rotations[:, 1, 0], rotations[:, 1, 1], rotations[:, 1, 2]
+    m20, m21, m22 = rotations[:, 2, 0], rotations[:, 2, 1], rotations[:, 2, 2]
+
+    # Candidate quaternions computed from each of the 4 components, with the
+    # row vector convention meaning that matrices are the transpose of their
+    # column vector counterparts:
+    candidates = numpy.stack([
+        numpy.stack([1 + m00 - m11 - m22, m10 + m01, m20 + m02, m12 - m21], axis=1),
+        numpy.stack([m10 + m01, 1 - m00 + m11 - m22, m21 + m12, m20 - m02], axis=1),
+        numpy.stack([m20 + m02, m21 + m12, 1 - m00 - m11 + m22, m01 - m10], axis=1),
+        numpy.stack([m12 - m21, m20 - m02, m01 - m10, 1 + m00 + m11 + m22], axis=1)
+    ], axis=1)
+    largestComponents = numpy.stack([
+        1 + m00 - m11 - m22,
+        1 - m00 + m11 - m22,
+        1 - m00 - m11 + m22,
+        1 + m00 + m11 + m22
+    ], axis=1).argmax(axis=1)
+
+    quaternions = candidates[numpy.arange(len(rotations)), largestComponents]
+    norms = numpy.sqrt((quaternions ** 2).sum(axis=1))
+    quaternions /= numpy.where(norms == 0, 1, norms)[:, numpy.newaxis]
+
+    # Use the same hemisphere for all quaternions:
+    quaternions[quaternions[:, 3] < 0] *= -1
+    return quaternions.astype(numpy.float32)
+
+
+def composeTransforms(positions, quaternions, scales):
+    # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+    """
+    Compose the given positions, (i, j, k, real) quaternions and scales of
+    PointInstancer instances into (N, 16) row-major affine matrices, as the
+    inverse of `decomposeTransforms`.
+    """
+    quaternions = numpy.asarray(quaternions, dtype=numpy.float64).reshape(-1, 4)
+    norms = numpy.sqrt((quaternions ** 2).sum(axis=1))
+    quaternions = quaternions / numpy.where(norms == 0, 1, norms)[:, numpy.newaxis]
+    x, y, z, w = quaternions[:, 0], quaternions[:, 1], quaternions[:, 2], quaternions[:, 3]
+
+    rotations = numpy.stack([
+        numpy.stack([1 - 2 * (y * y + z * z), 2 * (x * y + z * w), 2 * (x * z - y * w)], axis=1),
+        numpy.stack([2 * (x * y - z * w), 1 - 2 * (x * x + z * z), 2 * (y * z + x * w)], axis=1),
+        numpy.stack([2 * (x * z + y * w), 2 * (y * z - x * w), 1 - 2 * (x * x + y * y)], axis=1)
+    ], axis=1)
+
+    matrices = numpy.zeros((len(quaternions), 4, 4))
+    matrices[:, :3, :3] = rotations * numpy.asarray(scales, dtype=numpy.float64).reshape(-1, 3)[:, :, numpy.newaxis]
+    matrices[:, 3, :3] = numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3)
+    matrices[:, 3, 3] = 1.0
+    return matrices.reshape(-1, 16)
+
+def transformExtent(extent, matrices):
+    # type: (numpy.ndarray, numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    Return the minimum and maximum corners of the axis-aligned bounds of the
+    given (2, 3) extent, as transformed by each of the given (N, 16)
+    row-major affine matrices.
+    """
+    extent = numpy.asarray(extent, dtype=numpy.float64).reshape(2, 3)
+    matrices = numpy.asarray(matrices, dtype=numpy.float64).reshape(-1, 4, 4)
+    center = (extent[0] + extent[1]) / 2.0
+    halfSize = (extent[1] - extent[0]) / 2.0
+
+    # The half size of the transformed bounds along each axis is the sum of
+    # the absolute contributions of the axes of the original bounds:
+    transformedCenters = center.dot(matrices[:, :3, :3]) + matrices[:, 3, :3]
+    transformedHalfSizes = halfSize.dot(numpy.abs(matrices[:, :3, :3]))
+    return (transformedCenters - transformedHalfSizes, transformedCenters + transformedHalfSizes)
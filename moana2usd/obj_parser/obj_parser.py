@@ -4,9 +4,14 @@
 (Simple) OBJ parser.
 """
 
-import json
+import mmap
+import multiprocessing
 import os
 
+import numpy
+
+from moana2usd.dataset.material_database import getElementNameForOBJPath, getSharedMaterialDatabase
+
 
 class Point(object):
     """
@@ -186,7 +191,7 @@ class OBJStream(object):
         """
         Return the list of all Material names for the OBJ Stream.
         """
-        return self._materialMap.values()
+        return list(self._materialMap.values())
 
     def GetCurrentGroup(self):
         # type: () -> str
@@ -195,22 +200,300 @@ class OBJStream(object):
         """
         return self._groups[-1].name
 
+class _RowsView(object):
+    """
+    Read-only sequence of tuples over the rows of a 2D array.
+    """
+
+    def __init__(self, array):
+        # type: (numpy.ndarray) -> _RowsView
+        """
+        Build a view over the rows of the given array.
+        """
+        self._array = array
+
+    def __len__(self):
+        # type: () -> int
+        """
+        Return the number of rows in the view.
+        """
+        return len(self._array)
+
+    def __getitem__(self, index):
+        # type: (int) -> Tuple[float, ...]
+        """
+        Return the row at the given index as a tuple.
+        """
+        return tuple(self._array[index].tolist())
+
+    def __iter__(self):
+        # type: () -> Iterator[Tuple[float, ...]]
+        """
+        Iterate over the rows of the view as tuples.
+        """
+        for row in self._array:
+            yield tuple(row.tolist())
+
+class _PointsView(_RowsView):
+    """
+    Read-only sequence of Points over an array of point indices.
+    """
+
+    def __getitem__(self, index):
+        # type: (int) -> Point
+        """
+        Return the Point at the given index.
+        """
+        return Point(*self._array[index].tolist())
+
+    def __iter__(self):
+        # type: () -> Iterator[Point]
+        """
+        Iterate over the Points of the view.
+        """
+        for row in self._array:
+            yield Point(*row.tolist())
+
+class _FacesView(object):
+    """
+    Read-only sequence of Faces over a range of face offsets.
+    """
+
+    def __init__(self, faceOffsets, facesBegin, facesEnd):
+        # type: (numpy.ndarray, int, int) -> _FacesView
+        """
+        Build a view over the Faces in the [facesBegin, facesEnd) range.
+        """
+        self._faceOffsets = faceOffsets
+        self._facesBegin = facesBegin
+        self._facesEnd = facesEnd
+
+    def __len__(self):
+        # type: () -> int
+        """
+        Return the number of Faces in the view.
+        """
+        return self._facesEnd - self._facesBegin
+
+    def __getitem__(self, index):
+        # type: (int) -> Face
+        """
+        Return the Face at the given index.
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError('Face index out of range.')
+        faceIndex = self._facesBegin + index
+        return Face(int(self._faceOffsets[faceIndex]), int(self._faceOffsets[faceIndex + 1]))
+
+    def __iter__(self):
+        # type: () -> Iterator[Face]
+        """
+        Iterate over the Faces of the view.
+        """
+        faceOffsets = self._faceOffsets[self._facesBegin:self._facesEnd + 1].tolist()
+        for pointsBegin, pointsEnd in zip(faceOffsets[:-1], faceOffsets[1:]):
+            yield Face(pointsBegin, pointsEnd)
+
+class ColumnarOBJStream(object):
+    """
+    OBJ content stream storing its data in contiguous typed arrays.
+
+    Instead of one Python object per Point and per Face, vertices, UVs,
+    normals and point indices are kept in NumPy arrays, Faces are described by
+    an array of offsets into the points and Groups by ranges of Faces. The
+    OBJStream accessors remain available and return lightweight views over
+    these arrays.
+    """
+
+    def __init__(self, verts, uvs, normals, pointIndices, faceOffsets, groupRanges, materialMap):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, List[Tuple[str, int, int]], dict) -> ColumnarOBJStream
+        """
+        Create a new columnar OBJ content stream from the given arrays.
+
+        `pointIndices` holds one (vertIndex, uvIndex, normalIndex) row per
+        Point, `faceOffsets` holds the index of the first Point of each Face
+        followed by the total number of Points, and `groupRanges` holds one
+        (name, facesBegin, facesEnd) tuple per Group.
+        """
+        self._verts = verts
+        self._uvs = uvs
+        self._normals = normals
+        self._pointIndices = pointIndices
+        self._faceOffsets = faceOffsets
+        self._groupRanges = groupRanges
+        self._materialMap = materialMap
+
+    def GetVertArray(self):
+        # type: () -> numpy.ndarray
+        """
+        Return the (N, 3) array of vertex positions.
+        """
+        return self._verts
+
+    def GetUVArray(self):
+        # type: () -> numpy.ndarray
+        """
+        Return the (N, 2) array of UV coordinates.
+        """
+        return self._uvs
+
+    def GetNormalArray(self):
+        # type: () -> numpy.ndarray
+        """
+        Return the (N, 3) array of Normals.
+        """
+        return self._normals
+
+    def GetPointIndexArray(self):
+        # type: () -> numpy.ndarray
+        """
+        Return the (N, 3) array of (vertIndex, uvIndex, normalIndex) rows of
+        the Points.
+        """
+        return self._pointIndices
+
+    def GetFaceOffsets(self):
+        # type: () -> numpy.ndarray
+        """
+        Return the offsets of the first Point of each Face, followed by the
+        total number of Points.
+        """
+        return self._faceOffsets
+
+    def GetGroupRanges(self):
+        # type: () -> List[Tuple[str, int, int]]
+        """
+        Return the (name, facesBegin, facesEnd) range of each Group.
+        """
+        return self._groupRanges
+
+    def GetVerts(self):
+        # type: () -> Sequence[Tuple[float, float, float]]
+        """
+        Return a view of the vertices for the OBJ Stream.
+        """
+        return _RowsView(self._verts)
+
+    def GetUVs(self):
+        # type: () -> Sequence[Tuple[float, float]]
+        """
+        Return a view of the UV coordinates for the OBJ Stream.
+        """
+        return _RowsView(self._uvs)
+
+    def GetNormals(self):
+        # type: () -> Sequence[Tuple[float, float, float]]
+        """
+        Return a view of the Normals for the OBJ Stream.
+        """
+        return _RowsView(self._normals)
+
+    def GetPoints(self):
+        # type: () -> Sequence[Point]
+        """
+        Return a view of the Points for the OBJ Stream.
+        """
+        return _PointsView(self._pointIndices)
+
+    def GetGroups(self):
+        # type: () -> List[Group]
+        """
+        Return the list of Groups for the OBJ Stream, with views of their Faces.
+        """
+        return [
+            Group(name, _FacesView(self._faceOffsets, facesBegin, facesEnd))
+            for name, facesBegin, facesEnd in self._groupRanges
+        ]
+
+    def IterGroupData(self):
+        # type: () -> Iterator[OBJGroupData]
+        """
+        Yield the self-contained content of each Group of the OBJ Stream.
+        """
+        for name, facesBegin, facesEnd in self._groupRanges:
+            pointsBegin = self._faceOffsets[facesBegin]
+            pointsEnd = self._faceOffsets[facesEnd]
+            faceVertexIndices, points = _compactVertices(
+                self._pointIndices[pointsBegin:pointsEnd, 0],
+                self._verts)
+            yield OBJGroupData(
+                name=name,
+                materialName=self.GetMaterialForGroup(name),
+                faceVertexCounts=numpy.diff(self._faceOffsets[facesBegin:facesEnd + 1]).astype(numpy.int32),
+                faceVertexIndices=faceVertexIndices,
+                points=points)
+
+    def FindGroup(self, groupName):
+        # type: (str) -> Group or None
+        """
+        Return the Group matching the given name.
+        """
+        for group in self.GetGroups():
+            if group.name == groupName:
+                return group
+        return None
+
+    def GetMaterialForGroup(self, groupName):
+        # type: (str) -> str
+        """
+        Return the name of the Material to use for the given Group.
+        """
+        return self._materialMap.get(groupName, 'default')
+
+    def GetMaterialNames(self):
+        # type: () -> List[str]
+        """
+        Return the list of all Material names for the OBJ Stream.
+        """
+        return list(self._materialMap.values())
+
+    def GetMaterialMap(self):
+        # type: () -> Dict[str, str]
+        """
+        Return the map of Group names to Material names for the OBJ Stream.
+        """
+        return self._materialMap
+
+    def GetCurrentGroup(self):
+        # type: () -> str
+        """
+        Return the name of the current Group for the OBJ Stream.
+        """
+        return self._groupRanges[-1][0]
+
+
+class OBJGroupData(object):
+    """
+    Self-contained content of a single Group of an OBJ file.
+    """
+
+    def __init__(self, name, materialName, faceVertexCounts, faceVertexIndices, points):
+        # type: (str, str, numpy.ndarray, numpy.ndarray, numpy.ndarray) -> OBJGroupData
+        """
+        Build the content of a Group from its Faces and the vertices they
+        reference.
+
+        `faceVertexIndices` index into `points`, which only holds the vertices
+        referenced by the Faces of the Group, in order of first use.
+        """
+        self.name = name
+        self.materialName = materialName
+        self.faceVertexCounts = faceVertexCounts
+        self.faceVertexIndices = faceVertexIndices
+        self.points = points
+
 
 def getDisplayColorForMaterial(assetOBJPath, materialName, sourceDirectoryPath):
     # type: (str, str, str) -> List[float] or None
     """
     Return the display color to use for the given Material Name.
     """
-    assetSubDirName = os.path.relpath(assetOBJPath, sourceDirectoryPath).split('\\')[1]
-    assetMaterialFilePath = os.path.join(sourceDirectoryPath, 'json', assetSubDirName, 'materials.json')
-    if os.path.exists(assetMaterialFilePath):
-        with open(assetMaterialFilePath) as f:
-            materialJSONData = json.load(f)
-        materialData = materialJSONData.get(materialName)
-        if materialData:
-            baseColor = materialData.get('baseColor')
-            if baseColor is not None and baseColor != [1.0, 0.0, 0.0] and baseColor != [1.0, 0.0, 1.0]:
-                return baseColor
+    elementName = getElementNameForOBJPath(assetOBJPath, sourceDirectoryPath)
+    materialRecord = getSharedMaterialDatabase(sourceDirectoryPath).GetMaterial(elementName, materialName)
+    if materialRecord is not None and materialRecord.displayColor is not None:
+        return materialRecord.baseColor
     return None
 
 def getDisplayOpacityForMaterial(assetOBJPath, materialName, sourceDirectoryPath):
@@ -218,26 +501,400 @@ def getDisplayOpacityForMaterial(assetOBJPath, materialName, sourceDirectoryPath
     """
     Return the opacity to use for the given Material Name.
     """
-    assetSubDirName = os.path.relpath(assetOBJPath, sourceDirectoryPath).split('\\')[1]
-    assetMaterialFilePath = os.path.join(sourceDirectoryPath, 'json', assetSubDirName, 'materials.json')
-    if os.path.exists(assetMaterialFilePath):
-        with open(assetMaterialFilePath) as f:
-            materialJSONData = json.load(f)
-        materialData = materialJSONData.get(materialName)
-        if materialData:
-            baseColor = materialData.get('baseColor')
-            if baseColor is not None and len(baseColor) >= 4:
-                return baseColor[3]
+    elementName = getElementNameForOBJPath(assetOBJPath, sourceDirectoryPath)
+    materialRecord = getSharedMaterialDatabase(sourceDirectoryPath).GetMaterial(elementName, materialName)
+    if materialRecord is not None:
+        return materialRecord.opacity
     return None
 
-def getOBJStreamForFile(inputFile):
-    # type: (str) -> OBJStream
+
+# Version of the columnar OBJ parser, to be incremented whenever its output
+# changes so that previously cached parses get invalidated:
+OBJ_PARSER_VERSION = 'columnar-1'
+
+# Size of the blocks of text read at once when parsing OBJ files into columnar
+# streams, in bytes:
+OBJ_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Smallest byte range handed to a worker process when parsing OBJ files in
+# parallel, below which the cost of the process round-trip dominates:
+OBJ_MIN_PARALLEL_CHUNK_SIZE = 1024 * 1024
+
+_GROUP_EVENT = 'g'
+_MATERIAL_EVENT = 'usemtl'
+
+
+class _OBJChunk(object):
+    """
+    Content parsed from a block of whole lines of an OBJ file.
+
+    Group and Material statements are recorded as events along with the number
+    of Faces parsed in the block before them, so that blocks can be parsed
+    independently and merged afterwards.
+    """
+
+    def __init__(self, verts, uvs, normals, pointIndices, faceSizes, events):
+        # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, List[Tuple[str, int, str]]) -> _OBJChunk
+        """
+        Build a parsed OBJ block from the given arrays and events.
+        """
+        self.verts = verts
+        self.uvs = uvs
+        self.normals = normals
+        self.pointIndices = pointIndices
+        self.faceSizes = faceSizes
+        self.events = events
+
+def _toNativeString(value):
+    # type: (bytes) -> str
+    """
+    Return the given bytes as a native string.
+    """
+    if isinstance(value, str):
+        return value
+    return value.decode('utf-8')
+
+def _parseFloatLines(lines, componentCount):
+    # type: (List[bytes], int) -> numpy.ndarray
+    """
+    Parse the first components of the given "v", "vt" or "vn" lines into an
+    array of floats.
+    """
+    if not lines:
+        return numpy.zeros((0, componentCount), dtype=numpy.float32)
+
+    # Fast path: parse all the lines at once when they all have the expected
+    # number of components, dropping the leading statement of each line. This
+    # is the case when statements are only found at the start of each row, as
+    # each line holds exactly one of them:
+    rowLength = componentCount + 1
+    values = b' '.join(lines).split()
+    statements = values[::rowLength]
+    if len(values) == rowLength * len(lines) and statements.count(values[0]) == len(lines) == values.count(values[0]):
+        del values[::rowLength]
+        return numpy.array(values, dtype=numpy.float32).reshape(-1, componentCount)
+
+    # Slow path: parse each line on its own, ignoring extra components (such
+    # as vertex colors):
+    rows = []
+    for line in lines:
+        row = line.split()[1:rowLength]
+        if len(row) != componentCount:
+            raise ValueError('Malformed OBJ statement "{line}", expected {componentCount} components.'.format(
+                line=_toNativeString(line.strip()),
+                componentCount=componentCount))
+        rows.append(row)
+    return numpy.array(rows, dtype=numpy.float32).reshape(-1, componentCount)
+
+def _parsePointToken(token):
+    # type: (bytes) -> Tuple[int, int, int]
+    """
+    Parse a single "v/vt/vn" Face token into 0-based indices.
+    """
+    uvIndex = -1
+    nIndex = -1
+    segments = token.split(b'/')
+    vertIndex = int(segments[0]) - 1 if segments[0] != b'' else -1
+    if len(segments) > 1 and segments[1] != b'':
+        uvIndex = int(segments[1]) - 1
+    if len(segments) > 2 and segments[2] != b'':
+        nIndex = int(segments[2]) - 1
+    return (vertIndex, uvIndex, nIndex)
+
+def _parseFaceLines(lines):
+    # type: (List[bytes]) -> Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    Parse the given "f" lines into an (N, 3) array of Point indices and an
+    array of Face sizes.
+    """
+    if not lines:
+        return (numpy.zeros((0, 3), dtype=numpy.int32), numpy.zeros(0, dtype=numpy.int32))
+
+    tokens = numpy.array(b' '.join(lines).split())
+    faceMarkers = numpy.flatnonzero(tokens == b'f')
+    faceSizes = (numpy.diff(numpy.append(faceMarkers, len(tokens))) - 1).astype(numpy.int32)
+    pointTokens = numpy.delete(tokens, faceMarkers)
+    del tokens
+
+    pointIndices = numpy.full((len(pointTokens), 3), -1, dtype=numpy.int32)
+    if len(pointTokens) == 0:
+        return (pointIndices, faceSizes)
+
+    # Fast path: when all the Points share the same "v", "v/vt" or "v/vt/vn"
+    # layout, parse them all at once. Missing indices (as in "v//vn") are
+    # parsed as 0, which maps to the -1 sentinel once converted to 0-based:
+    slashCounts = numpy.char.count(pointTokens, b'/')
+    slashCount = int(slashCounts[0])
+    if slashCount <= 2 and (slashCounts == slashCount).all():
+        fields = b' '.join(pointTokens.tolist()).replace(b'//', b'/0/').replace(b'/', b' ').split()
+        if len(fields) == (slashCount + 1) * len(pointTokens):
+            pointIndices[:, :slashCount + 1] = numpy.array(fields, dtype=numpy.int64).reshape(-1, slashCount + 1) - 1
+            return (pointIndices, faceSizes)
+
+    for index, token in enumerate(pointTokens.tolist()):
+        pointIndices[index] = _parsePointToken(token)
+    return (pointIndices, faceSizes)
+
+def _parseOBJChunk(data):
+    # type: (bytes) -> _OBJChunk
+    """
+    Parse the given block of whole OBJ lines.
+    """
+    vertLines = []
+    uvLines = []
+    normalLines = []
+    faceLines = []
+    events = []
+
+    for line in data.split(b'\n'):
+        line = line.strip()
+        if line == b'':
+            continue
+
+        statement = line[:2]
+        if statement == b'v ':
+            vertLines.append(line)
+        elif statement == b'vn':
+            normalLines.append(line)
+        elif statement == b'vt':
+            uvLines.append(line)
+        elif statement == b'f ':
+            faceLines.append(line)
+        elif statement[:1] == b'g':
+            groupName = line.replace(b'g ', b'')
+            if groupName == b'g':
+                groupName = b'default'
+            events.append((_GROUP_EVENT, len(faceLines), _toNativeString(groupName)))
+        elif line.startswith(b'usemtl '):
+            materialName = line.replace(b'usemtl ', b'').strip()
+            if materialName != b'':
+                events.append((_MATERIAL_EVENT, len(faceLines), _toNativeString(materialName)))
+
+    pointIndices, faceSizes = _parseFaceLines(faceLines)
+    return _OBJChunk(
+        verts=_parseFloatLines(vertLines, 3),
+        uvs=_parseFloatLines(uvLines, 2),
+        normals=_parseFloatLines(normalLines, 3),
+        pointIndices=pointIndices,
+        faceSizes=faceSizes,
+        events=events)
+
+def _mergeOBJChunks(chunks):
+    # type: (List[_OBJChunk]) -> ColumnarOBJStream
+    """
+    Merge the given consecutive parsed OBJ blocks into a columnar stream,
+    replaying their Group and Material statements in order.
+    """
+    faceCount = sum(len(chunk.faceSizes) for chunk in chunks)
+    faceOffsets = numpy.zeros(faceCount + 1, dtype=numpy.int64)
+    if chunks:
+        numpy.cumsum(numpy.concatenate([chunk.faceSizes for chunk in chunks]), out=faceOffsets[1:])
+
+    groupNames = []
+    groupBegins = []
+    materialMap = {
+        'default': 'default'
+    }
+
+    def ensureGroupExists(faceIndex):
+        # Faces found before any Group statement belong to a "default" Group:
+        if not groupNames and faceIndex > 0:
+            groupNames.append('default')
+            groupBegins.append(0)
+
+    chunkFaceBegin = 0
+    for chunk in chunks:
+        for eventType, chunkFaceIndex, name in chunk.events:
+            faceIndex = chunkFaceBegin + chunkFaceIndex
+            ensureGroupExists(faceIndex)
+            if eventType == _GROUP_EVENT:
+                if name not in groupNames:
+                    groupNames.append(name)
+                    groupBegins.append(faceIndex)
+            elif eventType == _MATERIAL_EVENT:
+                currentGroupName = groupNames[-1] if groupNames else 'default'
+                materialMap.update({ currentGroupName: name })
+        chunkFaceBegin += len(chunk.faceSizes)
+    ensureGroupExists(faceCount)
+
+    groupEnds = groupBegins[1:] + [faceCount]
+    groupRanges = list(zip(groupNames, groupBegins, groupEnds))
+
+    def concatenate(arrays, shape, dtype):
+        if not arrays:
+            return numpy.zeros(shape, dtype=dtype)
+        return numpy.concatenate(arrays)
+
+    return ColumnarOBJStream(
+        verts=concatenate([chunk.verts for chunk in chunks], (0, 3), numpy.float32),
+        uvs=concatenate([chunk.uvs for chunk in chunks], (0, 2), numpy.float32),
+        normals=concatenate([chunk.normals for chunk in chunks], (0, 3), numpy.float32),
+        pointIndices=concatenate([chunk.pointIndices for chunk in chunks], (0, 3), numpy.int32),
+        faceOffsets=faceOffsets,
+        groupRanges=groupRanges,
+        materialMap=materialMap)
+
+def _iterOBJBlocks(f, chunkSize):
+    # type: (file, int) -> Iterator[bytes]
+    """
+    Read the given binary OBJ file in blocks of whole lines of roughly the
+    given size.
+    """
+    remainder = b''
+    while True:
+        data = f.read(chunkSize)
+        if not data:
+            break
+        data = remainder + data
+        lastLineEnd = data.rfind(b'\n')
+        if lastLineEnd == -1:
+            remainder = data
+            continue
+        remainder = data[lastLineEnd + 1:]
+        yield data[:lastLineEnd + 1]
+    if remainder:
+        yield remainder
+
+def _getColumnarOBJStreamForFile(inputFile, chunkSize):
+    # type: (str, int) -> ColumnarOBJStream
+    """
+    Parse the given OBJ file block by block into a columnar stream.
+    """
+    with open(inputFile, 'rb') as f:
+        chunks = [_parseOBJChunk(data) for data in _iterOBJBlocks(f, chunkSize)]
+    return _mergeOBJChunks(chunks)
+
+def _getOBJFileRanges(inputFile, chunkSize):
+    # type: (str, int) -> List[Tuple[int, int]]
+    """
+    Split the given OBJ file into [begin, end) byte ranges of roughly the given
+    size, ending on line boundaries.
+    """
+    fileSize = os.path.getsize(inputFile)
+    if fileSize == 0:
+        return []
+
+    fileRanges = []
+    with open(inputFile, 'rb') as f:
+        mappedFile = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            rangeBegin = 0
+            while rangeBegin < fileSize:
+                rangeEnd = mappedFile.find(b'\n', min(rangeBegin + chunkSize, fileSize) - 1)
+                rangeEnd = fileSize if rangeEnd == -1 else rangeEnd + 1
+                fileRanges.append((rangeBegin, rangeEnd))
+                rangeBegin = rangeEnd
+        finally:
+            mappedFile.close()
+    return fileRanges
+
+def _parseOBJFileRange(arguments):
+    # type: (Tuple[str, int, int]) -> _OBJChunk
+    """
+    Parse the [begin, end) byte range of the given OBJ file.
+
+    Executed in worker processes, which each map the file in memory instead
+    of receiving its content from the parent process.
+    """
+    inputFile, rangeBegin, rangeEnd = arguments
+    with open(inputFile, 'rb') as f:
+        mappedFile = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            data = mappedFile[rangeBegin:rangeEnd]
+        finally:
+            mappedFile.close()
+    return _parseOBJChunk(data)
+
+def _getParallelColumnarOBJStreamForFile(inputFile, chunkSize, jobs):
+    # type: (str, int, int) -> ColumnarOBJStream
+    """
+    Parse the given OBJ file into a columnar stream, splitting it in byte
+    ranges parsed in parallel by a pool of worker processes.
+
+    Ranges are merged in file order, so the result is identical to the one of
+    a serial parse.
+    """
+    # Use at least a few ranges per worker, so that uneven ranges (e.g. ranges
+    # with mostly vertices vs. ranges with mostly Faces) balance out:
+    chunkSize = min(chunkSize, max(os.path.getsize(inputFile) // (jobs * 4), OBJ_MIN_PARALLEL_CHUNK_SIZE))
+    fileRanges = _getOBJFileRanges(inputFile, chunkSize)
+    if len(fileRanges) <= 1:
+        return _getColumnarOBJStreamForFile(inputFile, chunkSize)
+
+    pool = multiprocessing.Pool(processes=min(jobs, len(fileRanges)))
+    try:
+        chunks = pool.map(
+            _parseOBJFileRange,
+            [(inputFile, rangeBegin, rangeEnd) for rangeBegin, rangeEnd in fileRanges],
+            chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return _mergeOBJChunks(chunks)
+
+def getOBJStreamForFile(inputFile, columnar=False, chunkSize=OBJ_CHUNK_SIZE, jobs=1):
+    # type: (str, boolean, int, int) -> OBJStream or ColumnarOBJStream
     """
     Parse the given OBJ file and return its stream representation.
+
+    When `columnar` is set, the content is returned as a ColumnarOBJStream
+    backed by contiguous arrays, which uses a fraction of the memory of the
+    OBJStream made of individual Point and Face objects. When `jobs` is larger
+    than 1, the file is memory-mapped and parsed in parallel by that many
+    processes into a ColumnarOBJStream.
+    """
+    if jobs > 1:
+        return _getParallelColumnarOBJStreamForFile(inputFile, chunkSize, jobs)
+    if columnar:
+        return _getColumnarOBJStreamForFile(inputFile, chunkSize)
+    return _getOBJStreamForFile(inputFile)
+
+def getCachedOBJStreamForFile(inputFile, arrayCache, jobs=1):
+    # type: (str, moana2usd.dataset.array_cache.ArrayCache, int) -> ColumnarOBJStream
+    """
+    Return the columnar stream of the given OBJ file from the given cache,
+    parsing the file and caching the result if it was not cached yet.
+
+    Cached arrays are memory-mapped, so that a warm cache skips text parsing
+    altogether.
+    """
+    cachedEntry = arrayCache.Load(inputFile, OBJ_PARSER_VERSION)
+    if cachedEntry is not None:
+        arrays, metadata = cachedEntry
+        return ColumnarOBJStream(
+            verts=arrays.get('verts'),
+            uvs=arrays.get('uvs'),
+            normals=arrays.get('normals'),
+            pointIndices=arrays.get('pointIndices'),
+            faceOffsets=arrays.get('faceOffsets'),
+            groupRanges=[tuple(groupRange) for groupRange in metadata.get('groupRanges')],
+            materialMap=metadata.get('materialMap'))
+
+    objStream = getOBJStreamForFile(inputFile, columnar=True, jobs=jobs)
+    arrayCache.Store(
+        inputFile,
+        OBJ_PARSER_VERSION,
+        arrays={
+            'verts': objStream.GetVertArray(),
+            'uvs': objStream.GetUVArray(),
+            'normals': objStream.GetNormalArray(),
+            'pointIndices': objStream.GetPointIndexArray(),
+            'faceOffsets': objStream.GetFaceOffsets()
+        },
+        metadata={
+            'groupRanges': objStream.GetGroupRanges(),
+            'materialMap': objStream.GetMaterialMap()
+        })
+    return objStream
+
+def _getOBJStreamForFile(inputFile):
+    # type: (str) -> OBJStream
+    """
+    Parse the given OBJ file into an OBJStream of Point and Face objects.
     """
     objStream = OBJStream()
 
-    with open(inputFile, 'rU') as f:
+    with open(inputFile, 'r') as f:
         for line in f:
             line = line.strip()
             if line == '':
@@ -285,3 +942,126 @@ def getOBJStreamForFile(inputFile):
                     objStream.AddMaterial(objStream.GetCurrentGroup(), materialName)
 
     return objStream
+
+class _GrowableArray(object):
+    """
+    Array of rows to which blocks can be appended in amortized constant time.
+    """
+
+    def __init__(self, columnCount, dtype):
+        # type: (int, numpy.dtype) -> _GrowableArray
+        """
+        Create an empty array of rows of the given width and type.
+        """
+        self._buffer = numpy.zeros((1024, columnCount), dtype=dtype)
+        self._size = 0
+
+    def Extend(self, rows):
+        # type: (numpy.ndarray) -> None
+        """
+        Append the given rows to the array.
+        """
+        requiredSize = self._size + len(rows)
+        if requiredSize > len(self._buffer):
+            newBuffer = numpy.zeros((max(requiredSize, 2 * len(self._buffer)),) + self._buffer.shape[1:], dtype=self._buffer.dtype)
+            newBuffer[:self._size] = self._buffer[:self._size]
+            self._buffer = newBuffer
+        self._buffer[self._size:requiredSize] = rows
+        self._size = requiredSize
+
+    def GetArray(self):
+        # type: () -> numpy.ndarray
+        """
+        Return a view of the rows appended so far.
+        """
+        return self._buffer[:self._size]
+
+def _compactVertices(vertIndices, verts):
+    # type: (numpy.ndarray, numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    Return the given vertex indices remapped to a buffer holding only the
+    vertices they reference, in order of first use, along with that buffer.
+    """
+    uniqueVertIndices, firstUses, inverseIndices = numpy.unique(vertIndices, return_index=True, return_inverse=True)
+
+    # Rank the unique vertices by first use rather than by index, so that the
+    # buffer follows the order in which Faces reference vertices:
+    firstUseOrder = numpy.argsort(firstUses, kind='mergesort')
+    firstUseRanks = numpy.empty(len(firstUseOrder), dtype=numpy.int32)
+    firstUseRanks[firstUseOrder] = numpy.arange(len(firstUseOrder), dtype=numpy.int32)
+
+    localIndices = firstUseRanks[inverseIndices.reshape(-1)]
+    return (localIndices, verts[uniqueVertIndices[firstUseOrder]])
+
+def iterOBJGroupsForFile(inputFile, chunkSize=OBJ_CHUNK_SIZE):
+    # type: (str, int) -> Iterator[OBJGroupData]
+    """
+    Parse the given OBJ file and yield the content of each of its Groups as
+    soon as it is complete.
+
+    Since Faces are always added to the most recently created Group, a Group
+    is complete once the next one starts. Only the Faces are streamed per
+    Group: the vertices of the whole file are kept in memory until it is
+    parsed, as Faces may reference any vertex read before them.
+    """
+    verts = _GrowableArray(3, numpy.float32)
+    groupNames = set()
+    materialMap = {}
+    # Name of the Group being read, and the (faceSizes, vertIndices) blocks of
+    # its Faces:
+    currentGroup = [None, []]
+
+    def startGroup(groupName):
+        groupNames.add(groupName)
+        currentGroup[0] = groupName
+        currentGroup[1] = []
+
+    def finishGroup():
+        groupName, faceBlocks = currentGroup
+        if groupName is None:
+            return None
+        faceVertexCounts = numpy.concatenate([faceSizes for faceSizes, _ in faceBlocks] or [numpy.zeros(0, dtype=numpy.int32)])
+        vertIndices = numpy.concatenate([vertIndices for _, vertIndices in faceBlocks] or [numpy.zeros(0, dtype=numpy.int32)])
+        faceVertexIndices, points = _compactVertices(vertIndices, verts.GetArray())
+        return OBJGroupData(
+            name=groupName,
+            materialName=materialMap.get(groupName, 'default'),
+            faceVertexCounts=faceVertexCounts,
+            faceVertexIndices=faceVertexIndices,
+            points=points)
+
+    def addFaces(chunk, pointOffsets, facesBegin, facesEnd):
+        if facesBegin == facesEnd:
+            return
+        # Faces found before any Group statement belong to a "default" Group:
+        if currentGroup[0] is None:
+            startGroup('default')
+        currentGroup[1].append((
+            chunk.faceSizes[facesBegin:facesEnd].copy(),
+            chunk.pointIndices[pointOffsets[facesBegin]:pointOffsets[facesEnd], 0].copy()))
+
+    with open(inputFile, 'rb') as f:
+        for data in _iterOBJBlocks(f, chunkSize):
+            chunk = _parseOBJChunk(data)
+            verts.Extend(chunk.verts)
+            pointOffsets = numpy.zeros(len(chunk.faceSizes) + 1, dtype=numpy.int64)
+            numpy.cumsum(chunk.faceSizes, out=pointOffsets[1:])
+
+            facesBegin = 0
+            for eventType, faceIndex, name in chunk.events:
+                addFaces(chunk, pointOffsets, facesBegin, faceIndex)
+                facesBegin = faceIndex
+                if eventType == _GROUP_EVENT:
+                    if name not in groupNames:
+                        groupData = finishGroup()
+                        if groupData is not None:
+                            yield groupData
+                        startGroup(name)
+                elif eventType == _MATERIAL_EVENT:
+                    currentGroupName = currentGroup[0] if currentGroup[0] is not None else 'default'
+                    materialMap.update({ currentGroupName: name })
+            addFaces(chunk, pointOffsets, facesBegin, len(chunk.faceSizes))
+
+    groupData = finishGroup()
+    if groupData is not None:
+        yield groupData
@@ -10,4 +10,4 @@ setup(
     author='Philippe Sawicki',
     url='https://github.com/philsawicki/moana-to-usd',
     packages=['moana2usd'],
-    install_requires=['tqdm'])
+    install_requires=['numpy', 'tqdm'])
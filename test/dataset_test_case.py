@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+"""
+Base test case for tests converting a small dataset laid out like the Moana
+Island Scene.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class DatasetTestCase(unittest.TestCase):
+    """
+    Test case writing a dataset to a temporary directory, converted to a
+    sibling directory.
+    """
+
+    def setUp(self):
+        """
+        Create the temporary directory of the dataset before each test.
+        """
+        self.temporaryDirectoryPath = tempfile.mkdtemp()
+        self.sourceDirectoryPath = os.path.join(self.temporaryDirectoryPath, 'island')
+        self.destinationDirectoryPath = os.path.join(self.temporaryDirectoryPath, 'usd')
+
+    def tearDown(self):
+        """
+        Remove the dataset and its conversion after each test.
+        """
+        shutil.rmtree(self.temporaryDirectoryPath)
+
+    def _writeFile(self, relativeFilePath, content):
+        # type: (str, str) -> str
+        """
+        Write the given content to the file at the given path, relative to the
+        root of the dataset, and return the path of the file.
+        """
+        filePath = os.path.join(self.sourceDirectoryPath, *relativeFilePath.split('/'))
+        if not os.path.isdir(os.path.dirname(filePath)):
+            os.makedirs(os.path.dirname(filePath))
+        with open(filePath, 'w') as f:
+            f.write(content)
+        return filePath
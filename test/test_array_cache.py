@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the cache of parsed dataset arrays.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from moana2usd.dataset.array_cache import ArrayCache
+from moana2usd.obj_parser.obj_parser import getCachedOBJStreamForFile, getOBJStreamForFile
+
+
+class TestArrayCache(unittest.TestCase):
+    """
+    Unit tests for the cache of parsed dataset arrays.
+    """
+
+    def setUp(self):
+        """
+        Create an empty cache and a source file before each test.
+        """
+        self.temporaryDirectoryPath = tempfile.mkdtemp()
+        self.cacheDirectoryPath = os.path.join(self.temporaryDirectoryPath, 'cache')
+        self.sourceFilePath = os.path.join(self.temporaryDirectoryPath, 'source.txt')
+        with open(self.sourceFilePath, 'w') as f:
+            f.write('source')
+        self.arrayCache = ArrayCache(self.cacheDirectoryPath)
+
+    def tearDown(self):
+        """
+        Remove the cache and source file after each test.
+        """
+        shutil.rmtree(self.temporaryDirectoryPath)
+
+    def testLoadingOfStoredEntry(self):
+        """
+        Validate that stored arrays and metadata are loaded back.
+        """
+        self.assertIsNone(self.arrayCache.Load(self.sourceFilePath, 'v1'))
+        self.arrayCache.Store(self.sourceFilePath, 'v1', {'values': numpy.arange(6).reshape(2, 3)}, {'name': 'test'})
+
+        arrays, metadata = self.arrayCache.Load(self.sourceFilePath, 'v1')
+        self.assertTrue(numpy.array_equal(arrays.get('values'), numpy.arange(6).reshape(2, 3)))
+        self.assertEqual(metadata, {'name': 'test'})
+
+    def testInvalidationOfEntries(self):
+        """
+        Validate that entries are invalidated when the version or the source
+        file changes.
+        """
+        self.arrayCache.Store(self.sourceFilePath, 'v1', {'values': numpy.arange(3)}, {})
+        self.assertIsNone(self.arrayCache.Load(self.sourceFilePath, 'v2'))
+
+        with open(self.sourceFilePath, 'w') as f:
+            f.write('modified source')
+        self.assertIsNone(self.arrayCache.Load(self.sourceFilePath, 'v1'))
+
+    def testEvictionOfEntries(self):
+        """
+        Validate that the oldest entries are evicted once the cache is over
+        budget.
+        """
+        arrayCache = ArrayCache(self.cacheDirectoryPath, maxSizeBytes=1)
+        arrayCache.Store(self.sourceFilePath, 'v1', {'values': numpy.arange(1000)}, {})
+        arrayCache.Store(self.sourceFilePath, 'v2', {'values': numpy.arange(1000)}, {})
+
+        self.assertIsNone(arrayCache.Load(self.sourceFilePath, 'v1'))
+        self.assertIsNotNone(arrayCache.Load(self.sourceFilePath, 'v2'))
+
+    def testCachingOfOBJStreams(self):
+        """
+        Validate that cached OBJ streams match the ones parsed from text.
+        """
+        objFilePath = os.path.join('test', 'teapot.obj')
+        objStream = getOBJStreamForFile(objFilePath, columnar=True)
+        getCachedOBJStreamForFile(objFilePath, self.arrayCache)
+        cachedOBJStream = getCachedOBJStreamForFile(objFilePath, self.arrayCache)
+
+        self.assertIsInstance(cachedOBJStream.GetVertArray(), numpy.memmap)
+        self.assertTrue(numpy.array_equal(cachedOBJStream.GetVertArray(), objStream.GetVertArray()))
+        self.assertTrue(numpy.array_equal(cachedOBJStream.GetPointIndexArray(), objStream.GetPointIndexArray()))
+        self.assertTrue(numpy.array_equal(cachedOBJStream.GetFaceOffsets(), objStream.GetFaceOffsets()))
+        self.assertEqual(cachedOBJStream.GetGroupRanges(), objStream.GetGroupRanges())
+        self.assertEqual(cachedOBJStream.GetMaterialNames(), objStream.GetMaterialNames())
+
+
+if __name__ == '__main__':
+    unittest.main()
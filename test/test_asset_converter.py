@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the conversion of OBJ assets to USD.
+"""
+
+import json
+import os
+import unittest
+
+from .dataset_test_case import DatasetTestCase
+
+try:
+    from pxr import Gf, Usd, UsdGeom, UsdShade
+    from moana2usd.converters.asset_converter import AssetConverter
+    from moana2usd.converters.base_converter import ConversionError
+except ImportError:
+    Usd = None
+
+
+def _getOBJContent(groups):
+    # type: (List[Tuple[str, str, List[Tuple[float, float, float]]]]) -> str
+    """
+    Return the content of an OBJ file with the given (group name, material
+    name, quad offsets) groups, made of a unit quad at each offset.
+    """
+    lines = []
+    vertexCount = 0
+    for groupName, materialName, offsets in groups:
+        lines.append('g ' + groupName)
+        lines.append('usemtl ' + materialName)
+        for offset in offsets:
+            for x, y in [(0, 0), (1, 0), (1, 1), (0, 1)]:
+                lines.append('v {} {} {}'.format(x + offset[0], y + offset[1], offset[2]))
+            lines.append('f {} {} {} {}'.format(*range(vertexCount + 1, vertexCount + 5)))
+            vertexCount += 4
+    return '\n'.join(lines) + '\n'
+
+
+@unittest.skipIf(Usd is None, 'USD is not available.')
+class TestAssetConverter(DatasetTestCase):
+    """
+    Unit tests for the conversion of OBJ assets to USD.
+    """
+
+    def setUp(self):
+        """
+        Create a dataset with an Element of 2 archives sharing a Mesh before
+        each test.
+        """
+        super(TestAssetConverter, self).setUp()
+
+        self._writeFile('json/isA/materials.json', json.dumps({
+            'leaf': {'baseColor': [0.1, 0.6, 0.2], 'roughness': 0.5},
+            'bark': {'baseColor': [0.4, 0.3, 0.2]}
+        }))
+        self._writeFile('obj/isA/archives/archiveA.obj', _getOBJContent([
+            ('leaf_geo', 'leaf', [(0.0, 0.0, 0.0)]),
+            ('trunkA_geo', 'bark', [(5.0, 0.0, 0.0)])
+        ]))
+        self._writeFile('obj/isA/archives/archiveB.obj', _getOBJContent([
+            ('leaf_geo', 'leaf', [(0.0, 0.0, 0.0)]),
+            ('trunkB_geo', 'bark', [(0.0, 5.0, 0.0)])
+        ]))
+
+    def _convert(self, **kwargs):
+        kwargs.setdefault('loadTextures', False)
+        assetConverter = AssetConverter('usda', self.sourceDirectoryPath, self.destinationDirectoryPath, **kwargs)
+        assetConverter.convert()
+        return assetConverter
+
+    def _getAssetFilePath(self, assetName):
+        return os.path.join(self.destinationDirectoryPath, 'primitives', 'isA', assetName + '.usda')
+
+    def _getPrototypesDirectoryPath(self):
+        return os.path.join(self.destinationDirectoryPath, 'primitives', 'prototypes')
+
+    def testMeshesHoldTheFacesPointsAndExtentOfTheirGroup(self):
+        """
+        Validate that each Mesh holds the Faces and the referenced vertices of
+        its Group, bounded by its extent.
+        """
+        self._convert()
+
+        stage = Usd.Stage.Open(self._getAssetFilePath('archiveA'))
+        for groupName, offset in [('leaf_geo', Gf.Vec3f(0.0, 0.0, 0.0)), ('trunkA_geo', Gf.Vec3f(5.0, 0.0, 0.0))]:
+            mesh = UsdGeom.Mesh(stage.GetPrimAtPath('/isA/geometry/' + groupName))
+            self.assertEqual(list(mesh.GetFaceVertexCountsAttr().Get()), [4])
+            self.assertEqual(list(mesh.GetFaceVertexIndicesAttr().Get()), [0, 1, 2, 3])
+            self.assertEqual(
+                list(mesh.GetPointsAttr().Get()),
+                [offset + Gf.Vec3f(x, y, 0.0) for x, y in [(0, 0), (1, 0), (1, 1), (0, 1)]])
+            self.assertEqual(list(mesh.GetExtentAttr().Get()), [offset, offset + Gf.Vec3f(1.0, 1.0, 0.0)])
+
+    def testMaterialsAreSharedThroughTheLibraryOfTheirElement(self):
+        """
+        Validate that the materials of an Element are defined once in its
+        material library, which each of its assets references and binds.
+        """
+        self._convert()
+        materialLibraryFilePath = self._getAssetFilePath('_materials_isA')
+        materialLibraryStage = Usd.Stage.Open(materialLibraryFilePath)
+        self.assertEqual(
+            sorted(prim.GetName() for prim in materialLibraryStage.GetPrimAtPath('/materials').GetChildren()),
+            ['bark', 'leaf'])
+
+        for assetName in ['archiveA', 'archiveB']:
+            stage = Usd.Stage.Open(self._getAssetFilePath(assetName))
+            materialsPrim = stage.GetPrimAtPath('/isA/materials')
+            materialsReferences = materialsPrim.GetPrimStack()[0].referenceList.prependedItems
+            self.assertEqual([reference.assetPath for reference in materialsReferences], ['./_materials_isA.usda'])
+            self.assertEqual(sorted(prim.GetName() for prim in materialsPrim.GetChildren()), ['bark', 'leaf'])
+
+            leafMaterial, _ = UsdShade.MaterialBindingAPI(stage.GetPrimAtPath('/isA/geometry/leaf_geo')).ComputeBoundMaterial()
+            self.assertEqual(leafMaterial.GetPath(), '/isA/materials/leaf')
+
+    def testMaterialsAreBoundToTheirShaders(self):
+        """
+        Validate the Shaders and bindings of the materials of assets, both
+        shared through the material library and local to an asset.
+        """
+        self._writeFile('obj/isA/archives/archiveC.obj', _getOBJContent([
+            ('stone_geo', 'stone', [(0.0, 0.0, 0.0)])
+        ]))
+        self._convert()
+
+        stage = Usd.Stage.Open(self._getAssetFilePath('archiveA'))
+        leafMaterial = UsdShade.Material(stage.GetPrimAtPath('/isA/materials/leaf'))
+        leafShader = leafMaterial.ComputeSurfaceSource()[0]
+        self.assertEqual(leafShader.GetIdAttr().Get(), 'UsdPreviewSurface')
+        self.assertTrue(Gf.IsClose(leafShader.GetInput('diffuseColor').Get(), Gf.Vec3f(0.1, 0.6, 0.2), 1e-6))
+        self.assertAlmostEqual(leafShader.GetInput('roughness').Get(), 0.5)
+
+        stage = Usd.Stage.Open(self._getAssetFilePath('archiveC'))
+        stonePrim = stage.GetPrimAtPath('/isA/geometry/stone_geo')
+        self.assertTrue(stonePrim.HasAPI(UsdShade.MaterialBindingAPI))
+        stoneMaterial, _ = UsdShade.MaterialBindingAPI(stonePrim).ComputeBoundMaterial()
+        self.assertEqual(stoneMaterial.GetPath(), '/isA/materials/stone')
+        self.assertFalse(stoneMaterial.GetPrim().HasAuthoredReferences())
+        self.assertEqual(stoneMaterial.ComputeSurfaceSource()[0].GetIdAttr().Get(), 'UsdPreviewSurface')
+
+    def testMaterialNamesWithTheSamePrimNameAreToldApart(self):
+        """
+        Validate that materials whose names map to the same Prim name are
+        each given a Prim of their own, bound by the groups using them.
+        """
+        self._writeFile('json/isA/materials.json', json.dumps({
+            'leaf-dry': {'baseColor': [0.5, 0.4, 0.1]},
+            'leaf_dry': {'baseColor': [0.1, 0.6, 0.2]}
+        }))
+        self._writeFile('obj/isA/archives/archiveA.obj', _getOBJContent([
+            ('dryA_geo', 'leaf-dry', [(0.0, 0.0, 0.0)]),
+            ('dryB_geo', 'leaf_dry', [(5.0, 0.0, 0.0)])
+        ]))
+        self._writeFile('obj/isA/archives/archiveB.obj', _getOBJContent([
+            ('dryA_geo', 'leaf-dry', [(0.0, 0.0, 0.0)])
+        ]))
+        self._convert()
+
+        stage = Usd.Stage.Open(self._getAssetFilePath('archiveA'))
+        self.assertEqual(
+            sorted(prim.GetName() for prim in stage.GetPrimAtPath('/isA/materials').GetChildren()),
+            ['leaf_dry', 'leaf_dry_1'])
+        for groupName, materialPath, baseColor in [
+                ('dryA_geo', '/isA/materials/leaf_dry', Gf.Vec3f(0.5, 0.4, 0.1)),
+                ('dryB_geo', '/isA/materials/leaf_dry_1', Gf.Vec3f(0.1, 0.6, 0.2))]:
+            material, _ = UsdShade.MaterialBindingAPI(stage.GetPrimAtPath('/isA/geometry/' + groupName)).ComputeBoundMaterial()
+            self.assertEqual(material.GetPath(), materialPath)
+            self.assertTrue(Gf.IsClose(material.ComputeSurfaceSource()[0].GetInput('diffuseColor').Get(), baseColor, 1e-6))
+
+    def testGeometryIsLoadedThroughPayloads(self):
+        """
+        Validate that the geometry of assets is moved to a payload, which
+        can be left unloaded while keeping the bounds and materials of the
+        asset.
+        """
+        self._convert(usePayloads=True)
+        self.assertTrue(os.path.exists(self._getAssetFilePath('_payload_archiveA')))
+
+        stage = Usd.Stage.Open(self._getAssetFilePath('archiveA'), Usd.Stage.LoadNone)
+        rootPrim = stage.GetPrimAtPath('/isA')
+        self.assertEqual(
+            [payload.assetPath for payload in rootPrim.GetPrimStack()[0].payloadList.prependedItems],
+            ['./_payload_archiveA.usda'])
+        self.assertFalse(stage.GetPrimAtPath('/isA/geometry/leaf_geo').IsValid())
+        self.assertTrue(stage.GetPrimAtPath('/isA/materials/leaf').IsValid())
+        self.assertEqual(len(UsdGeom.ModelAPI(rootPrim).GetExtentsHint()), 2)
+
+        stage.Load('/isA')
+        leafPrim = stage.GetPrimAtPath('/isA/geometry/leaf_geo')
+        self.assertEqual(len(UsdGeom.Mesh(leafPrim).GetPointsAttr().Get()), 4)
+        leafMaterial, _ = UsdShade.MaterialBindingAPI(leafPrim).ComputeBoundMaterial()
+        self.assertEqual(leafMaterial.GetPath(), '/isA/materials/leaf')
+
+    def testMeshesAreAuthoredInAssetsByDefault(self):
+        """
+        Validate that Meshes hold their own geometry unless sharing is
+        enabled.
+        """
+        self._convert()
+        self.assertFalse(os.path.exists(self._getPrototypesDirectoryPath()))
+
+        stage = Usd.Stage.Open(self._getAssetFilePath('archiveA'))
+        meshPrim = stage.GetPrimAtPath('/isA/geometry/leaf_geo')
+        self.assertFalse(meshPrim.HasAuthoredReferences())
+        self.assertEqual(len(UsdGeom.Mesh(meshPrim).GetPointsAttr().Get()), 4)
+
+    def testSharedMeshesReferenceASinglePrototype(self):
+        """
+        Validate that only the Meshes found in several assets are written to
+        a prototype, which each of their assets references.
+        """
+        self._convert(shareMeshes=True)
+        prototypeFileNames = os.listdir(self._getPrototypesDirectoryPath())
+        self.assertEqual(len(prototypeFileNames), 1)
+
+        for assetName, trunkName in [('archiveA', 'trunkA_geo'), ('archiveB', 'trunkB_geo')]:
+            stage = Usd.Stage.Open(self._getAssetFilePath(assetName))
+
+            leafPrim = stage.GetPrimAtPath('/isA/geometry/leaf_geo')
+            leafReferences = leafPrim.GetPrimStack()[0].referenceList.prependedItems
+            self.assertEqual([reference.assetPath for reference in leafReferences], ['../prototypes/' + prototypeFileNames[0]])
+            self.assertEqual(len(UsdGeom.Mesh(leafPrim).GetPointsAttr().Get()), 4)
+            self.assertEqual(list(UsdGeom.Mesh(leafPrim).GetFaceVertexCountsAttr().Get()), [4])
+
+            trunkPrim = stage.GetPrimAtPath('/isA/geometry/' + trunkName)
+            self.assertFalse(trunkPrim.HasAuthoredReferences())
+            self.assertEqual(len(UsdGeom.Mesh(trunkPrim).GetPointsAttr().Get()), 4)
+
+    def testOutdatedPrototypesAreRebuilt(self):
+        """
+        Validate that prototypes are tracked by the build manifest, and
+        rebuilt along with the assets referencing them once modified.
+        """
+        self._convert(shareMeshes=True)
+        prototypeFilePath = os.path.join(self._getPrototypesDirectoryPath(), os.listdir(self._getPrototypesDirectoryPath())[0])
+        with open(prototypeFilePath, 'r') as f:
+            prototypeContent = f.read()
+
+        with open(prototypeFilePath, 'w') as f:
+            f.write('#usda 1.0\n')
+        self._convert(shareMeshes=True)
+        with open(prototypeFilePath, 'r') as f:
+            self.assertEqual(f.read(), prototypeContent)
+
+    def testPtexTexturedMeshesAreNotTiled(self):
+        """
+        Validate that large Meshes are split into tiles, unless they have a
+        Ptex texture whose faces tiles would not preserve.
+        """
+        offsets = [(10.0 * x, 0.0, 0.0) for x in range(4)]
+        self._writeFile('obj/isA/isA.obj', _getOBJContent([
+            ('ground_geo', 'bark', offsets),
+            ('canopy_geo', 'leaf', offsets)
+        ]))
+        self._writeFile('textures/isA/Color/canopy_geo.ptx', '')
+        self._convert(loadTextures=True, maxMeshFaceCount=2)
+
+        stage = Usd.Stage.Open(self._getAssetFilePath('isA'))
+        groundPrim = stage.GetPrimAtPath('/isA/geometry/ground_geo')
+        self.assertEqual(groundPrim.GetTypeName(), 'Xform')
+        tilePrims = groundPrim.GetChildren()
+        self.assertGreater(len(tilePrims), 1)
+        self.assertEqual(sum(len(UsdGeom.Mesh(tilePrim).GetFaceVertexCountsAttr().Get()) for tilePrim in tilePrims), 4)
+
+        canopyPrim = stage.GetPrimAtPath('/isA/geometry/canopy_geo')
+        self.assertEqual(canopyPrim.GetTypeName(), 'Mesh')
+        self.assertEqual(len(UsdGeom.Mesh(canopyPrim).GetFaceVertexCountsAttr().Get()), 4)
+
+    def testFailedAssetsAreReportedOnceOthersAreTranslated(self):
+        """
+        Validate that an asset failing to translate does not prevent the
+        others from being translated, and fails the conversion once they are,
+        both serially and in parallel.
+        """
+        self._writeFile('obj/isA/archives/archiveC.obj', 'g broken_geo\nusemtl leaf\nv 0 0 0\nf 1 2 3\n')
+        for jobs in [1, 2]:
+            with self.assertRaises(ConversionError) as context:
+                self._convert(jobs=jobs)
+            self.assertEqual([filePath for filePath, _ in context.exception.Failures], [
+                os.path.join(self.sourceDirectoryPath, 'obj', 'isA', 'archives', 'archiveC.obj')
+            ])
+            self.assertTrue(os.path.exists(self._getAssetFilePath('archiveA')))
+            self.assertTrue(os.path.exists(self._getAssetFilePath('archiveB')))
+
+
+if __name__ == '__main__':
+    unittest.main()
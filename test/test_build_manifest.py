@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the manifest of built USD layers.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from moana2usd.converters.build_manifest import BuildManifest
+
+
+class TestBuildManifest(unittest.TestCase):
+    """
+    Unit tests for the manifest of built USD layers.
+    """
+
+    def setUp(self):
+        """
+        Create a source file and its output before each test.
+        """
+        self.temporaryDirectoryPath = tempfile.mkdtemp()
+        self.sourceFilePath = os.path.join(self.temporaryDirectoryPath, 'source.obj')
+        self.outputFilePath = os.path.join(self.temporaryDirectoryPath, 'output.usda')
+        self._writeFile(self.sourceFilePath, 'v 0 0 0')
+        self._writeFile(self.outputFilePath, '#usda 1.0')
+        self.options = {'format': 'usda'}
+
+    def tearDown(self):
+        """
+        Remove the source file and its output after each test.
+        """
+        shutil.rmtree(self.temporaryDirectoryPath)
+
+    def _writeFile(self, filePath, content):
+        with open(filePath, 'w') as f:
+            f.write(content)
+
+    def testRecordedOutputIsUpToDateAcrossRuns(self):
+        """
+        Validate that a recorded output is not rebuilt by a subsequent run.
+        """
+        buildManifest = BuildManifest(self.temporaryDirectoryPath, self.temporaryDirectoryPath)
+        self.assertFalse(buildManifest.IsUpToDate(self.outputFilePath, [self.sourceFilePath], self.options))
+        buildManifest.Record(self.outputFilePath, [self.sourceFilePath], self.options)
+        buildManifest.Save()
+
+        buildManifest = BuildManifest(self.temporaryDirectoryPath, self.temporaryDirectoryPath)
+        self.assertTrue(buildManifest.IsUpToDate(self.outputFilePath, [self.sourceFilePath], self.options))
+        self.assertEqual(buildManifest.Verify(), [])
+
+    def testChangesInvalidateOutput(self):
+        """
+        Validate that changing an input, the options or the output itself
+        requires the output to be rebuilt.
+        """
+        buildManifest = BuildManifest(self.temporaryDirectoryPath, self.temporaryDirectoryPath)
+        buildManifest.Record(self.outputFilePath, [self.sourceFilePath], self.options)
+        self.assertFalse(buildManifest.IsUpToDate(self.outputFilePath, [self.sourceFilePath], {'format': 'usdc'}))
+
+        self._writeFile(self.outputFilePath, '#usda 1.0\n')
+        self.assertFalse(buildManifest.IsUpToDate(self.outputFilePath, [self.sourceFilePath], self.options))
+        self.assertEqual(len(buildManifest.Verify()), 1)
+
+        buildManifest.Record(self.outputFilePath, [self.sourceFilePath], self.options)
+        self._writeFile(self.sourceFilePath, 'v 1 0 0')
+        self.assertFalse(buildManifest.IsUpToDate(self.outputFilePath, [self.sourceFilePath], self.options))
+
+    def testManifestIsOnlyWrittenWhenSaved(self):
+        """
+        Validate that recorded outputs are written to disk in a single step,
+        and only when the manifest changed.
+        """
+        buildManifest = BuildManifest(self.temporaryDirectoryPath, self.temporaryDirectoryPath)
+        buildManifest.Record(self.outputFilePath, [self.sourceFilePath], self.options)
+        self.assertFalse(os.path.exists(buildManifest.ManifestFilePath))
+
+        buildManifest.Save()
+        self.assertTrue(os.path.exists(buildManifest.ManifestFilePath))
+
+        os.remove(buildManifest.ManifestFilePath)
+        self.assertTrue(buildManifest.IsUpToDate(self.outputFilePath, [self.sourceFilePath], self.options))
+        buildManifest.Save()
+        self.assertFalse(os.path.exists(buildManifest.ManifestFilePath))
+
+    def testMetadataIsOnlyReturnedForUnchangedInputs(self):
+        """
+        Validate that metadata is returned regardless of the options, unless
+        the inputs it was recorded from changed.
+        """
+        buildManifest = BuildManifest(self.temporaryDirectoryPath, self.temporaryDirectoryPath)
+        self.assertIsNone(buildManifest.GetMetadata(self.outputFilePath, [self.sourceFilePath]))
+        buildManifest.Record(self.outputFilePath, [self.sourceFilePath], self.options, {'instanceCount': 1})
+        self.assertEqual(buildManifest.GetMetadata(self.outputFilePath, [self.sourceFilePath]), {'instanceCount': 1})
+
+        buildManifest.SetMetadata(self.outputFilePath, {'instanceCount': 2})
+        self._writeFile(self.sourceFilePath, 'v 1 0 0')
+        self.assertIsNone(buildManifest.GetMetadata(self.outputFilePath, [self.sourceFilePath]))
+        self.assertEqual(buildManifest.GetMetadata(self.outputFilePath), {'instanceCount': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the catalog of the dataset files.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from moana2usd.dataset.catalog import DatasetCatalog
+
+
+class TestDatasetCatalog(unittest.TestCase):
+    """
+    Unit tests for the catalog of the dataset files.
+    """
+
+    def setUp(self):
+        """
+        Create a minimal dataset before each test.
+        """
+        self.temporaryDirectoryPath = tempfile.mkdtemp()
+        self.sourceDirectoryPath = os.path.join(self.temporaryDirectoryPath, 'island')
+        self.indexFilePath = os.path.join(self.temporaryDirectoryPath, 'catalog.json')
+
+        self._writeFile('obj/isA/isA.obj', 'v 0 0 0')
+        self._writeFile('obj/isA/archives/archiveA.obj', 'v 0 0 0')
+        self._writeFile('obj/isA/archives/archiveB.obj', 'v 0 0 0\nv 1 0 0')
+        self._writeFile('json/isA/isA_xgA.json', '{}')
+        self._writeFile('json/isA/materials.json', '{}')
+        self._writeFile('json/cameras/shotCam.json', '{}')
+        self._writeFile('json/lights/lights.json', json.dumps({
+            'sunLight': {'type': 'distant', 'exposure': 1.0}
+        }))
+        self._writeFile('textures/isA/Color/geo.ptx', '')
+        self._writeFile('json/isA/isA.json', json.dumps({
+            'name': 'isA',
+            'geomObjFile': 'obj/isA/isA.obj',
+            'instancedPrimitiveJsonFiles': {
+                'xgA': {
+                    'jsonFile': 'json/isA/isA_xgA.json',
+                    'type': 'archive',
+                    'archives': ['obj/isA/archives/archiveA.obj', 'obj/isA/archives/archiveB.obj']
+                }
+            }
+        }))
+
+    def tearDown(self):
+        """
+        Remove the dataset after each test.
+        """
+        shutil.rmtree(self.temporaryDirectoryPath)
+
+    def _writeFile(self, relativeFilePath, content):
+        filePath = os.path.join(self.sourceDirectoryPath, *relativeFilePath.split('/'))
+        if not os.path.isdir(os.path.dirname(filePath)):
+            os.makedirs(os.path.dirname(filePath))
+        with open(filePath, 'w') as f:
+            f.write(content)
+        return filePath
+
+    def _getFilePath(self, relativeFilePath):
+        return os.path.join(self.sourceDirectoryPath, *relativeFilePath.split('/'))
+
+    def testIndexingOfDataset(self):
+        """
+        Validate the files and dependencies indexed by the catalog.
+        """
+        catalog = DatasetCatalog(self.sourceDirectoryPath)
+        self.assertEqual(catalog.GetElementNames(), ['isA'])
+        self.assertEqual(catalog.GetAssetOBJFilePaths(), [
+            self._getFilePath('obj/isA/archives/archiveA.obj'),
+            self._getFilePath('obj/isA/archives/archiveB.obj'),
+            self._getFilePath('obj/isA/isA.obj')
+        ])
+        self.assertEqual(catalog.GetCameraJSONFilePaths(), [self._getFilePath('json/cameras/shotCam.json')])
+        self.assertEqual(catalog.GetLightJSONFilePaths(), [self._getFilePath('json/lights/lights.json')])
+        self.assertEqual(catalog.GetElementInstanceJSONFilePaths('isA'), [self._getFilePath('json/isA/isA_xgA.json')])
+        self.assertEqual(len(catalog.GetElementOBJFilePaths('isA')), 3)
+        self.assertEqual(
+            catalog.GetInstanceJSONArchiveFilePaths(self._getFilePath('json/isA/isA_xgA.json')),
+            [self._getFilePath('obj/isA/archives/archiveA.obj'), self._getFilePath('obj/isA/archives/archiveB.obj')])
+        self.assertTrue(catalog.Exists(self._getFilePath('textures/isA/Color/geo.ptx')))
+        self.assertEqual(catalog.GetFileSize(self._getFilePath('obj/isA/archives/archiveB.obj')), 15)
+
+    def testIndexFileIsReusedUntilDatasetChanges(self):
+        """
+        Validate that the index file is reused across runs, and updated once
+        files are added to the dataset.
+        """
+        DatasetCatalog(self.sourceDirectoryPath, indexFilePath=self.indexFilePath, jobs=2).GetElementNames()
+        self.assertTrue(os.path.exists(self.indexFilePath))
+        self.assertEqual(len(DatasetCatalog(self.sourceDirectoryPath, indexFilePath=self.indexFilePath).GetAssetOBJFilePaths()), 3)
+
+        self._writeFile('obj/isA/archives/archiveC.obj', 'v 0 0 0')
+        self.assertEqual(len(DatasetCatalog(self.sourceDirectoryPath, indexFilePath=self.indexFilePath).GetAssetOBJFilePaths()), 4)
+
+    def testNonElementJSONFilesAreIgnored(self):
+        """
+        Validate that light definitions and JSON files without geometry are
+        not registered as Elements.
+        """
+        self._writeFile('json/isB/isB.json', json.dumps({'name': 'isB'}))
+        catalog = DatasetCatalog(self.sourceDirectoryPath)
+        self.assertEqual(catalog.GetElementNames(), ['isA'])
+        self.assertEqual(catalog.GetElementOBJFilePaths('lights'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
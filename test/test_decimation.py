@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the decimation of Meshes.
+"""
+
+import os
+import unittest
+
+import numpy
+
+from moana2usd.geometry.decimation import decimateByVertexClustering, triangulateFaces
+from moana2usd.obj_parser.obj_parser import iterOBJGroupsForFile
+
+
+class TestDecimation(unittest.TestCase):
+    """
+    Unit tests for the decimation of Meshes.
+    """
+
+    def testTriangulationOfFaces(self):
+        """
+        Validate that polygons are split into triangle fans.
+        """
+        triangles = triangulateFaces(numpy.array([4, 3, 2]), numpy.array([0, 1, 2, 3, 4, 5, 6, 7, 8]))
+        self.assertEqual(triangles.tolist(), [[0, 1, 2], [0, 2, 3], [4, 5, 6]])
+
+    def testDecimationOfTeapot(self):
+        """
+        Validate that clustering reduces the teapot to a valid triangle Mesh
+        within its original bounds.
+        """
+        group = next(iterOBJGroupsForFile(os.path.join('test', 'teapot.obj')))
+        faceVertexCounts, faceVertexIndices, points = decimateByVertexClustering(
+            group.faceVertexCounts,
+            group.faceVertexIndices,
+            group.points,
+            8)
+
+        self.assertTrue(0 < len(points) < len(group.points))
+        self.assertTrue((faceVertexCounts == 3).all())
+        self.assertEqual(len(faceVertexIndices), faceVertexCounts.sum())
+        self.assertEqual(sorted(set(faceVertexIndices.tolist())), list(range(len(points))))
+        self.assertTrue((points.min(axis=0) >= group.points.min(axis=0) - 1e-6).all())
+        self.assertTrue((points.max(axis=0) <= group.points.max(axis=0) + 1e-6).all())
+
+    def testDecimationOfMoreThan2To21Clusters(self):
+        """
+        Validate that no triangle is lost when the number of clusters is too
+        large for 3 cluster indices to be packed in a 64-bit integer.
+        """
+        # With 2**22 clusters, packing (a, b, c) as (a * n + b) * n + c wraps
+        # around to the same value for the first vertices 0 and 2**20:
+        vertexCount = 2 ** 22
+        points = numpy.zeros((vertexCount, 3), dtype=numpy.float32)
+        points[:, 2] = numpy.arange(vertexCount)
+
+        faceVertexCounts, faceVertexIndices, decimatedPoints = decimateByVertexClustering(
+            numpy.array([3, 3]),
+            numpy.array([0, vertexCount - 2, vertexCount - 1, 2 ** 20, vertexCount - 2, vertexCount - 1]),
+            points,
+            vertexCount)
+
+        self.assertEqual(faceVertexCounts.tolist(), [3, 3])
+        self.assertEqual(faceVertexIndices.tolist(), [0, 2, 3, 1, 2, 3])
+        self.assertEqual(decimatedPoints[:, 2].tolist(), [0.0, 2.0 ** 20, vertexCount - 2, vertexCount - 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
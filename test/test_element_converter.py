@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the conversion of Element instances to USD.
+"""
+
+import json
+import os
+import unittest
+
+from .dataset_test_case import DatasetTestCase
+
+try:
+    from pxr import Gf, Usd, UsdGeom
+    from moana2usd.converters.asset_converter import AssetConverter
+    from moana2usd.converters.base_converter import ConversionError
+    from moana2usd.converters.build_manifest import BuildManifest
+    from moana2usd.converters.element_converter import ElementConverter
+except ImportError:
+    Usd = None
+
+
+def _getTranslationMatrix(x, y, z):
+    # type: (float, float, float) -> List[float]
+    """
+    Return the row-major values of the 4x4 matrix of the given translation.
+    """
+    return [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, x, y, z, 1.0]
+
+
+@unittest.skipIf(Usd is None, 'USD is not available.')
+class TestElementConverter(DatasetTestCase):
+    """
+    Unit tests for the conversion of Element instances to USD.
+    """
+
+    def setUp(self):
+        """
+        Create a dataset with an Element instancing 2 archives, and copied
+        along with its instances, before each test.
+        """
+        super(TestElementConverter, self).setUp()
+
+        self._writeFile('obj/isA/isA.obj', 'v 0 0 0\nv 1 0 0\nv 1 1 0\nf 1 2 3\n')
+        self._writeFile('obj/isA/archives/archiveA.obj', 'v 0 0 0\nv 1 0 0\nv 1 1 0\nf 1 2 3\n')
+        self._writeFile('obj/isA/archives/archiveB.obj', 'v 0 0 0\nv 1 0 0\nv 1 1 0\nf 1 2 3\n')
+        self._writeFile('json/isA/isA_xgA.json', json.dumps({
+            'obj/isA/archives/archiveA.obj': dict(
+                ('archiveA_{}'.format(index), _getTranslationMatrix(2.0 * index, 0.0, 0.0))
+                for index in range(30)
+            ),
+            'obj/isA/archives/archiveB.obj': dict(
+                ('archiveB_{}'.format(index), _getTranslationMatrix(2.0 * index, 2.0, 0.0))
+                for index in range(10)
+            )
+        }))
+        self._writeFile('json/isA/isA.json', json.dumps({
+            'name': 'isA',
+            'geomObjFile': 'obj/isA/isA.obj',
+            'transformMatrix': _getTranslationMatrix(0.0, 0.0, 0.0),
+            'instancedPrimitiveJsonFiles': {
+                'xgA': {
+                    'jsonFile': 'json/isA/isA_xgA.json',
+                    'type': 'archive',
+                    'archives': ['obj/isA/archives/archiveA.obj', 'obj/isA/archives/archiveB.obj']
+                }
+            },
+            'instancedCopies': dict(
+                ('isA_{}'.format(index), {'name': 'isA_{}'.format(index), 'transformMatrix': _getTranslationMatrix(100.0 * index, 0.0, 0.0)})
+                for index in range(1, 4)
+            )
+        }))
+
+    def _convert(self, **kwargs):
+        elementConverter = ElementConverter('usda', self.sourceDirectoryPath, self.destinationDirectoryPath, **kwargs)
+        elementConverter.convert()
+        return elementConverter
+
+    def _convertAssets(self):
+        AssetConverter('usda', self.sourceDirectoryPath, self.destinationDirectoryPath, loadTextures=False).convert()
+
+    def _getInstanceStageFilePath(self):
+        return os.path.join(self.destinationDirectoryPath, 'primitives', '_instances_isA_xgA.usda')
+
+    def _getInstanceStage(self):
+        return Usd.Stage.Open(self._getInstanceStageFilePath())
+
+    def _getElementStage(self):
+        return Usd.Stage.Open(os.path.join(self.destinationDirectoryPath, 'primitives', '_element_isA.usda'))
+
+    def _getInstanceCount(self, stage):
+        return sum(
+            len(UsdGeom.PointInstancer(prim).GetProtoIndicesAttr().Get())
+            for prim in stage.Traverse()
+            if prim.IsA(UsdGeom.PointInstancer)
+        )
+
+    def testSharedInstanceLayersAreCreatedOnceInParallel(self):
+        """
+        Validate that the instance JSON file shared by the instanced copies
+        of an Element is converted once, to the same layer serially and in
+        parallel, and referenced by each copy.
+        """
+        self._convertAssets()
+        self._convert()
+        with open(self._getInstanceStageFilePath(), 'r') as f:
+            serialContent = f.read()
+
+        os.remove(self._getInstanceStageFilePath())
+        self._convert(jobs=2)
+        with open(self._getInstanceStageFilePath(), 'r') as f:
+            self.assertEqual(f.read(), serialContent)
+        self.assertEqual(
+            [fileName for fileName in os.listdir(os.path.join(self.destinationDirectoryPath, 'primitives')) if fileName.startswith('_instances_')],
+            ['_instances_isA_xgA.usda'])
+
+        stage = self._getElementStage()
+        for copyName in ['isA', 'isA_1', 'isA_2', 'isA_3']:
+            subInstancePrim = stage.GetPrimAtPath('/isA/{}/xgA'.format(copyName))
+            self.assertEqual(
+                [reference.assetPath for reference in subInstancePrim.GetPrimStack()[0].referenceList.prependedItems],
+                ['./_instances_isA_xgA.usda'])
+        self.assertEqual(self._getInstanceCount(stage), 4 * 40)
+
+    def testElementStageReferencesItsAssetsAndInstances(self):
+        """
+        Validate that the Element Stage places its geometry and instances,
+        as well as those of each of its instanced copies.
+        """
+        self._convertAssets()
+        self._convert()
+
+        stage = self._getElementStage()
+        self.assertEqual(stage.GetDefaultPrim().GetPath(), '/isA')
+        self.assertEqual(
+            sorted(prim.GetName() for prim in stage.GetDefaultPrim().GetChildren()),
+            ['isA', 'isA_1', 'isA_2', 'isA_3'])
+
+        for index, copyName in enumerate(['isA', 'isA_1', 'isA_2', 'isA_3']):
+            copyPrim = stage.GetPrimAtPath('/isA/' + copyName)
+            self.assertEqual(copyPrim.GetTypeName(), 'Xform')
+            self.assertEqual(
+                [reference.assetPath for reference in copyPrim.GetPrimStack()[0].referenceList.prependedItems],
+                ['./isA/isA.usda'])
+            self.assertEqual(
+                UsdGeom.Xformable(copyPrim).GetLocalTransformation().ExtractTranslation(),
+                Gf.Vec3d(100.0 * index, 0.0, 0.0))
+            self.assertTrue(copyPrim.GetChild('geometry').IsValid())
+            self.assertTrue(copyPrim.GetChild('xgA').GetChild('archiveA').IsA(UsdGeom.PointInstancer))
+
+    def testInstancedCopiesAreCollapsedIntoAPointInstancer(self):
+        """
+        Validate that the instanced copies sharing the content of their
+        Element are gathered into a PointInstancer, except those whose
+        transform cannot be reproduced by it.
+        """
+        with open(os.path.join(self.sourceDirectoryPath, 'json', 'isA', 'isA.json'), 'r') as f:
+            elementData = json.load(f)
+        shearedTransform = _getTranslationMatrix(400.0, 0.0, 0.0)
+        shearedTransform[4] = 0.5
+        elementData['instancedCopies']['isA_4'] = {'name': 'isA_4', 'transformMatrix': shearedTransform}
+        self._writeFile('json/isA/isA.json', json.dumps(elementData))
+
+        self._convertAssets()
+        self._convert(collapseInstancedCopies=True)
+
+        stage = self._getElementStage()
+        self.assertEqual(
+            sorted(prim.GetName() for prim in stage.GetDefaultPrim().GetChildren()),
+            ['instancedCopies', 'isA', 'isA_4'])
+
+        pointInstancer = UsdGeom.PointInstancer(stage.GetPrimAtPath('/isA/instancedCopies'))
+        self.assertEqual(
+            sorted(position[0] for position in pointInstancer.GetPositionsAttr().Get()),
+            [100.0, 200.0, 300.0])
+        self.assertEqual(list(pointInstancer.GetProtoIndicesAttr().Get()), [0, 0, 0])
+        self.assertEqual(pointInstancer.GetPrototypesRel().GetTargets(), ['/isA/instancedCopies/prototype'])
+
+        prototypePrim = stage.GetPrimAtPath('/isA/instancedCopies/prototype')
+        self.assertEqual(UsdGeom.Xformable(prototypePrim).GetLocalTransformation(), Gf.Matrix4d(1.0))
+        self.assertTrue(prototypePrim.GetChild('geometry').IsValid())
+        self.assertTrue(prototypePrim.GetChild('xgA').GetChild('archiveA').IsA(UsdGeom.PointInstancer))
+
+    def testInstancedCopiesWithOverridesAreCollapsedByContent(self):
+        """
+        Validate that the instanced copies overriding the content of their
+        Element are gathered into a PointInstancer of their own.
+        """
+        with open(os.path.join(self.sourceDirectoryPath, 'json', 'isA', 'isA.json'), 'r') as f:
+            elementData = json.load(f)
+        for index in range(4, 6):
+            elementData['instancedCopies']['isA_{}'.format(index)] = {
+                'name': 'isA_{}'.format(index),
+                'transformMatrix': _getTranslationMatrix(100.0 * index, 0.0, 0.0),
+                'geomObjFile': 'obj/isA/archives/archiveB.obj',
+                'instancedPrimitiveJsonFiles': {}
+            }
+        self._writeFile('json/isA/isA.json', json.dumps(elementData))
+
+        self._convertAssets()
+        self._convert(collapseInstancedCopies=True)
+
+        stage = self._getElementStage()
+        self.assertEqual(
+            sorted(prim.GetName() for prim in stage.GetDefaultPrim().GetChildren()),
+            ['instancedCopies', 'instancedCopies_1', 'isA'])
+
+        pointInstancer = UsdGeom.PointInstancer(stage.GetPrimAtPath('/isA/instancedCopies_1'))
+        self.assertEqual(
+            sorted(position[0] for position in pointInstancer.GetPositionsAttr().Get()),
+            [400.0, 500.0])
+        prototypePrim = stage.GetPrimAtPath('/isA/instancedCopies_1/prototype')
+        self.assertTrue(prototypePrim.GetChild('geometry').IsValid())
+        self.assertFalse(prototypePrim.GetChild('xgA').IsValid())
+
+    def testArchivesAreMergedIntoASinglePointInstancer(self):
+        """
+        Validate that the archives of an instance JSON file can be instanced
+        by a single PointInstancer, with one prototype for each archive.
+        """
+        self._convertAssets()
+        self._convert(mergeInstancers=True)
+
+        stage = self._getInstanceStage()
+        self.assertEqual([prim.GetName() for prim in stage.GetPrimAtPath('/Instancers').GetChildren()], ['isA_xgA'])
+        pointInstancer = UsdGeom.PointInstancer(stage.GetPrimAtPath('/Instancers/isA_xgA'))
+        prototypePaths = pointInstancer.GetPrototypesRel().GetTargets()
+        self.assertEqual(sorted(path.name for path in prototypePaths), ['archiveA', 'archiveB'])
+        for prototypePath in prototypePaths:
+            prototypePrim = stage.GetPrimAtPath(prototypePath)
+            self.assertEqual(
+                [reference.assetPath for reference in prototypePrim.GetPrimStack()[0].referenceList.prependedItems],
+                ['./isA/{}.usda'.format(prototypePath.name)])
+            self.assertTrue(prototypePrim.GetChild('geometry').IsValid())
+
+        protoIndices = list(pointInstancer.GetProtoIndicesAttr().Get())
+        self.assertEqual(len(pointInstancer.GetPositionsAttr().Get()), 40)
+        self.assertEqual(
+            dict((path.name, protoIndices.count(protoIndex)) for protoIndex, path in enumerate(prototypePaths)),
+            {'archiveA': 30, 'archiveB': 10})
+
+    def testInstanceBudgetCountsEachCopy(self):
+        """
+        Validate that the instances of a JSON file shared by instanced copies
+        count once per copy against the instance budget of their Element.
+        """
+        buildManifest = BuildManifest(self.destinationDirectoryPath, self.sourceDirectoryPath)
+        self._convert(buildManifest=buildManifest, maxElementInstanceCount=40)
+        keptInstanceCount = self._getInstanceCount(self._getInstanceStage())
+        self.assertGreater(keptInstanceCount, 0)
+        self.assertLess(keptInstanceCount, 40)
+
+        self.assertEqual(buildManifest.GetMetadata(self._getInstanceStageFilePath()), {'instanceCount': 40})
+
+    def testSharedInstancesKeepTheLargestFractionOfTheirNames(self):
+        """
+        Validate that the instances of a JSON file referenced under several
+        sub-instance names keep the largest fraction given for these names.
+        """
+        with open(os.path.join(self.sourceDirectoryPath, 'json', 'isA', 'isA.json'), 'r') as f:
+            elementData = json.load(f)
+        for instanceData in elementData['instancedCopies'].values():
+            instanceData['instancedPrimitiveJsonFiles'] = {'xgB': elementData['instancedPrimitiveJsonFiles']['xgA']}
+        self._writeFile('json/isA/isA.json', json.dumps(elementData))
+
+        self._convert(instanceKeepFractions={'xgA': 1.0, 'xgB': 0.25})
+        self.assertEqual(self._getInstanceCount(self._getInstanceStage()), 40)
+
+        self._convert(instanceKeepFractions={'xgB': 0.5})
+        keptInstanceCount = self._getInstanceCount(self._getInstanceStage())
+        self.assertLess(keptInstanceCount, 40)
+        self._convert(instanceKeepFractions={'xgA': 0.25, 'xgB': 0.5})
+        self.assertEqual(self._getInstanceCount(self._getInstanceStage()), keptInstanceCount)
+
+    def testFailedInstanceLayersAreReportedOnceOthersAreCreated(self):
+        """
+        Validate that an instance JSON file failing to convert does not
+        prevent the others from being converted, and fails the conversion
+        once they are, both serially and in parallel.
+        """
+        with open(os.path.join(self.sourceDirectoryPath, 'json', 'isA', 'isA.json'), 'r') as f:
+            elementData = json.load(f)
+        elementData['instancedPrimitiveJsonFiles']['xgB'] = {
+            'jsonFile': 'json/isA/isA_xgB.json',
+            'type': 'archive',
+            'archives': ['obj/isA/archives/archiveA.obj']
+        }
+        self._writeFile('json/isA/isA.json', json.dumps(elementData))
+        self._writeFile('json/isA/isA_xgB.json', '{"archiveA_0": [0, 0, 0]}')
+
+        for jobs in [1, 2]:
+            with self.assertRaises(ConversionError) as context:
+                self._convert(jobs=jobs)
+            self.assertEqual([filePath for filePath, _ in context.exception.Failures], [
+                os.path.join(self.sourceDirectoryPath, 'json/isA/isA_xgB.json')
+            ])
+            self.assertEqual(self._getInstanceCount(self._getInstanceStage()), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
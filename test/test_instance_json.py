@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the incremental reader of instance JSON files.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from moana2usd.dataset.array_cache import ArrayCache
+from moana2usd.dataset.instance_json import concatenateInstanceTransforms, countInstances, getCachedInstanceTransformsForFile, iterInstanceTransforms
+
+
+class TestInstanceJSON(unittest.TestCase):
+    """
+    Unit tests for the incremental reader of instance JSON files.
+    """
+
+    def setUp(self):
+        """
+        Write an instance JSON file with a few archives before each test.
+        """
+        self.temporaryDirectoryPath = tempfile.mkdtemp()
+        self.jsonFilePath = os.path.join(self.temporaryDirectoryPath, 'isA_xgArch.json')
+
+        randomState = numpy.random.RandomState(0)
+        self.instances = {}
+        for archiveIndex, instanceCount in enumerate([40, 1, 0, 25]):
+            archiveName = 'obj/isA/archives/archive{archiveIndex}.obj'.format(archiveIndex=archiveIndex)
+            self.instances[archiveName] = dict(
+                ('inst{instanceIndex}'.format(instanceIndex=instanceIndex), randomState.normal(scale=100.0, size=16).tolist())
+                for instanceIndex in range(instanceCount)
+            )
+        with open(self.jsonFilePath, 'w') as f:
+            json.dump(self.instances, f, indent=1)
+
+    def tearDown(self):
+        """
+        Remove the instance JSON file after each test.
+        """
+        shutil.rmtree(self.temporaryDirectoryPath)
+
+    def testTransformsMatchJSONDocument(self):
+        """
+        Validate that the transforms read incrementally match those of the
+        whole JSON document, regardless of where chunks are cut.
+        """
+        for chunkSize in [1, 17, 1000, 1024 * 1024]:
+            archives = list(iterInstanceTransforms(self.jsonFilePath, chunkSize))
+            self.assertEqual(sorted(archiveName for archiveName, _ in archives), sorted(self.instances.keys()))
+            for archiveName, transformMatrices in archives:
+                expectedMatrices = numpy.array(list(self.instances[archiveName].values()), dtype=numpy.float64).reshape(-1, 16)
+                self.assertEqual(transformMatrices.shape, expectedMatrices.shape)
+                self.assertTrue(numpy.array_equal(transformMatrices, expectedMatrices))
+
+    def testCountOfInstances(self):
+        """
+        Validate that instances are counted without being parsed.
+        """
+        instanceCount = sum(len(instances) for instances in self.instances.values())
+        self.assertEqual(countInstances(self.jsonFilePath, chunkSize=100), instanceCount)
+
+    def testCachingOfTransforms(self):
+        """
+        Validate that cached transforms match the ones read from text.
+        """
+        arrayCache = ArrayCache(os.path.join(self.temporaryDirectoryPath, 'cache'))
+        archives = list(iterInstanceTransforms(self.jsonFilePath))
+        for _ in range(2):
+            cachedArchives = getCachedInstanceTransformsForFile(self.jsonFilePath, arrayCache)
+            self.assertEqual([archiveName for archiveName, _ in cachedArchives], [archiveName for archiveName, _ in archives])
+            for (_, cachedMatrices), (_, transformMatrices) in zip(cachedArchives, archives):
+                self.assertTrue(numpy.array_equal(cachedMatrices, transformMatrices))
+
+    def testConcatenationOfTransforms(self):
+        """
+        Validate that concatenated transforms keep track of their archive.
+        """
+        archives = list(iterInstanceTransforms(self.jsonFilePath))
+        archiveNames, transformMatrices, archiveIndices = concatenateInstanceTransforms(iterInstanceTransforms(self.jsonFilePath))
+        self.assertEqual(archiveNames, [archiveName for archiveName, _ in archives])
+        self.assertEqual(len(transformMatrices), len(archiveIndices))
+        for archiveIndex, (_, archiveMatrices) in enumerate(archives):
+            self.assertTrue(numpy.array_equal(transformMatrices[archiveIndices == archiveIndex], archiveMatrices))
+
+    def testMalformedTransformsAreRejected(self):
+        """
+        Validate that transform matrices without 16 values are rejected.
+        """
+        with open(self.jsonFilePath, 'w') as f:
+            json.dump({'obj/isA/archives/archive0.obj': {'inst0': [1.0, 0.0, 0.0]}}, f)
+        with self.assertRaises(ValueError):
+            list(iterInstanceTransforms(self.jsonFilePath))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the Material database.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from moana2usd.dataset.material_database import MaterialDatabase, getElementNameForOBJPath
+
+
+class TestMaterialDatabase(unittest.TestCase):
+    """
+    Unit tests for the Material database.
+    """
+
+    def setUp(self):
+        """
+        Create a dataset with Materials for 2 Elements before each test.
+        """
+        self.sourceDirectoryPath = tempfile.mkdtemp()
+        for elementName, materials in [
+            ('isBeach', {
+                'sand': {'baseColor': [0.8, 0.7, 0.5, 0.5], 'roughness': 0.9, 'clearcoatGloss': 0.25},
+                'placeholder': {'baseColor': [1, 0, 1]}
+            }),
+            ('osOcean', {
+                'water': {'baseColor': [0.1, 0.2, 0.3], 'ior': 1.33}
+            })
+        ]:
+            os.makedirs(os.path.join(self.sourceDirectoryPath, 'json', elementName))
+            with open(os.path.join(self.sourceDirectoryPath, 'json', elementName, 'materials.json'), 'w') as f:
+                json.dump(materials, f)
+        self.materialDatabase = MaterialDatabase(self.sourceDirectoryPath, maxElementCount=1)
+
+    def tearDown(self):
+        """
+        Remove the dataset after each test.
+        """
+        shutil.rmtree(self.sourceDirectoryPath)
+
+    def testResolutionOfMaterialProperties(self):
+        """
+        Validate that Material properties are resolved from the JSON data.
+        """
+        sand = self.materialDatabase.GetMaterial('isBeach', 'sand')
+        self.assertEqual(sand.displayColor, (0.8, 0.7, 0.5))
+        self.assertEqual(sand.opacity, 0.5)
+        self.assertEqual(sand.roughness, 0.9)
+        self.assertEqual(sand.clearcoatRoughness, 0.75)
+        self.assertIsNone(sand.metallic)
+
+        placeholder = self.materialDatabase.GetMaterial('isBeach', 'placeholder')
+        self.assertIsNone(placeholder.displayColor)
+        self.assertIsNone(self.materialDatabase.GetMaterial('isBeach', 'missing'))
+        self.assertEqual(self.materialDatabase.GetMaterials('isMissing'), {})
+
+    def testMaterialsAreLoadedOnce(self):
+        """
+        Validate that the Materials of an Element are only parsed once while
+        they are kept in memory, and evicted past the Element budget.
+        """
+        materials = self.materialDatabase.GetMaterials('isBeach')
+        self.assertIs(self.materialDatabase.GetMaterials('isBeach'), materials)
+
+        self.materialDatabase.GetMaterials('osOcean')
+        self.assertIsNot(self.materialDatabase.GetMaterials('isBeach'), materials)
+
+    def testElementNameOfOBJPaths(self):
+        """
+        Validate that Element names are extracted from OBJ paths.
+        """
+        objFilePath = os.path.join(self.sourceDirectoryPath, 'obj', 'isBeach', 'archives', 'pebble.obj')
+        self.assertEqual(getElementNameForOBJPath(objFilePath, self.sourceDirectoryPath), 'isBeach')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,9 +5,13 @@
 """
 
 import os
+import shutil
+import tempfile
 import unittest
 
-from moana2usd.obj_parser.obj_parser import getOBJStreamForFile
+import numpy
+
+from moana2usd.obj_parser.obj_parser import getOBJStreamForFile, iterOBJGroupsForFile
 
 
 class TestOBJParser(unittest.TestCase):
@@ -59,5 +63,212 @@ class TestOBJParser(unittest.TestCase):
         self.assertEqual(self.objStream.GetMaterialNames(), ['default'])
 
 
+class TestColumnarOBJParser(unittest.TestCase):
+    """
+    Unit tests for the columnar mode of the OBJ parser.
+    """
+
+    def setUp(self):
+        """
+        Parse the test OBJ file in both object and columnar modes before each
+        test, using small blocks so that parsing spans multiple blocks.
+        """
+        objFilePath = os.path.join('test', 'teapot.obj')
+        self.objStream = getOBJStreamForFile(objFilePath)
+        self.columnarOBJStream = getOBJStreamForFile(objFilePath, columnar=True, chunkSize=4096)
+
+    def testArrayShapes(self):
+        """
+        Validate that the content is stored in arrays of the expected shapes.
+        """
+        self.assertEqual(self.columnarOBJStream.GetVertArray().shape, (1292, 3))
+        self.assertEqual(self.columnarOBJStream.GetUVArray().shape, (0, 2))
+        self.assertEqual(self.columnarOBJStream.GetNormalArray().shape, (1289, 3))
+        self.assertEqual(self.columnarOBJStream.GetPointIndexArray().shape, (7392, 3))
+        self.assertEqual(len(self.columnarOBJStream.GetFaceOffsets()), 2464 + 1)
+        self.assertEqual(self.columnarOBJStream.GetGroupRanges(), [('teapot', 0, 2464)])
+
+    def testVertsMatchObjectMode(self):
+        """
+        Validate that the vertices match the ones parsed in object mode.
+        """
+        verts = self.objStream.GetVerts()
+        columnarVerts = self.columnarOBJStream.GetVerts()
+        self.assertEqual(len(columnarVerts), len(verts))
+        for index in (0, 1, len(verts) - 1):
+            for component, columnarComponent in zip(verts[index], columnarVerts[index]):
+                self.assertAlmostEqual(component, columnarComponent, places=5)
+
+    def testPointsMatchObjectMode(self):
+        """
+        Validate that the Points match the ones parsed in object mode.
+        """
+        points = [(point.vertIndex, point.uvIndex, point.normalIndex) for point in self.objStream.GetPoints()]
+        columnarPoints = [(point.vertIndex, point.uvIndex, point.normalIndex) for point in self.columnarOBJStream.GetPoints()]
+        self.assertEqual(columnarPoints, points)
+
+    def testGroupsMatchObjectMode(self):
+        """
+        Validate that the Groups and their Faces match the ones parsed in
+        object mode.
+        """
+        groups = [
+            (group.name, [(face.pointsBegin, face.pointsEnd) for face in group.faces])
+            for group in self.objStream.GetGroups()
+        ]
+        columnarGroups = [
+            (group.name, [(face.pointsBegin, face.pointsEnd) for face in group.faces])
+            for group in self.columnarOBJStream.GetGroups()
+        ]
+        self.assertEqual(columnarGroups, groups)
+        self.assertEqual(self.columnarOBJStream.GetCurrentGroup(), 'teapot')
+        self.assertEqual(self.columnarOBJStream.GetMaterialNames(), ['default'])
+
+    def testParallelParsingMatchesSerialParsing(self):
+        """
+        Validate that parsing memory-mapped ranges of the file in parallel
+        produces the same content as a serial parse.
+        """
+        objFilePath = os.path.join('test', 'teapot.obj')
+        parallelOBJStream = getOBJStreamForFile(objFilePath, chunkSize=4096, jobs=2)
+
+        for arrayName in ('GetVertArray', 'GetUVArray', 'GetNormalArray', 'GetPointIndexArray', 'GetFaceOffsets'):
+            self.assertTrue(numpy.array_equal(
+                getattr(parallelOBJStream, arrayName)(),
+                getattr(self.columnarOBJStream, arrayName)()))
+        self.assertEqual(parallelOBJStream.GetGroupRanges(), self.columnarOBJStream.GetGroupRanges())
+        self.assertEqual(parallelOBJStream.GetMaterialNames(), self.columnarOBJStream.GetMaterialNames())
+
+
+class TestStreamingOBJParser(unittest.TestCase):
+    """
+    Unit tests for the streaming per-Group mode of the OBJ parser.
+    """
+
+    def setUp(self):
+        """
+        Read the Groups of the test OBJ file before each test, using small
+        blocks so that parsing spans multiple blocks.
+        """
+        objFilePath = os.path.join('test', 'teapot.obj')
+        self.columnarOBJStream = getOBJStreamForFile(objFilePath, columnar=True)
+        self.objGroups = list(iterOBJGroupsForFile(objFilePath, chunkSize=4096))
+
+    def testParsingOfGroups(self):
+        """
+        Validate that the Groups and their Materials match the ones expected.
+        """
+        self.assertEqual([group.name for group in self.objGroups], ['teapot'])
+        self.assertEqual([group.materialName for group in self.objGroups], ['default'])
+
+    def testParsingOfFaces(self):
+        """
+        Validate that the Faces of the Group match the ones expected.
+        """
+        group = self.objGroups[0]
+        self.assertEqual(len(group.faceVertexCounts), 2464)
+        self.assertEqual(len(group.faceVertexIndices), 7392)
+        self.assertTrue(numpy.array_equal(
+            group.faceVertexCounts,
+            numpy.diff(self.columnarOBJStream.GetFaceOffsets())))
+
+    def testGroupOnlyHoldsReferencedVertices(self):
+        """
+        Validate that the Group only holds the vertices referenced by its
+        Faces, and that its Faces point to the same positions.
+        """
+        group = self.objGroups[0]
+        verts = self.columnarOBJStream.GetVertArray()
+        vertIndices = self.columnarOBJStream.GetPointIndexArray()[:, 0]
+        self.assertEqual(len(group.points), len(numpy.unique(vertIndices)))
+        self.assertTrue(numpy.array_equal(group.points[group.faceVertexIndices], verts[vertIndices]))
+
+
+class TestOBJGroupVertexCompaction(unittest.TestCase):
+    """
+    Unit tests for the compaction of the vertices of each Group of the
+    streaming OBJ parser.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory for OBJ files before each test.
+        """
+        self.temporaryDirectoryPath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Remove the temporary directory after each test.
+        """
+        shutil.rmtree(self.temporaryDirectoryPath)
+
+    def testVerticesFollowTheirFirstUse(self):
+        """
+        Validate that the vertices of each Group are reindexed in the order in
+        which its Faces first reference them, skipping unreferenced ones.
+        """
+        objFilePath = os.path.join(self.temporaryDirectoryPath, 'groups.obj')
+        with open(objFilePath, 'w') as f:
+            f.write('\n'.join(['v {} 0 0'.format(index) for index in range(7)] + [
+                'g first',
+                'f 3 1 2',
+                'f 2 3 1 4',
+                'g second',
+                'f 7 5 3',
+                'f 3 7 6'
+            ]) + '\n')
+        firstGroup, secondGroup = list(iterOBJGroupsForFile(objFilePath))
+
+        self.assertEqual(firstGroup.faceVertexCounts.tolist(), [3, 4])
+        self.assertEqual(firstGroup.faceVertexIndices.tolist(), [0, 1, 2, 2, 0, 1, 3])
+        self.assertEqual(firstGroup.points[:, 0].tolist(), [2.0, 0.0, 1.0, 3.0])
+
+        self.assertEqual(secondGroup.faceVertexIndices.tolist(), [0, 1, 2, 2, 0, 3])
+        self.assertEqual(secondGroup.points[:, 0].tolist(), [6.0, 4.0, 2.0, 5.0])
+        self.assertEqual(secondGroup.faceVertexIndices.dtype, numpy.int32)
+
+
+class TestMalformedOBJParser(unittest.TestCase):
+    """
+    Unit tests for the parsing of OBJ files whose statements do not all have
+    the same number of components.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory for OBJ files before each test.
+        """
+        self.temporaryDirectoryPath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Remove the temporary directory after each test.
+        """
+        shutil.rmtree(self.temporaryDirectoryPath)
+
+    def _parseOBJContent(self, content):
+        objFilePath = os.path.join(self.temporaryDirectoryPath, 'malformed.obj')
+        with open(objFilePath, 'w') as f:
+            f.write(content)
+        return list(iterOBJGroupsForFile(objFilePath))
+
+    def testExtraComponentsAreIgnored(self):
+        """
+        Validate that extra components of some of the vertices (such as
+        vertex colors) are ignored.
+        """
+        groups = self._parseOBJContent('g geo\nv 0 0 0 1 0 0\nv 1 0 0\nv 1 1 0 0 0 1\nf 1 2 3\n')
+        self.assertEqual(groups[0].points.tolist(), [[0, 0, 0], [1, 0, 0], [1, 1, 0]])
+
+    def testMissingComponentsAreReported(self):
+        """
+        Validate that vertices with missing components are reported, even
+        when other vertices have as many extra components.
+        """
+        with self.assertRaises(ValueError) as context:
+            self._parseOBJContent('g geo\nv 0 0 0 1\nv 1 0\nv 1 1 0\nf 1 2 3\n')
+        self.assertIn('"v 1 0"', str(context.exception))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the index of texture maps.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from moana2usd.dataset.catalog import DatasetCatalog
+from moana2usd.dataset.texture_index import TextureIndex
+
+
+class TestTextureIndex(unittest.TestCase):
+    """
+    Unit tests for the index of texture maps.
+    """
+
+    def setUp(self):
+        """
+        Create a dataset with a few texture maps before each test.
+        """
+        self.sourceDirectoryPath = tempfile.mkdtemp()
+        for relativeFilePath in ['textures/isA/Color/geoA.ptx', 'textures/isA/Displacement/geoA.ptx', 'textures/shared/leaf.ptx']:
+            filePath = os.path.join(self.sourceDirectoryPath, *relativeFilePath.split('/'))
+            if not os.path.isdir(os.path.dirname(filePath)):
+                os.makedirs(os.path.dirname(filePath))
+            open(filePath, 'w').close()
+
+    def tearDown(self):
+        """
+        Remove the dataset after each test.
+        """
+        shutil.rmtree(self.sourceDirectoryPath)
+
+    def _getFilePath(self, relativeFilePath):
+        return os.path.join(self.sourceDirectoryPath, *relativeFilePath.split('/'))
+
+    def testLookupOfMaps(self):
+        """
+        Validate the lookup of maps, with or without a catalog of the dataset.
+        """
+        for textureIndex in [TextureIndex(self.sourceDirectoryPath), TextureIndex(self.sourceDirectoryPath, DatasetCatalog(self.sourceDirectoryPath))]:
+            self.assertEqual(textureIndex.GetColorMapFilePath('isA', 'geoA'), self._getFilePath('textures/isA/Color/geoA.ptx'))
+            self.assertEqual(textureIndex.GetDisplacementMapFilePath('isA', 'geoA'), self._getFilePath('textures/isA/Displacement/geoA.ptx'))
+            self.assertIsNone(textureIndex.GetColorMapFilePath('isA', 'geoB'))
+            self.assertIsNone(textureIndex.GetColorMapFilePath('isB', 'geoA'))
+
+    def testLookupOfMaterialMaps(self):
+        """
+        Validate that the map paths of materials take precedence over the
+        naming convention of the dataset.
+        """
+        textureIndex = TextureIndex(self.sourceDirectoryPath)
+        self.assertEqual(textureIndex.GetColorMapFilePath('isA', 'geoB', '../textures/shared/leaf.ptx'), self._getFilePath('textures/shared/leaf.ptx'))
+        self.assertEqual(textureIndex.GetColorMapFilePath('isA', 'geoA', 'textures/isA/Color'), self._getFilePath('textures/isA/Color/geoA.ptx'))
+        self.assertIsNone(textureIndex.GetColorMapFilePath('isA', 'geoA', 'textures/shared'))
+
+
+if __name__ == '__main__':
+    unittest.main()
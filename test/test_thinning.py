@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the thinning of instances.
+"""
+
+import unittest
+
+import numpy
+
+from moana2usd.geometry.thinning import getThinningMask
+
+
+class TestThinning(unittest.TestCase):
+    """
+    Unit tests for the thinning of instances.
+    """
+
+    def setUp(self):
+        """
+        Create a set of random instance positions before each test.
+        """
+        self.positions = numpy.random.RandomState(0).normal(scale=100.0, size=(10000, 3))
+
+    def testThinningKeepsFraction(self):
+        """
+        Validate that about the requested fraction of instances is kept,
+        regardless of their order.
+        """
+        keepMask = getThinningMask(self.positions, 0.3)
+        self.assertAlmostEqual(keepMask.mean(), 0.3, delta=0.02)
+
+        shuffledOrder = numpy.random.RandomState(1).permutation(len(self.positions))
+        self.assertTrue(numpy.array_equal(getThinningMask(self.positions[shuffledOrder], 0.3), keepMask[shuffledOrder]))
+        self.assertTrue(getThinningMask(self.positions, 1.0).all())
+        self.assertFalse(getThinningMask(self.positions, 0.0).any())
+
+    def testThinnedSetsAreNested(self):
+        """
+        Validate that instances kept for a fraction are kept for larger ones.
+        """
+        smallerKeepMask = getThinningMask(self.positions, 0.1)
+        largerKeepMask = getThinningMask(self.positions, 0.5)
+        self.assertTrue(numpy.all(largerKeepMask[smallerKeepMask]))
+
+
+if __name__ == '__main__':
+    unittest.main()
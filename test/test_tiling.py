@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the spatial tiling of Meshes and point sets.
+"""
+
+import os
+import unittest
+
+import numpy
+
+from moana2usd.geometry.tiling import getTileGridSize, splitIntoTiles, splitPointsIntoTiles
+from moana2usd.obj_parser.obj_parser import iterOBJGroupsForFile
+
+
+class TestTiling(unittest.TestCase):
+    """
+    Unit tests for the spatial tiling of Meshes and point sets.
+    """
+
+    def testGridSpansLargestAxes(self):
+        """
+        Validate that tiles are laid out along the two largest axes.
+        """
+        self.assertEqual(getTileGridSize(numpy.array([100.0, 1.0, 50.0]), 8), (4, 1, 2))
+        self.assertEqual(getTileGridSize(numpy.array([10.0, 0.0, 0.0]), 4), (4, 1, 1))
+        self.assertEqual(getTileGridSize(numpy.array([10.0, 10.0, 10.0]), 1), (1, 1, 1))
+
+    def testTilesPartitionFaces(self):
+        """
+        Validate that tiles hold each face of the Mesh exactly once.
+        """
+        group = next(iterOBJGroupsForFile(os.path.join('test', 'teapot.obj')))
+        tiles = splitIntoTiles(group.faceVertexCounts, group.faceVertexIndices, group.points, 500)
+        self.assertTrue(len(tiles) > 1)
+
+        def getFaces(faceVertexCounts, faceVertexIndices, points):
+            faceOffsets = numpy.cumsum(faceVertexCounts) - faceVertexCounts
+            return sorted(
+                tuple(map(tuple, points[faceVertexIndices[offset:offset + count]].tolist()))
+                for offset, count in zip(faceOffsets, faceVertexCounts))
+
+        tiledFaces = []
+        for _, faceVertexCounts, faceVertexIndices, points in tiles:
+            self.assertEqual(len(numpy.unique(faceVertexIndices)), len(points))
+            tiledFaces.extend(getFaces(faceVertexCounts, faceVertexIndices, points))
+        self.assertEqual(sorted(tiledFaces), getFaces(group.faceVertexCounts, group.faceVertexIndices, group.points))
+
+    def testTilesPartitionPoints(self):
+        """
+        Validate that tiles hold each point exactly once, in their original
+        order.
+        """
+        points = numpy.random.RandomState(0).uniform(-100.0, 100.0, size=(1000, 3))
+        tiles = splitPointsIntoTiles(points, 100)
+        self.assertTrue(len(tiles) > 1)
+        for _, pointIndices in tiles:
+            self.assertTrue(numpy.all(numpy.diff(pointIndices) > 0))
+        self.assertEqual(sorted(numpy.concatenate([pointIndices for _, pointIndices in tiles]).tolist()), list(range(1000)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""
+(Limited) unit tests for the batched operations on transformation matrices.
+"""
+
+import unittest
+
+import numpy
+
+from moana2usd.geometry.transforms import composeTransforms, decomposeTransforms, transformExtent
+
+
+def _getQuaternionMatrix(quaternion):
+    """
+    Return the 3x3 rotation matrix of the given (i, j, k, real) quaternion,
+    using the row vector convention.
+    """
+    x, y, z, w = quaternion
+    return numpy.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y + z * w), 2 * (x * z - y * w)],
+        [2 * (x * y - z * w), 1 - 2 * (x * x + z * z), 2 * (y * z + x * w)],
+        [2 * (x * z + y * w), 2 * (y * z - x * w), 1 - 2 * (x * x + y * y)]
+    ])
+
+
+class TestTransforms(unittest.TestCase):
+    """
+    Unit tests for the batched operations on transformation matrices.
+    """
+
+    def testDecompositionOfTransforms(self):
+        """
+        Validate that decomposed transforms compose back into the original
+        matrices, including mirroring ones.
+        """
+        randomState = numpy.random.RandomState(0)
+        quaternions = randomState.normal(size=(100, 4))
+        quaternions /= numpy.linalg.norm(quaternions, axis=1)[:, numpy.newaxis]
+        scales = randomState.uniform(0.1, 4.0, size=(100, 3))
+        scales[::5, 1] *= -1
+        translations = randomState.normal(scale=100.0, size=(100, 3))
+
+        matrices = numpy.zeros((100, 4, 4))
+        for index in range(100):
+            matrices[index, :3, :3] = numpy.diag(scales[index]).dot(_getQuaternionMatrix(quaternions[index]))
+            matrices[index, 3, :3] = translations[index]
+            matrices[index, 3, 3] = 1.0
+
+        positions, orientations, decomposedScales = decomposeTransforms(matrices.reshape(-1, 16))
+        self.assertTrue(numpy.allclose(positions, translations, atol=1e-3))
+        self.assertTrue(numpy.allclose(numpy.linalg.norm(orientations, axis=1), 1.0, atol=1e-6))
+        for index in range(100):
+            composedMatrix = numpy.diag(decomposedScales[index]).dot(_getQuaternionMatrix(orientations[index]))
+            self.assertTrue(numpy.allclose(composedMatrix, matrices[index, :3, :3], atol=1e-4))
+
+    def testCompositionOfDecomposedTransforms(self):
+        """
+        Validate that composing decomposed transforms gives back the original
+        matrices.
+        """
+        randomState = numpy.random.RandomState(1)
+        matrices = numpy.tile(numpy.eye(4), (50, 1, 1))
+        rotations, _ = numpy.linalg.qr(randomState.normal(size=(50, 3, 3)))
+        matrices[:, :3, :3] = randomState.uniform(0.1, 4.0, size=(50, 3, 1)) * rotations
+        matrices[:, 3, :3] = randomState.normal(scale=100.0, size=(50, 3))
+
+        composedMatrices = composeTransforms(*decomposeTransforms(matrices.reshape(-1, 16)))
+        self.assertTrue(numpy.allclose(composedMatrices, matrices.reshape(-1, 16), atol=1e-3))
+
+    def testTransformedExtents(self):
+        """
+        Validate that transformed extents bound the transformed corners of the
+        original extent.
+        """
+        extent = numpy.array([[-1.0, 0.0, -2.0], [1.0, 3.0, 2.0]])
+        corners = numpy.array([[x, y, z, 1.0] for x in extent[:, 0] for y in extent[:, 1] for z in extent[:, 2]])
+        randomState = numpy.random.RandomState(0)
+        matrices = numpy.tile(numpy.eye(4), (10, 1, 1))
+        matrices[:, :3, :3] = randomState.normal(size=(10, 3, 3))
+        matrices[:, 3, :3] = randomState.normal(scale=100.0, size=(10, 3))
+
+        extentMins, extentMaxs = transformExtent(extent, matrices.reshape(-1, 16))
+        for index in range(10):
+            transformedCorners = corners.dot(matrices[index])[:, :3]
+            self.assertTrue(numpy.allclose(extentMins[index], transformedCorners.min(axis=0)))
+            self.assertTrue(numpy.allclose(extentMaxs[index], transformedCorners.max(axis=0)))
+
+
+if __name__ == '__main__':
+    unittest.main()